@@ -0,0 +1,240 @@
+"""The benchmark cases of the hot paths of cron_converter.
+
+Every case is a function decorated with @case, receiving no arguments and returning the function to time.
+The setup (parsing the fixtures, building the inputs) is done once, outside the timed function.
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from dateutil import tz
+
+from cron_converter import Cron, CronIndex, LoadAnalyzer, ScheduleStore, Timeline, bulk
+from cron_converter.crontab import parse_crontab
+
+sys.path.append(os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'integration'))
+
+from fixtures.valid_crons import valid_crons_string  # noqa: E402
+from fixtures.valid_schedule_date import valid_schedules  # noqa: E402
+
+Case = Callable[[], Callable[[], object]]
+cases: Dict[str, Case] = {}
+
+START = datetime(2024, 3, 19, 9, 7, 30)
+DENSE = ['* * * * *', '*/5 * * * *', '*/15 9-17 * * 1-5']
+SPARSE = ['0 0 29 2 *', '0 0 31 * 5', '30 4 29 2 1', '0 12 13 * 5']
+MIXED = DENSE + SPARSE + ['0 0 1 * *', '5,35 */2 * * *', '0 12 * JAN-JUN MON', '10-20 3 15 * *']
+
+
+def case(func: Case) -> Case:
+    cases[func.__name__] = func
+    return func
+
+
+def _fixture_strings() -> List[str]:
+    return [fixture['in'] for fixture in valid_crons_string]
+
+
+def _many_strings(n: int) -> List[str]:
+    """n different cron strings, built from the mixed schedules changing their minutes."""
+    return [f'{i % 60} ' + MIXED[i % len(MIXED)].split(' ', 1)[1] for i in range(n)]
+
+
+@case
+def parse_fixtures():
+    strings = _fixture_strings()
+    return lambda: [Cron(string) for string in strings]
+
+
+@case
+def parse_cached_fixtures():
+    strings = _fixture_strings()
+    return lambda: [Cron.from_cached(string) for string in strings]
+
+
+@case
+def format_fixtures():
+    crons = [Cron(string) for string in _fixture_strings()]
+    return lambda: [cron.to_string() for cron in crons]
+
+
+@case
+def format_names_fixtures():
+    options = {'output_weekday_names': True, 'output_month_names': True}
+    crons = [Cron(string, options) for string in _fixture_strings()]
+    return lambda: [cron.to_string() for cron in crons]
+
+
+@case
+def format_many_10k():
+    crons = [Cron(string) for string in _many_strings(1000)] * 10
+    return lambda: bulk.format_many(crons)
+
+
+@case
+def validate_fixtures():
+    crons = [Cron(string) for string in _fixture_strings()]
+    return lambda: [cron.validate(START) for cron in crons]
+
+
+@case
+def validate_compiled_fixtures():
+    compiled = [Cron(string).compile() for string in _fixture_strings()]
+    return lambda: [matches(START) for matches in compiled]
+
+
+@case
+def validate_many_100k():
+    cron = Cron('*/15 9-17 * * 1-5')
+    timestamps = list(range(1710838800, 1710838800 + 100_000 * 60, 60))
+    return lambda: cron.validate_many(timestamps)
+
+
+def _seek(cron_strings: List[str], reverse: bool) -> Callable[[], object]:
+    crons = [Cron(cron_string) for cron_string in cron_strings]
+
+    def seek():
+        for cron in crons:
+            schedule = cron.schedule(START)
+            for _ in range(10):
+                schedule.prev() if reverse else schedule.next()
+    return seek
+
+
+@case
+def next_dense():
+    return _seek(DENSE, reverse=False)
+
+
+@case
+def prev_dense():
+    return _seek(DENSE, reverse=True)
+
+
+@case
+def next_sparse():
+    return _seek(SPARSE, reverse=False)
+
+
+@case
+def prev_sparse():
+    return _seek(SPARSE, reverse=True)
+
+
+@case
+def next_prev_epoch():
+    crons = [Cron(cron_string) for cron_string in DENSE + SPARSE]
+    timestamp = int(START.replace(tzinfo=tz.UTC).timestamp())
+    return lambda: [(cron.next_epoch(timestamp), cron.prev_epoch(timestamp)) for cron in crons]
+
+
+@case
+def next_fixtures():
+    schedules = [(Cron(fixture['schedule']), datetime.fromisoformat(fixture['now'])) for fixture in valid_schedules]
+    return lambda: [cron.schedule(now).next() for cron, now in schedules]
+
+
+@case
+def schedule_timezone_str():
+    cron = Cron('0 9 * * 1-5')
+    names = ['Europe/Rome', 'America/New_York', 'Asia/Tokyo', 'Australia/Sydney']
+    return lambda: [cron.schedule(timezone_str=name) for name in names]
+
+
+@case
+def take_aware_epoch_1000():
+    cron = Cron('5,35 */2 * * *')
+    start = START.replace(tzinfo=tz.gettz('America/New_York'))
+    return lambda: cron.schedule(start).take(1000, as_epoch=True)
+
+
+@case
+def take_dst_policies_1000():
+    cron = Cron('5,35 */2 * * *')
+    start = START.replace(tzinfo=tz.gettz('America/New_York'))
+    return lambda: cron.schedule(start, on_skipped='shift', on_repeated='both').take(1000)
+
+
+@case
+def take_1000():
+    cron = Cron('5,35 */2 * * *')
+    return lambda: cron.schedule(START).take(1000)
+
+
+@case
+def between_month():
+    crons = [Cron(cron_string) for cron_string in MIXED]
+    return lambda: [cron.schedule(START).between(START, START + timedelta(days=31)) for cron in crons]
+
+
+@case
+def count_between_year_1k():
+    crons = [Cron(string) for string in _many_strings(1000)]
+    end = START + timedelta(days=365)
+    return lambda: [cron.count_between(START, end) for cron in crons]
+
+
+@case
+def intervals_1k():
+    crons = [Cron(string) for string in _many_strings(1000)]
+    return lambda: [(cron.min_interval(), cron.max_interval()) for cron in crons]
+
+
+@case
+def index_build_10k():
+    crons = [Cron(string) for string in _many_strings(10_000)]
+    return lambda: CronIndex(crons)
+
+
+@case
+def index_match_100k():
+    index = CronIndex(_many_strings(100_000))
+    times = [START + timedelta(minutes=minute) for minute in range(0, 1440, 97)]
+    return lambda: [index.match(time) for time in times]
+
+
+@case
+def store_match_100k():
+    directory = tempfile.TemporaryDirectory()  # Referenced by the closure, removed with it
+    store = ScheduleStore.create(os.path.join(directory.name, 'schedules.bin'), _many_strings(100_000))
+    times = [START + timedelta(minutes=minute) for minute in range(0, 1440, 97)]
+    return lambda: directory and [store.match(time) for time in times]
+
+
+@case
+def load_peaks_100k():
+    analyzer = LoadAnalyzer(_many_strings(100_000))
+    end = START + timedelta(days=7)
+    return lambda: analyzer.peaks(START, end)
+
+
+@case
+def timeline_take_10k():
+    strings = _many_strings(1000)
+
+    def take():
+        timeline = Timeline(START)
+        for string in strings:
+            timeline.add(string)
+        return timeline.take(10_000)
+    return take
+
+
+@case
+def crontab_10k():
+    lines = [f'{string} /usr/bin/job --id {i}' for i, string in enumerate(_many_strings(10_000))]
+    return lambda: list(parse_crontab(lines))
+
+
+@case
+def parse_many_20k_all_cpus():
+    strings = _many_strings(20_000)
+    return lambda: bulk.parse_many(strings, workers=os.cpu_count())
+
+
+@case
+def unpack_many_10k():
+    data = bulk.pack_many(Cron(string) for string in _many_strings(10_000))
+    return lambda: bulk.unpack_many(data)
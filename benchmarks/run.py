@@ -0,0 +1,83 @@
+"""Runs the benchmark cases and compares them with a baseline.
+
+Usage:
+    python benchmarks/run.py [-k FILTER] [--repeat N] [--save results.json]
+                             [--compare baseline.json] [--threshold 0.2]
+
+Every case is timed with timeit: the number of loops is chosen to run for at least 0.2 seconds,
+and the best of '--repeat' runs is kept, as seconds per call.
+With '--compare', the exit code is 1 when a case is slower than the baseline by more than '--threshold'.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from cases import cases  # noqa: E402
+
+
+def run(names: List[str], repeat: int) -> Dict[str, float]:
+    results = {}
+    for name in names:
+        timer = timeit.Timer(cases[name]())
+        number, _ = timer.autorange()
+        results[name] = min(timer.repeat(repeat=repeat, number=number)) / number
+        print(f'{name:<28} {_format_time(results[name]):>12}', flush=True)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Prints the ratio of every result to its baseline and returns the names of the regressed cases."""
+    regressions = []
+    print(f'\n{"case":<28} {"baseline":>12} {"current":>12} {"ratio":>8}')
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        ratio = seconds / baseline[name]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<28} {_format_time(baseline[name]):>12} {_format_time(seconds):>12} {ratio:>7.2f}x'
+              f'{"  REGRESSION" if regressed else ""}')
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks the hot paths of cron_converter.')
+    parser.add_argument('-k', dest='filter', default='', help='Run only the cases containing this string')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per case, the best one is kept')
+    parser.add_argument('--save', help='Save the results to this JSON file')
+    parser.add_argument('--compare', help='Compare the results with this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Max allowed slowdown over the baseline, as a fraction (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    names = [name for name in cases if args.filter in name]
+    results = run(names, args.repeat)
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'python': platform.python_version(), 'results': results}, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s) over {args.threshold:.0%}: {", ".join(regressions)}')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
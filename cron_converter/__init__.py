@@ -1,3 +1,8 @@
+from .analysis import LoadAnalyzer
 from .cron import Cron
+from .index import CronIndex
+from .store import ScheduleStore
+from .sub_modules.part import CronParseError
+from .timeline import Timeline
 
-__all__ = ["Cron"]
+__all__ = ["Cron", "CronIndex", "CronParseError", "LoadAnalyzer", "ScheduleStore", "Timeline"]
@@ -0,0 +1,245 @@
+"""asyncio scheduler of cron jobs.
+
+AsyncScheduler runs coroutine callbacks at the times of their schedules with a single loop task:
+the next time of every job is kept in a heap and the loop sleeps until the earliest one, so thousands of jobs
+cost a heap entry each, not a task each. A task is created only for every run of a callback.
+
+The loop never sleeps longer than 'max_sleep' seconds without reading the clock again, so jumps of the wall clock
+(NTP corrections, a suspended machine) are noticed. Runs found late by more than 'grace' seconds are misfires:
+    'skip': the missed runs are dropped and the job resumes at its first time after the current time.
+    'catch_up': every missed run is started, in order.
+A job runs at most 'max_instances' times at once. The runs due meanwhile wait for a free slot with 'catch_up',
+or are dropped with 'skip'.
+"""
+import asyncio
+import heapq
+from collections import deque
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .cron import Cron
+from .sub_modules.seeker import Seeker
+from .timezones import get_timezone
+
+Misfire = Literal['skip', 'catch_up']
+Callback = Callable[[datetime], Awaitable[Any]]
+
+
+def _check_misfire(misfire: str) -> None:
+    if misfire not in ('skip', 'catch_up'):
+        raise ValueError(f'Invalid misfire policy {misfire!r}')
+
+
+class Job:
+    """A cron schedule registered in an AsyncScheduler.
+
+    Attributes:
+        job_id: The id of the job.
+        cron (Cron): The schedule.
+        next_time (datetime): The time of the next run, None once the job is removed.
+        running (int): The number of runs in progress.
+        dropped (int): The number of runs dropped by the misfire and concurrency limits.
+    """
+    __slots__ = ('job_id', 'cron', 'callback', 'timezone_str', 'max_instances', 'misfire', 'next_time', 'running',
+                 'dropped', '_seeker', '_waiting')
+
+    def __init__(self, job_id: Hashable, cron: Cron, callback: Callback, timezone_str: Optional[str],
+                 max_instances: int, misfire: Misfire) -> None:
+        self.job_id = job_id
+        self.cron = cron
+        self.callback = callback
+        self.timezone_str = timezone_str
+        self.max_instances = max_instances
+        self.misfire = misfire
+        self.next_time: Optional[datetime] = None
+        self.running = 0
+        self.dropped = 0
+        self._seeker: Optional[Seeker] = None
+        self._waiting: Deque[datetime] = deque()
+
+    def __repr__(self) -> str:
+        return f'Job({self.job_id!r}, {self.cron.to_string()!r}, next_time={self.next_time!r})'
+
+    def _start_from(self, now: datetime) -> datetime:
+        """Positions the job at its first time from now, included, and returns it."""
+        if self.timezone_str is not None:
+            now = now.astimezone(get_timezone(self.timezone_str))
+        self._seeker = Seeker(self.cron, now)
+        return self._advance()
+
+    def _advance(self) -> datetime:
+        assert self._seeker is not None
+        self.next_time = self._seeker.next()
+        return self.next_time
+
+
+class AsyncScheduler:
+    """Creates an instance of AsyncScheduler.
+
+    Args:
+        clock (callable): Optional. Returns the current time, datetime.now by default. Naive times are local times.
+        sleep (callable): Optional. The coroutine function sleeping for an amount of seconds, asyncio.sleep by default.
+        grace (float): Optional. How many seconds a run can be late before it is a misfire. Default 1.
+        max_sleep (float): Optional. The longest sleep before reading the clock again, in seconds. Default 60.
+    """
+    def __init__(self, clock: Callable[[], datetime] = datetime.now,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep, grace: float = 1.0,
+                 max_sleep: float = 60.0) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self.grace = grace
+        self.max_sleep = max_sleep
+        self._jobs: Dict[Hashable, Job] = {}
+        self._heap: List[Tuple[float, int, Job]] = []
+        self._counter = 0
+        self._next_id = 0
+        self._tasks: Set['asyncio.Task[Any]'] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def __len__(self) -> int:
+        """The number of jobs."""
+        return len(self._jobs)
+
+    def __contains__(self, job_id: Hashable) -> bool:
+        return job_id in self._jobs
+
+    def __getitem__(self, job_id: Hashable) -> Job:
+        return self._jobs[job_id]
+
+    def add(self, cron: Union[Cron, str], callback: Callback, job_id: Optional[Hashable] = None,
+            timezone_str: Optional[str] = None, max_instances: int = 1, misfire: Misfire = 'skip') -> Job:
+        """Registers a job, starting from the current time of the clock.
+
+        :param cron: The Cron object or cron string.
+        :param callback: The coroutine function to call, with the scheduled time of the run.
+        :param job_id: Optional. The id of the job, an increasing integer by default.
+        :param timezone_str: Optional. The timezone of the schedule, else the timezone of the clock.
+        :param max_instances: Optional. How many runs of the job can be in progress at once. Default 1.
+        :param misfire: Optional. What to do with the runs missed: 'skip' (default) or 'catch_up'.
+        :return: The Job object.
+        :raises ValueError: Duplicate job id, or invalid max_instances or misfire policy.
+        """
+        _check_misfire(misfire)
+        if max_instances < 1:
+            raise ValueError('max_instances must be at least 1')
+        if job_id is None:
+            job_id = self._next_id
+            self._next_id += 1
+        if job_id in self._jobs:
+            raise ValueError(f'Duplicate job id {job_id!r}')
+        if isinstance(cron, str):
+            cron = Cron.from_cached(cron)
+        job = Job(job_id, cron, callback, timezone_str, max_instances, misfire)
+        self._push(job, job._start_from(self._clock()))
+        self._jobs[job_id] = job
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def remove(self, job_id: Hashable) -> None:
+        """Removes a job. Its runs in progress are not cancelled.
+
+        :raises KeyError: No job with that id.
+        """
+        job = self._jobs.pop(job_id)
+        job.next_time = None
+        job._waiting.clear()
+
+    async def run(self) -> None:
+        """Runs the jobs until stop() is called, then waits for the runs in progress.
+        If the task running this coroutine is cancelled, the runs in progress are cancelled too.
+        """
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        try:
+            while not self._stopping:
+                now = self._clock()
+                self._run_due(now)
+                delay = self.max_sleep
+                if self._heap:
+                    delay = min(max(self._heap[0][0] - now.timestamp(), 0), delay)
+                await self._wait(delay)
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in self._tasks:
+                task.cancel()
+            raise
+        finally:
+            self._wakeup = None
+
+    def stop(self) -> None:
+        """Makes run() return, after the runs in progress are done."""
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _wait(self, delay: float) -> None:
+        """Sleeps for an amount of seconds, or until a job is added or the scheduler is stopped."""
+        assert self._wakeup is not None
+        self._wakeup.clear()
+        sleep = asyncio.ensure_future(self._sleep(delay))
+        wakeup = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait({sleep, wakeup}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleep.cancel()
+            wakeup.cancel()
+
+    def _push(self, job: Job, time: datetime) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (time.timestamp(), self._counter, job))
+
+    def _run_due(self, now: datetime) -> None:
+        """Starts the runs due at the time passed, applying the misfire policies."""
+        now_seconds = now.timestamp()
+        while self._heap and self._heap[0][0] <= now_seconds:
+            seconds, _, job = heapq.heappop(self._heap)
+            if job.next_time is None:
+                continue  # Removed job
+            if now_seconds - seconds > self.grace and job.misfire == 'skip':
+                job.dropped += 1
+                # The next times may be late too: jump to the first time from now instead of walking through them
+                self._push(job, job._start_from(now))
+                continue
+            self._submit(job, job.next_time)
+            self._push(job, job._advance())
+
+    def _submit(self, job: Job, time: datetime) -> None:
+        if job.running < job.max_instances:
+            self._start(job, time)
+        elif job.misfire == 'catch_up':
+            job._waiting.append(time)
+        else:
+            job.dropped += 1
+
+    def _start(self, job: Job, time: datetime) -> None:
+        job.running += 1
+        task = asyncio.ensure_future(job.callback(time))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._done(job, done))
+
+    def _done(self, job: Job, task: 'asyncio.Task[Any]') -> None:
+        self._tasks.discard(task)
+        job.running -= 1
+        if job._waiting and not self._stopping:
+            self._start(job, job._waiting.popleft())
+        if not task.cancelled() and task.exception() is not None:
+            task.get_loop().call_exception_handler({
+                'message': f'Exception in the callback of the cron job {job.job_id!r}',
+                'exception': task.exception(),
+                'task': task,
+            })
@@ -0,0 +1,202 @@
+"""Load analysis of many cron schedules: how many schedules run at every minute of a window.
+
+A schedule runs at the same times on every day it matches, so the schedules are grouped by their day fields
+(day, month and weekday), identical schedules being counted once with their number as weight.
+Every group has a histogram of a matching day, 1440 counts built from the hour and minute bitmasks of its
+schedules, and the histogram of a window is the sum, for every day, of the histograms of the groups matching it:
+with NumPy, a single product of the (days x groups) matching matrix by the (groups x 1440) histograms matrix.
+No execution time is searched, and the cost grows with the number of different schedules, not of schedules.
+
+Like the vectorized functions, the times are wall-clock times: the timezone of an aware window is not applied.
+"""
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .cron import Cron
+from .sub_modules.engine import civil_from_days, cron_weekday
+from .sub_modules.frequency import MINUTES_PER_DAY, wall_minute
+from .sub_modules.utils import (
+    ceil_minute,
+    iso_to_cron_weekday,
+    iter_bits,
+    mask_to_values,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+Histogram = Union['np.ndarray', List[int]]
+DayKey = Tuple[int, int, int]  # The day, month and weekday bitmasks
+TimeKey = Tuple[int, int]  # The hour and minute bitmasks
+
+
+class Peak(NamedTuple):
+    """A minute of a window, with the number and the ids of the schedules running at it."""
+    time: datetime
+    load: int
+    cron_ids: List[int]
+
+
+class LoadAnalyzer:
+    """Creates an instance of LoadAnalyzer.
+
+    LoadAnalyzer objects count the schedules running at every minute of a window and find the busiest minutes,
+    with the schedules contributing to them. Ids are the positions of the schedules, in the order they are added.
+
+    Args:
+        crons (iterable): Optional. The Cron objects or cron strings to add.
+    """
+    def __init__(self, crons: Iterable[Union[Cron, str]] = ()) -> None:
+        # The ids of the schedules by day bitmasks, then by hour and minute bitmasks
+        self._groups: Dict[DayKey, Dict[TimeKey, List[int]]] = {}
+        self._count = 0
+        self._day_histograms: Optional[Tuple[List[DayKey], Histogram]] = None  # Computed on demand
+        for cron in crons:
+            self.add(cron)
+
+    def __len__(self) -> int:
+        """The number of schedules."""
+        return self._count
+
+    def add(self, cron: Union[Cron, str]) -> int:
+        """Adds a schedule.
+
+        :param cron: A Cron object or a cron string.
+        :return: The id of the schedule.
+        :raises LookupError: Empty Cron object.
+        :raises ValueError: Invalid cron string.
+        """
+        if isinstance(cron, str):
+            cron = Cron.from_cached(cron)
+        minutes, hours, days, months, weekdays = cron.to_masks()
+        cron_id = self._count
+        times = self._groups.setdefault((days, months, weekdays), {})
+        ids = times.get((hours, minutes))
+        if ids is None:
+            times[hours, minutes] = [cron_id]
+        else:
+            ids.append(cron_id)
+        self._count += 1
+        self._day_histograms = None
+        return cron_id
+
+    def histogram(self, start: datetime, end: datetime) -> Histogram:
+        """Returns how many schedules run at every minute of the window [start, end).
+
+        :param start: The start of the window, included.
+        :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+        :return: The counts of the minutes from the start rounded up to the minute: an int64 NumPy array,
+                 or a list if NumPy is not installed.
+        """
+        if start.tzinfo is not None and end.tzinfo is not None:
+            end = end.astimezone(start.tzinfo)
+        first, last = wall_minute(ceil_minute(start)), wall_minute(ceil_minute(end))
+        if first >= last:
+            return np.zeros(0, dtype=np.int64) if np is not None else []
+        first_day, last_day = first // MINUTES_PER_DAY, (last - 1) // MINUTES_PER_DAY + 1
+        offset = first_day * MINUTES_PER_DAY
+        if np is not None:
+            return self._histogram_numpy(first_day, last_day)[first - offset:last - offset]
+        return self._histogram_python(first_day, last_day)[first - offset:last - offset]
+
+    def peaks(self, start: datetime, end: datetime, k: int = 10) -> List[Peak]:
+        """Returns the k minutes of the window [start, end) with the most schedules running, busiest first,
+        the earliest first among equal counts. Minutes with no schedule running are never returned.
+
+        :param start: The start of the window, included.
+        :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+        :param k: Optional. The number of minutes to return. Default 10.
+        :raises ValueError: Negative k.
+        """
+        if k < 0:
+            raise ValueError(f'Invalid number of peaks {k}')
+        counts = self.histogram(start, end)
+        if np is not None:
+            top = np.argsort(-np.asarray(counts), kind='stable')[:k].tolist()
+        else:
+            top = heapq.nsmallest(k, range(len(counts)), key=lambda minute: (-counts[minute], minute))
+        start = ceil_minute(start)
+        peaks = []
+        for minute in top:
+            if not counts[minute]:
+                break
+            time = start + timedelta(minutes=minute)
+            peaks.append(Peak(time, int(counts[minute]), self.contributors(time)))
+        return peaks
+
+    def contributors(self, time: datetime) -> List[int]:
+        """Returns the ids of the schedules running at a time, like CronIndex.match does.
+
+        :param time: A datetime object.
+        :return: The ascending ids.
+        """
+        weekday = iso_to_cron_weekday(time.isoweekday())
+        found: List[int] = []
+        for (days, months, weekdays), times in self._groups.items():
+            if days >> time.day & months >> time.month & weekdays >> weekday & 1:
+                for (hours, minutes), ids in times.items():
+                    if hours >> time.hour & minutes >> time.minute & 1:
+                        found.extend(ids)
+        return sorted(found)
+
+    def _get_day_histograms(self) -> Tuple[List[DayKey], Histogram]:
+        """Returns the day bitmasks of the groups, with the counts of every minute of a day matched by each group:
+        a (groups x 1440) NumPy array, or a flat list if NumPy is not installed.
+        """
+        if self._day_histograms is None:
+            histograms: Histogram
+            if np is not None:
+                histograms = np.zeros((len(self._groups), MINUTES_PER_DAY))
+                for row, times in enumerate(self._groups.values()):
+                    weights = np.array([len(ids) for ids in times.values()], dtype=np.float64)
+                    hours = _bit_table([hours for hours, _ in times], 24) * weights[:, None]
+                    minutes = _bit_table([minutes for _, minutes in times], 60)
+                    histograms[row] = (hours.T @ minutes).ravel()
+            else:
+                histograms = []
+                for times in self._groups.values():
+                    day = [0] * MINUTES_PER_DAY
+                    for (hours, minutes), ids in times.items():
+                        minute_values = mask_to_values(minutes)
+                        for hour in iter_bits(hours):
+                            for minute in minute_values:
+                                day[hour * 60 + minute] += len(ids)
+                    histograms.extend(day)
+            self._day_histograms = list(self._groups), histograms
+        return self._day_histograms
+
+    def _histogram_numpy(self, first_day: int, last_day: int) -> 'np.ndarray':
+        day_keys, histograms = self._get_day_histograms()
+        if not day_keys:
+            return np.zeros((last_day - first_day) * MINUTES_PER_DAY, dtype=np.int64)
+        dates = np.arange(first_day, last_day).astype('datetime64[D]')
+        months = dates.astype('datetime64[M]')
+        month = months.astype(np.int64) % 12 + 1
+        day = (dates - months).astype(np.int64) + 1
+        weekday = (np.arange(first_day, last_day) + 4) % 7  # 1970-01-01 was a Thursday
+        keys = np.array(day_keys, dtype=np.int64)
+        # The (days x groups) matrix: 1 where the day matches the day bitmasks of the group
+        matching = (keys[:, 0] >> day[:, None]) & (keys[:, 1] >> month[:, None]) & (keys[:, 2] >> weekday[:, None]) & 1
+        return np.rint(matching.astype(np.float64) @ histograms).astype(np.int64).ravel()
+
+    def _histogram_python(self, first_day: int, last_day: int) -> List[int]:
+        day_keys, histograms = self._get_day_histograms()
+        counts = []
+        for days_since_epoch in range(first_day, last_day):
+            year, month, day = civil_from_days(days_since_epoch)
+            weekday = cron_weekday(year, month, day)
+            day_counts = [0] * MINUTES_PER_DAY
+            for row, (days, months, weekdays) in enumerate(day_keys):
+                if days >> day & months >> month & weekdays >> weekday & 1:
+                    start = row * MINUTES_PER_DAY
+                    day_counts = list(map(int.__add__, day_counts, histograms[start:start + MINUTES_PER_DAY]))
+            counts.extend(day_counts)
+        return counts
+
+
+def _bit_table(masks: List[int], size: int) -> 'np.ndarray':
+    """Returns a (masks x size) array of 0 and 1: the bits 0 to size - 1 of every bitmask."""
+    return ((np.array(masks, dtype=np.uint64)[:, None] >> np.arange(size, dtype=np.uint64)) & 1).astype(np.float64)
@@ -0,0 +1,122 @@
+"""Bulk parsing, formatting and expansion of many cron schedules, optionally spread over a pool of processes.
+
+The work is split in chunks sent to a concurrent.futures.ProcessPoolExecutor. The schedules travel
+between the processes packed in 17 bytes each (see Cron.to_bytes), which are cheap to pickle
+and rebuild a Cron object without parsing its string again. Small inputs are processed serially,
+where starting the processes would cost more than the work itself.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import repeat
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, TypeVar
+
+from .cron import Cron
+from .sub_modules.engine import Masks
+from .sub_modules.utils import PACKED_SIZE, pack_masks, unpack_masks
+from .vectorized import FireTimes, fire_times_many
+
+T = TypeVar('T')
+
+MIN_PARALLEL = 5000  # Inputs smaller than this are processed serially
+_CHUNKS_PER_WORKER = 4
+
+
+def parse_many(cron_strings: Iterable[str], options=None, workers: Optional[int] = None) -> List[Cron]:
+    """Parses many cron strings, like Cron(cron_string, options) does for each one.
+
+    :param cron_strings: The cron strings.
+    :param options: (dict) Optional. The options of the Cron objects.
+    :param workers: Optional. The number of processes. None or 1 parses them in this process.
+    :return: The list of the Cron objects, in the same order.
+    :raises ValueError: A cron string is not valid.
+    """
+    cron_strings = list(cron_strings)
+    if workers is None or workers <= 1 or len(cron_strings) < MIN_PARALLEL:
+        return [Cron(cron_string, options) for cron_string in cron_strings]
+    with ProcessPoolExecutor(workers) as executor:
+        packed = executor.map(_parse_chunk, _chunks(cron_strings, workers), repeat(options))
+        return [cron for data in packed for cron in unpack_many(data, options)]
+
+
+def expand_many(crons: Iterable[Cron], start: datetime, end: datetime, workers: Optional[int] = None) \
+        -> List[FireTimes]:
+    """Returns all the times every schedule would run in the window [start, end), like vectorized.fire_times_many.
+
+    :param crons: The Cron objects.
+    :param start: The start of the window, included.
+    :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+    :param workers: Optional. The number of processes. None or 1 expands them in this process.
+    :return: A list with a 'datetime64[m]' NumPy array, or a list of datetime objects if NumPy is not installed,
+             for every Cron object.
+    :raises LookupError: Empty Cron object.
+    """
+    crons = list(crons)
+    if workers is None or workers <= 1 or len(crons) < MIN_PARALLEL:
+        return fire_times_many(crons, start, end)
+    chunks = [pack_many(chunk) for chunk in _chunks(crons, workers)]
+    with ProcessPoolExecutor(workers) as executor:
+        expanded = executor.map(_expand_chunk, chunks, repeat(start), repeat(end))
+        return [times for chunk_times in expanded for times in chunk_times]
+
+
+def format_many(crons: Iterable[Cron]) -> List[str]:
+    """Returns the strings of many schedules, like Cron.to_string does for each one.
+    Schedules equal in every field and formatting option are formatted only once.
+
+    :param crons: The Cron objects.
+    :return: The list of the cron strings, in the same order.
+    :raises LookupError: Empty Cron object.
+    """
+    strings: Dict[Hashable, str] = {}
+    formatted = []
+    for cron in crons:
+        options = cron.options
+        key = (cron.to_masks(), 'output_hashes' in options, bool(options.get('output_weekday_names')),
+               bool(options.get('output_month_names')))
+        string = strings.get(key)
+        if string is None:
+            string = strings[key] = cron.to_string()
+        formatted.append(string)
+    return formatted
+
+
+def pack_many(crons: Iterable[Cron]) -> bytes:
+    """Packs many schedules in a single bytes object, 17 bytes per schedule (see Cron.to_bytes).
+
+    :param crons: The Cron objects.
+    :raises LookupError: Empty Cron object.
+    """
+    return b''.join(pack_masks(cron.to_masks()) for cron in crons)
+
+
+def unpack_many(data: bytes, options=None) -> List[Cron]:
+    """Unpacks the schedules packed by pack_many, without parsing any string.
+
+    :param data: The packed schedules, a bytes-like object.
+    :param options: (dict) Optional. The options of the Cron objects.
+    :return: The list of the Cron objects, in the same order.
+    :raises ValueError: Incorrect length of the data, or empty or out of range bitmask.
+    """
+    view = memoryview(data).cast('B')
+    if len(view) % PACKED_SIZE:
+        raise ValueError(f'Invalid packed schedules of {len(view)} bytes')
+    return [_from_masks(unpack_masks(view[i:i + PACKED_SIZE]), options) for i in range(0, len(view), PACKED_SIZE)]
+
+
+def _chunks(items: Sequence[T], workers: int) -> List[Sequence[T]]:
+    size = -(-len(items) // (workers * _CHUNKS_PER_WORKER))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _from_masks(masks: Masks, options) -> Cron:
+    cron = Cron(None, options)
+    cron.from_masks(masks)
+    return cron
+
+
+def _parse_chunk(cron_strings: Sequence[str], options) -> bytes:
+    return pack_many(Cron(cron_string, options) for cron_string in cron_strings)
+
+
+def _expand_chunk(data: bytes, start: datetime, end: datetime) -> List[FireTimes]:
+    return fire_times_many(unpack_many(data), start, end)
@@ -0,0 +1,113 @@
+"""Compiled matchers of cron schedules.
+
+Cron.compile() generates the source of a function checking a datetime object against one schedule,
+with its values written in as constants: full fields are dropped, intervals become modulo checks,
+contiguous ranges become comparisons and only fields with many scattered values are checked
+on their bitmask. The most selective fields are checked first.
+"""
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Union
+
+from .sub_modules.cache import LRUCache
+from .sub_modules.engine import Masks, find_next
+from .sub_modules.part import Part
+
+if TYPE_CHECKING:
+    from .cron import Cron
+
+# The expression of every field value, in the cron Parts order
+_FIELDS = ('d.minute', 'd.hour', 'd.day', 'd.month', 'd.isoweekday() % 7')
+_DAY_FIELDS = (2, 3, 4)
+_MAX_RANGES = 3  # Fields with more ranges are checked on their bitmask
+
+
+class CompiledCron:
+    """Creates an instance of CompiledCron, a schedule specialized in a generated function.
+
+    Args:
+        cron (Cron): The Cron object to compile.
+    Attributes:
+        source (str): The generated source code of the matches and matches_date functions.
+    """
+    __slots__ = ('cron_string', 'masks', 'source', 'matches', 'matches_date')
+
+    def __init__(self, cron: 'Cron') -> None:
+        self.cron_string = cron.to_string()
+        self.masks: Masks = cron.to_masks()
+        self.source = _generate_source(cron.parts)
+        namespace: dict = {}
+        exec(compile(self.source, f'<cron {self.cron_string}>', 'exec'), namespace)
+        self.matches: Callable[[datetime], bool] = namespace['matches']
+        self.matches_date: Callable[[date], bool] = namespace['matches_date']
+
+    def __repr__(self) -> str:
+        return f'CompiledCron({self.cron_string!r})'
+
+    def __call__(self, date_time_obj: Union[datetime, date]) -> bool:
+        """Returns True if the object passed is within the Cron rule, like Cron.validate does.
+
+        :param date_time_obj: A datetime or date object. A date object is checked by day only.
+        """
+        if isinstance(date_time_obj, datetime):
+            return self.matches(date_time_obj)
+        return self.matches_date(date_time_obj)
+
+    def next_after(self, date_time_obj: datetime) -> datetime:
+        """Returns the first time the schedule would run strictly after the datetime passed.
+        The timezone of an aware datetime is kept, the search is done on its wall-clock fields like Seeker does.
+
+        :param date_time_obj: A datetime object.
+        :return: A new datetime object.
+        """
+        start = date_time_obj.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        found = find_next(self.masks, start.year, start.month, start.day, start.hour, start.minute)
+        if found is None:
+            raise Exception('Unable to find execution time for schedule')
+        return datetime(*found, tzinfo=date_time_obj.tzinfo)
+
+
+def _condition(part: Part, value: str) -> Optional[str]:
+    """Returns the expression checking a value against a Part, None for a full Part."""
+    if part.is_full():
+        return None
+    step = part.get_step()
+    if step and part.is_interval(step):
+        minimum, maximum = part.min(), part.max()
+        condition = f'{value} % {step} == {minimum % step}'
+        if not part.is_full_interval(step):
+            condition = f'{minimum} <= {value} <= {maximum} and {condition}'
+        return condition
+    ranges = part.to_ranges()
+    if len(ranges) > _MAX_RANGES:
+        return f'{part.mask} >> {value} & 1'
+    return ' or '.join(f'{cron_range[0]} <= {value} <= {cron_range[1]}' if isinstance(cron_range, list)
+                       else f'{value} == {cron_range}' for cron_range in ranges)
+
+
+def _function_source(name: str, parts: Sequence[Part], fields: List[int]) -> str:
+    lines = [f'def {name}(d):']
+    # The most selective fields first, to reject the most dates with the fewest checks
+    for field in sorted(fields, key=lambda field: len(parts[field]) / len(parts[field].possible_values())):
+        condition = _condition(parts[field], 'x')
+        if condition is not None:
+            lines.append(f'    x = {_FIELDS[field]}')
+            lines.append(f'    if not ({condition}):')
+            lines.append('        return False')
+    lines.append('    return True')
+    return '\n'.join(lines) + '\n'
+
+
+def _generate_source(parts: Sequence[Part]) -> str:
+    return '\n\n'.join([_function_source('matches', parts, list(range(5))),
+                        _function_source('matches_date', parts, list(_DAY_FIELDS))])
+
+
+cache: LRUCache[CompiledCron] = LRUCache(maxsize=256)
+
+
+def compile_cron(cron: 'Cron') -> CompiledCron:
+    """Returns the CompiledCron of a Cron object, cached by schedule.
+
+    :raises LookupError: Empty Cron object.
+    """
+    return cache.get_or_create(cron.to_masks(), lambda: CompiledCron(cron))
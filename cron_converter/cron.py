@@ -1,11 +1,45 @@
-from datetime import date, datetime
+import re
+from datetime import date, datetime, timedelta
 from functools import total_ordering
-from typing import List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from .sub_modules.part import Part
+from .compiled import CompiledCron, compile_cron
+from .sub_modules.cache import LRUCache
+from .sub_modules.engine import can_match, next_epoch_minute, prev_epoch_minute
+from .sub_modules.frequency import count_minutes, interval_minutes, wall_minute
+from .sub_modules.part import CronParseError, Part
 from .sub_modules.seeker import Seeker
 from .sub_modules.units import units
-from .sub_modules.utils import to_parts
+from .sub_modules.utils import ceil_minute, pack_masks, to_parts, unpack_masks
+from .sub_modules.zones import (
+    OnRepeated,
+    OnSkipped,
+    Zone,
+    check_policies,
+    get_zone,
+    iter_zoned,
+)
+
+if TYPE_CHECKING:
+    from .vectorized import BoolMask
+
+_FIELD = re.compile(r'\S+')
+
+
+def _field_start(cron_string: str, field: int) -> int:
+    """Returns the index of a whitespace separated field in a cron string, its length when the field is missing."""
+    starts = [match.start() for match in _FIELD.finditer(cron_string)]
+    return starts[field] if field < len(starts) else len(cron_string)
 
 
 @total_ordering
@@ -13,13 +47,26 @@ class Cron:
     """Creates an instance of Cron.
 
     Cron objects each represent a cron schedule.
+    A frozen Cron, with its Parts, can not be modified anymore: it is hashable and can be shared between threads.
+
+    Thread safety: the query methods (validate, next_after, prev_before, next_epoch, prev_epoch, compile, ...)
+    never modify the Cron object, so a Cron object can be queried by many threads at once without locks,
+    as long as no thread parses into it meanwhile. Parsing builds the new Parts aside and replaces them at once.
+    A Seeker returned by 'schedule' is an iterator with a state: it must not be shared between threads.
 
     Attributes:
         options (dict): The options to use
+        parse_cache (LRUCache): Class attribute. The cache of the frozen Parts parsed by 'from_cached'.
+                                It can be resized with 'Cron.parse_cache.resize(maxsize)'.
     """
+    __slots__ = ('options', 'parts', '_frozen', '_hash')
+    parse_cache: 'LRUCache[Tuple[Part, ...]]' = LRUCache(maxsize=1024)
+
     def __init__(self, cron_string: Optional[str] = None, options=None):
         self.options = options if bool(options) else dict()
-        self.parts: List[Part] = []
+        self.parts: Sequence[Part] = []
+        self._frozen = False
+        self._hash = 0
         if cron_string:
             self.from_string(cron_string)
 
@@ -33,8 +80,8 @@ class Cron:
         """
         if not isinstance(other, Cron):
             return NotImplemented
-        reordered_parts = self.parts[:3] + [self.parts[4], self.parts[3]]
-        reordered_parts_other = other.parts[:3] + [other.parts[4], other.parts[3]]
+        reordered_parts = [*self.parts[:3], self.parts[4], self.parts[3]]
+        reordered_parts_other = [*other.parts[:3], other.parts[4], other.parts[3]]
         for part, other_part in zip(reversed(reordered_parts), reversed(reordered_parts_other)):
             if part < other_part:
                 return True
@@ -48,24 +95,167 @@ class Cron:
             return NotImplemented
         return all(part == other_part for part, other_part in zip(self.parts, other.parts))
 
+    def __hash__(self) -> int:
+        """Only a frozen Cron object is hashable. The hash is consistent with '__eq__'."""
+        if not self._frozen:
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}' (not frozen)")
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """The slots to pickle and copy, the read-only options of a frozen Cron object as a dict."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['options'] = dict(self.options)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._frozen:
+            self.options = MappingProxyType(self.options)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the Cron object can not be modified anymore."""
+        return self._frozen
+
+    def freeze(self) -> 'Cron':
+        """Makes the Cron object and its Parts immutable and hashable.
+        The options are copied, so later changes to the original dict are ignored.
+
+        :return: The Cron object itself.
+        :raises LookupError: Empty Cron object.
+        """
+        if not self.parts:
+            raise LookupError('No schedule found')
+        if not self._frozen:
+            self.options = MappingProxyType(dict(self.options))
+            self.parts = tuple(part.freeze() for part in self.parts)
+            self._hash = hash(self.parts)
+            self._frozen = True
+        return self
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise AttributeError('Frozen Cron can not be modified')
+
     def __contains__(self, item: Union[datetime, date]) -> bool:
         return self.validate(item)
 
+    def __and__(self, other: 'Cron') -> 'Cron':
+        """Returns a new Cron object matching the times matched by both schedules.
+        Every Part is the intersection of the Parts of both schedules.
+
+        :raises ValueError: The schedules have no value in common in some field (see 'overlaps').
+        :raises LookupError: Empty Cron object.
+        """
+        if not isinstance(other, Cron):
+            return NotImplemented
+        masks = tuple(mask & other_mask for mask, other_mask in zip(self.to_masks(), other.to_masks()))
+        if not all(masks):
+            raise ValueError('The schedules have no time in common')
+        return self._with_masks(masks)
+
+    def __or__(self, other: 'Cron') -> 'Cron':
+        """Returns a new Cron object matching the times matched by either schedule.
+        The union is a cron schedule only when the schedules differ in one field at most.
+
+        :raises ValueError: The schedules differ in more than one field.
+        :raises LookupError: Empty Cron object.
+        """
+        if not isinstance(other, Cron):
+            return NotImplemented
+        masks, other_masks = self.to_masks(), other.to_masks()
+        if sum(mask != other_mask for mask, other_mask in zip(masks, other_masks)) > 1:
+            raise ValueError('The union of schedules differing in more than one field is not a cron schedule')
+        return self._with_masks(tuple(mask | other_mask for mask, other_mask in zip(masks, other_masks)))
+
+    def __sub__(self, other: 'Cron') -> 'Cron':
+        """Returns a new Cron object matching the times matched by this schedule and not by the other one.
+        The difference is a cron schedule only when this schedule has values missing from the other one
+        in one field at most, or when the schedules have no value in common in some field.
+
+        :raises ValueError: The difference is empty, or it is not a cron schedule.
+        :raises LookupError: Empty Cron object.
+        """
+        if not isinstance(other, Cron):
+            return NotImplemented
+        masks, other_masks = self.to_masks(), other.to_masks()
+        if not all(mask & other_mask for mask, other_mask in zip(masks, other_masks)):
+            return self._with_masks(masks)  # Nothing in common, nothing to remove
+        extra = [field for field, (mask, other_mask) in enumerate(zip(masks, other_masks)) if mask & ~other_mask]
+        if not extra:
+            raise ValueError('The difference of the schedules is empty')
+        if len(extra) > 1:
+            raise ValueError('The difference of schedules exceeding each other in more than one field '
+                             'is not a cron schedule')
+        difference = list(masks)
+        difference[extra[0]] &= ~other_masks[extra[0]]
+        return self._with_masks(difference)
+
+    def issubset(self, other: 'Cron') -> bool:
+        """Returns True if every Part of this schedule is a subset of the Part of the other schedule,
+        so that every time matched by this schedule is matched by the other one.
+
+        :raises LookupError: Empty Cron object.
+        """
+        return all(mask & ~other_mask == 0 for mask, other_mask in zip(self.to_masks(), other.to_masks()))
+
+    def overlaps(self, other: 'Cron') -> bool:
+        """Returns True if both schedules match some time, looking at their bitmasks only:
+        no execution time is searched.
+
+        :raises LookupError: Empty Cron object.
+        """
+        return can_match(tuple(mask & other_mask for mask, other_mask in zip(self.to_masks(), other.to_masks())))
+
+    def _with_masks(self, masks: Sequence[int]) -> 'Cron':
+        cron = self.__class__(None, self.options)
+        cron.from_masks(masks)
+        return cron
+
     def from_string(self, cron_string: str) -> None:
         """Parses a cron string (minutes - hours - days - months - weekday)
 
         :param cron_string: (str) The cron string to parse. It has to be made up 5 parts.
-        :raises ValueError: Incorrect length of the cron string.
+        :raises CronParseError: Incorrect length of the cron string, or invalid value, with its position in the string.
+        :raises AttributeError: The Cron object is frozen.
         """
+        self._check_not_frozen()
         if type(cron_string) is not str:
             raise TypeError('Invalid cron string')
-        raw_cron_parts = cron_string.strip().split()
+        raw_cron_parts = cron_string.split()
         if len(raw_cron_parts) != 5:
-            raise ValueError("Invalid cron string format")
-        for item, unit in zip(raw_cron_parts, units):
+            raise CronParseError("Invalid cron string format", cron_string, _field_start(cron_string, 5))
+        parts = []
+        for field, (item, unit) in enumerate(zip(raw_cron_parts, units)):
             part = Part(unit, self.options)
-            part.from_string(item)
-            self.parts.append(part)
+            try:
+                part.from_string(item)
+            except CronParseError as error:
+                raise error._within(cron_string, _field_start(cron_string, field))
+            parts.append(part)
+        self.parts = parts
+
+    @classmethod
+    def from_cached(cls, cron_string: str, options=None) -> 'Cron':
+        """Creates a Cron object from a cron string, reusing the Parts already parsed for the same string and options.
+        The Parts are frozen and shared by all the Cron objects created from the same cron string and options.
+
+        :param cron_string: (str) The cron string to parse. It has to be made up 5 parts.
+        :param options: (dict) Optional. The options to use.
+        :raises ValueError: Incorrect length of the cron string.
+        """
+        if type(cron_string) is not str:
+            raise TypeError('Invalid cron string')
+        cron = cls(None, options)
+        key = (tuple(cron_string.split()), tuple(sorted(cron.options.items())))
+
+        def parse() -> Tuple[Part, ...]:
+            cron.from_string(cron_string)
+            return tuple(part.freeze() for part in cron.parts)
+
+        cron.parts = list(cls.parse_cache.get_or_create(key, parse))
+        return cron
 
     def to_string(self) -> str:
         """Return the cron schedule as a string.
@@ -74,21 +264,70 @@ class Cron:
         """
         if not self.parts:
             raise LookupError('No schedule found')
-        return ' '.join(str(part) for part in self.parts)
+        return ' '.join([part.to_string() for part in self.parts])
 
     def from_list(self, cron_list: List[List[Union[str, int]]]):
         """Parses a 2-dimensional array of integers as a cron schedule.
 
         :param cron_list: (list of list) The 2-dimensional list to parse.
         :raises ValueError: Incorrect length of the cron list.
+        :raises AttributeError: The Cron object is frozen.
         """
+        self._check_not_frozen()
         if len(cron_list) != 5:
             raise ValueError('Invalid cron list')
 
+        parts = []
         for cron_part_list, unit in zip(cron_list, units):
             part = Part(unit, self.options)
             part.from_list(cron_part_list)
-            self.parts.append(part)
+            parts.append(part)
+        self.parts = parts
+
+    def from_masks(self, cron_masks: Sequence[int]) -> None:
+        """Parses the five integer bitmasks of the cron Parts (see Part.mask) as a cron schedule.
+
+        :param cron_masks: The bitmasks of minutes, hours, days, months and weekdays.
+        :raises ValueError: Incorrect length of the bitmasks, or empty or out of range bitmask.
+        :raises AttributeError: The Cron object is frozen.
+        """
+        self._check_not_frozen()
+        if len(cron_masks) != 5:
+            raise ValueError('Invalid cron masks')
+
+        parts = []
+        for cron_part_mask, unit in zip(cron_masks, units):
+            part = Part(unit, self.options)
+            part.from_mask(cron_part_mask)
+            parts.append(part)
+        self.parts = parts
+
+    def to_masks(self) -> Tuple[int, int, int, int, int]:
+        """Returns the cron schedule as the five integer bitmasks of its Parts (see Part.mask).
+
+        :return: The bitmasks of minutes, hours, days, months and weekdays.
+        :raises LookupError: Empty Cron object.
+        """
+        if not self.parts:
+            raise LookupError('No schedule found')
+        minute, hour, day, month, weekday = self.parts
+        return minute.mask, hour.mask, day.mask, month.mask, weekday.mask
+
+    def from_bytes(self, data: bytes) -> None:
+        """Parses the 17 bytes written by to_bytes as a cron schedule, without parsing any string.
+
+        :param data: The packed bitmasks.
+        :raises ValueError: Incorrect length of the data, or empty or out of range bitmask.
+        :raises AttributeError: The Cron object is frozen.
+        """
+        self.from_masks(unpack_masks(data))
+
+    def to_bytes(self) -> bytes:
+        """Returns the cron schedule as its five bitmasks packed in 17 bytes (60 + 24 + 31 + 12 + 7 bits).
+
+        :raises LookupError: Empty Cron object.
+        """
+        return pack_masks(self.to_masks())
 
     def to_list(self) -> List[List[int]]:
         """Returns the cron schedule as a 2-dimensional list of integers
@@ -103,7 +342,8 @@ class Cron:
             schedule_list.append(part.to_list())
         return schedule_list
 
-    def schedule(self, start_date: Optional[datetime] = None, timezone_str: Optional[str] = None) -> Seeker:
+    def schedule(self, start_date: Optional[datetime] = None, timezone_str: Optional[str] = None,
+                 on_skipped: OnSkipped = 'keep', on_repeated: OnRepeated = 'first') -> Seeker:
         """Returns the time the schedule would run next.
 
         :param start_date: Optional. A datetime object. If not provided, date will be now in UTC.
@@ -111,9 +351,135 @@ class Cron:
         :param timezone_str: Optional. A timezone str('Europe/Rome', 'America/New_York', ...).
                                        Date will be now, but localized.
                                        If not provided, date will be now in UTC. This param exclude 'start_date'.
+        :param on_skipped: Optional. The policy of the times skipped by a DST transition: 'keep', 'skip' or 'shift'.
+        :param on_repeated: Optional. The policy of the times repeated by a DST transition: 'first', 'last' or 'both'.
         :return: A schedule iterator.
         """
-        return Seeker(self, start_date, timezone_str)
+        return Seeker(self, start_date, timezone_str, on_skipped=on_skipped, on_repeated=on_repeated)
+
+    def next_after(self, date_time_obj: datetime, on_skipped: OnSkipped = 'keep',
+                   on_repeated: OnRepeated = 'first') -> datetime:
+        """Returns the first time the schedule would run strictly after the datetime passed.
+        Unlike a Seeker, it keeps no state: it can be called by many threads at once.
+
+        :param date_time_obj: A datetime object, with or without timezone. The timezone is kept in the result.
+        :param on_skipped: Optional. The policy of the times skipped by a DST transition: 'keep', 'skip' or 'shift'.
+        :param on_repeated: Optional. The policy of the times repeated by a DST transition: 'first', 'last' or 'both'.
+        :return: A new datetime object.
+        :raises LookupError: Empty Cron object.
+        """
+        if date_time_obj.tzinfo is not None:
+            return self._find_zoned(date_time_obj, get_zone(date_time_obj.tzinfo), False, on_skipped, on_repeated)
+        start = date_time_obj.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        return Seeker(self, start, on_skipped=on_skipped, on_repeated=on_repeated).next()
+
+    def prev_before(self, date_time_obj: datetime, on_skipped: OnSkipped = 'keep',
+                    on_repeated: OnRepeated = 'first') -> datetime:
+        """Returns the last time the schedule would have run strictly before the datetime passed.
+        Unlike a Seeker, it keeps no state: it can be called by many threads at once.
+
+        :param date_time_obj: A datetime object, with or without timezone. The timezone is kept in the result.
+        :param on_skipped: Optional. The policy of the times skipped by a DST transition: 'keep', 'skip' or 'shift'.
+        :param on_repeated: Optional. The policy of the times repeated by a DST transition: 'first', 'last' or 'both'.
+        :return: A new datetime object.
+        :raises LookupError: Empty Cron object.
+        """
+        if date_time_obj.tzinfo is not None:
+            return self._find_zoned(date_time_obj, get_zone(date_time_obj.tzinfo), True, on_skipped, on_repeated)
+        return Seeker(self, date_time_obj, on_skipped=on_skipped, on_repeated=on_repeated).prev()
+
+    def _find_zoned(self, date_time_obj: datetime, zone: Zone, reverse: bool, on_skipped: OnSkipped,
+                    on_repeated: OnRepeated) -> datetime:
+        """Returns the first time of the schedule strictly after (or before, if reverse) an aware datetime.
+        The times are compared in UTC, so that the bound is strict also in a time repeated by a DST transition,
+        and only the second occurrence of a repeated time has fold=1.
+        """
+        check_policies(on_skipped, on_repeated)
+        floor = int(date_time_obj.replace(second=0, microsecond=0).timestamp())
+        # The first minute included, or excluded if reverse
+        epoch = floor if reverse and not (date_time_obj.second or date_time_obj.microsecond) else floor + 60
+        zoned_time = next(iter_zoned(self.to_masks(), zone, (epoch, ()), reverse, on_skipped, on_repeated), None)
+        if zoned_time is None:
+            raise Exception('Unable to find execution time for schedule')
+        return zone.to_datetime(zoned_time)
+
+    def next_epoch(self, timestamp: Union[int, float], minutes: bool = False) -> int:
+        """Returns the time the schedule would run next, from a UTC epoch timestamp included,
+        like Seeker.next() does from a UTC datetime, without creating datetime objects.
+
+        :param timestamp: The seconds since 1970-01-01T00:00 UTC, rounded up to the minute,
+                          or the minutes if 'minutes' is True.
+        :param minutes: Whether the timestamp and the result are minutes instead of seconds since the epoch.
+        :return: The epoch seconds (or minutes) of the time the schedule would run next.
+        :raises LookupError: Empty Cron object.
+        """
+        minute = int(timestamp) if minutes else -int(-timestamp // 60)
+        found = next_epoch_minute(self.to_masks(), minute)
+        if found is None:
+            raise Exception('Unable to find execution time for schedule')
+        return found if minutes else found * 60
+
+    def prev_epoch(self, timestamp: Union[int, float], minutes: bool = False) -> int:
+        """Returns the time the schedule would have last run at, before a UTC epoch timestamp,
+        like Seeker.prev() does from a UTC datetime, without creating datetime objects.
+
+        :param timestamp: The seconds since 1970-01-01T00:00 UTC, rounded up to the minute,
+                          or the minutes if 'minutes' is True.
+        :param minutes: Whether the timestamp and the result are minutes instead of seconds since the epoch.
+        :return: The epoch seconds (or minutes) of the time the schedule would have last run at.
+        :raises LookupError: Empty Cron object.
+        """
+        minute = int(timestamp) if minutes else -int(-timestamp // 60)
+        found = prev_epoch_minute(self.to_masks(), minute - 1)
+        if found is None:
+            raise Exception('Unable to find execution time for schedule')
+        return found if minutes else found * 60
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """Returns how many times the schedule would run in the window [start, end), like the length of
+        vectorized.fire_times, counting the matching days and the times of a day instead of listing them.
+        Times are wall-clock times: the timezone of an aware window is not applied.
+
+        :param start: The start of the window, included.
+        :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+        :return: The number of execution times in the window.
+        :raises LookupError: Empty Cron object.
+        """
+        masks = self.to_masks()
+        if start.tzinfo is not None and end.tzinfo is not None:
+            end = end.astimezone(start.tzinfo)
+        return count_minutes(masks, wall_minute(ceil_minute(start)), wall_minute(ceil_minute(end)))
+
+    def min_interval(self) -> timedelta:
+        """Returns the shortest time between two consecutive executions of the schedule, in wall-clock time.
+        Example -> '0 9,17 * * 1-5': 8 hours
+
+        :raises LookupError: Empty Cron object.
+        """
+        return timedelta(minutes=self._intervals()[0])
+
+    def max_interval(self) -> timedelta:
+        """Returns the longest time between two consecutive executions of the schedule, in wall-clock time.
+        Example -> '0 9,17 * * 1-5': 64 hours, from Friday 17:00 to Monday 09:00
+
+        :raises LookupError: Empty Cron object.
+        """
+        return timedelta(minutes=self._intervals()[1])
+
+    def _intervals(self) -> Tuple[int, int]:
+        intervals = interval_minutes(self.to_masks())
+        if intervals is None:
+            raise Exception('Unable to find execution time for schedule')
+        return intervals
+
+    def compile(self) -> CompiledCron:
+        """Returns a CompiledCron, the schedule specialized in a generated function.
+        Compiled schedules are cached, the same schedule is compiled only once.
+
+        :return: A callable checking datetime and date objects like validate does, with a 'next_after' method.
+        :raises LookupError: Empty Cron object.
+        """
+        return compile_cron(self)
 
     def validate(self, date_time_obj: Union[datetime, date]) -> bool:
         """Returns True if the object passed is within the Cron rule.
@@ -126,8 +492,21 @@ class Cron:
         valid = []
         for cron_part, d_par in zip(self.parts, to_parts(date_time_obj)):
             if d_par is not None:
-                valid.append(d_par in cron_part.to_list())
+                valid.append(cron_part.has(d_par))
             else:
                 valid.append(True)
 
         return all(valid)
+
+    def validate_many(self, timestamps: Sequence[Union[datetime, date, int]]) -> 'BoolMask':
+        """Returns which objects passed are within the Cron rule, checking all of them at once.
+        It uses NumPy when it is installed (see the 'vectorized' module).
+
+        :param timestamps: A sequence of datetime objects, date objects or UTC epoch seconds,
+                           or a NumPy array of datetime64 values or of epoch seconds.
+
+        :return: A boolean NumPy array, or a list of booleans if NumPy is not installed.
+        """
+        # Imported here to not import NumPy with the Cron class
+        from .vectorized import validate_many
+        return validate_many(self, timestamps)
@@ -0,0 +1,202 @@
+"""Streaming parser of crontab files.
+
+parse_crontab reads a crontab file, or any iterable of lines, one line at a time and yields a CrontabEntry
+for every job line, with its schedule, command and line number, or the error that made the line invalid:
+an invalid line does not stop the parsing. Comments and blank lines are skipped, the environment assignments
+(NAME=value) are attached to the entries that follow them, and the '@daily'-like macros are expanded
+('@reboot' has no schedule). With 'workers', the schedules are parsed in chunks by a pool of processes.
+"""
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .cron import Cron
+from .sub_modules.engine import Masks
+
+macros = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+    '@reboot': None,
+}
+
+_ASSIGNMENT = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)')
+
+
+class _Environment(Mapping[str, str]):
+    """The read-only environment assignments of a crontab. Unlike MappingProxyType, it can be pickled."""
+    __slots__ = ('_variables',)
+
+    def __init__(self, variables: Optional[Mapping[str, str]] = None) -> None:
+        self._variables: Dict[str, str] = dict(variables or {})
+
+    def __getitem__(self, name: str) -> str:
+        return self._variables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._variables)
+
+    def __len__(self) -> int:
+        return len(self._variables)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._variables!r})'
+
+    def __reduce__(self):
+        return self.__class__, (self._variables,)
+
+
+class CrontabEntry(NamedTuple):
+    """A job line of a crontab.
+
+    Attributes:
+        line_number (int): The number of the line, starting from 1.
+        cron (Cron): The frozen schedule. None for '@reboot' and for invalid lines.
+        command (str): The command, as written. Empty for invalid lines.
+        user (str): The user field of the system crontabs, else None.
+        macro (str): The macro of the schedule ('@daily', '@reboot', ...), else None.
+        environment (Mapping): The environment assignments read before the line.
+        error (ValueError): The reason the line is invalid, else None.
+    """
+    line_number: int
+    cron: Optional[Cron]
+    command: str
+    user: Optional[str] = None
+    macro: Optional[str] = None
+    environment: Mapping[str, str] = _Environment()
+    error: Optional[ValueError] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+Source = Union[str, 'os.PathLike[str]', Iterable[str]]
+_Pending = Tuple[CrontabEntry, Optional[str]]  # An entry and the cron string still to parse
+
+
+def parse_crontab(source: Source, system: bool = False, options=None, workers: Optional[int] = None,
+                  chunk_size: int = 1000) -> Iterator[CrontabEntry]:
+    """Yields the job entries of a crontab, in order, reading one line at a time.
+
+    :param source: The path of a crontab file, or an iterable of lines (an open file, a list, ...).
+    :param system: Optional. Whether the lines have a user field before the command, like /etc/crontab.
+    :param options: (dict) Optional. The options of the Cron objects.
+    :param workers: Optional. The number of processes parsing the schedules. None or 1 parses them in this process.
+    :param chunk_size: Optional. The number of lines sent to a process at once.
+                       At most workers + 1 chunks are held in memory.
+    :return: An iterator of CrontabEntry.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8', errors='replace') as file:
+            yield from _parse(file, system, options, workers, chunk_size)
+    else:
+        yield from _parse(source, system, options, workers, chunk_size)
+
+
+def _parse(lines: Iterable[str], system: bool, options, workers: Optional[int], chunk_size: int) \
+        -> Iterator[CrontabEntry]:
+    pending = _read(lines, system)
+    if workers is None or workers <= 1:
+        for entry, cron_string in pending:
+            yield entry if cron_string is None else _with_result(entry, _parse_cron(cron_string, options), options)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        chunks: Deque[Tuple[List[_Pending], 'Future[List[Union[Masks, ValueError, None]]]']] = deque()
+        while True:
+            chunk = list(islice(pending, chunk_size))
+            if chunk:
+                cron_strings = [cron_string for _, cron_string in chunk]
+                chunks.append((chunk, executor.submit(_parse_chunk, cron_strings, options)))
+            while chunks and (not chunk or len(chunks) > workers):
+                done, future = chunks.popleft()
+                for (entry, _), result in zip(done, future.result()):
+                    yield entry if result is None else _with_result(entry, result, options)
+            if not chunk:
+                return
+
+
+def _read(lines: Iterable[str], system: bool) -> Iterator[_Pending]:
+    """Yields the job lines as entries without a schedule yet, and the cron strings to parse."""
+    environment: Mapping[str, str] = _Environment()
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        assignment = _ASSIGNMENT.fullmatch(line)
+        if assignment:
+            name, value = assignment.groups()
+            environment = _Environment({**environment, name: _unquote(value)})
+            continue
+        yield _read_job(line_number, line, system, environment)
+
+
+def _read_job(line_number: int, line: str, system: bool, environment: Mapping[str, str]) -> _Pending:
+    macro: Optional[str] = None
+    if line.startswith('@'):
+        tokens = line.split(None, 2 if system else 1)
+        macro, fields = tokens[0], tokens[1:]
+        if macro not in macros:
+            error = ValueError(f'Unknown crontab macro {macro!r}')
+            return CrontabEntry(line_number, None, '', macro=macro, environment=environment, error=error), None
+        cron_string = macros[macro]
+    else:
+        tokens = line.split(None, 6 if system else 5)
+        cron_string, fields = ' '.join(tokens[:5]), tokens[5:]
+    if len(fields) < (2 if system else 1):
+        expected = 'a user and a command' if system else 'a command'
+        error = ValueError(f'Invalid crontab line, expected a schedule and {expected}')
+        return CrontabEntry(line_number, None, '', macro=macro, environment=environment, error=error), None
+    user = fields[0] if system else None
+    entry = CrontabEntry(line_number, None, fields[-1], user, macro, environment)
+    return entry, cron_string
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def _parse_cron(cron_string: str, options) -> Union[Cron, ValueError]:
+    try:
+        return Cron.from_cached(cron_string, options).freeze()
+    except ValueError as error:
+        return error
+
+
+def _parse_chunk(cron_strings: List[Optional[str]], options) -> List[Union[Masks, ValueError, None]]:
+    """Parses the cron strings of a chunk in a worker process. Only the bitmasks are sent back."""
+    results: List[Union[Masks, ValueError, None]] = []
+    for cron_string in cron_strings:
+        result = None if cron_string is None else _parse_cron(cron_string, options)
+        results.append(result.to_masks() if isinstance(result, Cron) else result)
+    return results
+
+
+def _with_result(entry: CrontabEntry, result: Union[Cron, Masks, ValueError], options) -> CrontabEntry:
+    if isinstance(result, ValueError):
+        return entry._replace(error=result)
+    if not isinstance(result, Cron):
+        cron = Cron(None, options)
+        cron.from_masks(result)
+        result = cron.freeze()
+    return entry._replace(cron=result)
@@ -0,0 +1,141 @@
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .cron import Cron
+from .sub_modules.units import units
+from .sub_modules.utils import iter_bits, mask_to_values, to_parts
+
+Masks = Tuple[int, int, int, int, int]
+
+
+class CronIndex:
+    """Creates an instance of CronIndex.
+
+    CronIndex objects answer "which of the registered schedules run at this time?" without checking them one by one.
+    Every cron field keeps an inverted index: for each of its values, the bitset of the ids of the schedules
+    that contain that value. The schedules matching a time are the AND of five bitsets, one per field.
+    Schedules with a full field ('*') are kept in a single bitset for that field, so they cost nothing to add.
+
+    Args:
+        crons (iterable): Optional. The Cron objects or cron strings to add.
+    """
+    def __init__(self, crons: Iterable[Union[Cron, str]] = ()) -> None:
+        self._masks: List[Optional[Masks]] = []
+        self._interned: Dict[Masks, Masks] = {}
+        # Per field: a bitset for every value, plus a last one for the schedules with the full field
+        self._bitsets: List[List[bytearray]] = [[bytearray() for _ in range(unit['max'] + 2)] for unit in units]
+        self._ints: List[List[Optional[int]]] = [[0] * (unit['max'] + 2) for unit in units]
+        self._full_masks = tuple((1 << (unit['max'] + 1)) - (1 << unit['min']) for unit in units)
+        self._indexed_values_cache: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        self._count = 0
+        for cron in crons:
+            self.add(cron)
+
+    def __len__(self) -> int:
+        """The number of schedules in the index."""
+        return self._count
+
+    def __contains__(self, cron_id: int) -> bool:
+        return 0 <= cron_id < len(self._masks) and self._masks[cron_id] is not None
+
+    def __getitem__(self, cron_id: int) -> Cron:
+        """Returns a new Cron object of the schedule with the given id.
+
+        :raises KeyError: Id not found in the index.
+        """
+        cron = Cron()
+        cron.from_masks(self._get_masks(cron_id))
+        return cron
+
+    def ids(self) -> List[int]:
+        """Returns the ids of the schedules in the index."""
+        return [cron_id for cron_id, masks in enumerate(self._masks) if masks is not None]
+
+    def add(self, cron: Union[Cron, str]) -> int:
+        """Adds a schedule to the index.
+
+        :param cron: A Cron object or a cron string.
+        :return: The id of the schedule in the index. Ids are not reused after a removal.
+        :raises LookupError: Empty Cron object.
+        :raises ValueError: Invalid cron string.
+        """
+        if isinstance(cron, str):
+            cron = Cron.from_cached(cron)
+        masks = cron.to_masks()
+        masks = self._interned.setdefault(masks, masks)  # Identical schedules share the same tuple
+        cron_id = len(self._masks)
+        self._masks.append(masks)
+        self._count += 1
+        byte, offset = divmod(cron_id, 8)
+        bit = 1 << offset
+        for field, mask in enumerate(masks):
+            bitsets, ints = self._bitsets[field], self._ints[field]
+            for value in self._indexed_values(field, mask):
+                bitset = bitsets[value]
+                if byte >= len(bitset):
+                    bitset.extend(bytes(byte - len(bitset) + 1))
+                bitset[byte] |= bit
+                ints[value] = None
+        return cron_id
+
+    def remove(self, cron_id: int) -> None:
+        """Removes a schedule from the index.
+
+        :param cron_id: The id returned by 'add'.
+        :raises KeyError: Id not found in the index.
+        """
+        masks = self._get_masks(cron_id)
+        for field, mask in enumerate(masks):
+            for value in self._indexed_values(field, mask):
+                self._clear_bit(field, value, cron_id)
+        self._masks[cron_id] = None
+        self._count -= 1
+
+    def match(self, date_time_obj: Union[datetime, date]) -> List[int]:
+        """Returns the ids of the schedules within which the object passed is, like Cron.validate does.
+
+        :param date_time_obj: A datetime or date object. A date object is checked by day only.
+        :return: The ascending ids of the matching schedules.
+        """
+        matching = -1  # All bits set, the day fields are always checked
+        for field, value in enumerate(to_parts(date_time_obj)):
+            if value is not None:
+                matching &= self._field_bitset(field, value)
+                if not matching:
+                    return []
+        return list(iter_bits(matching))
+
+    def _indexed_values(self, field: int, mask: int) -> Tuple[int, ...]:
+        """Returns the values where a schedule is indexed: only the 'full' slot for a full field."""
+        key = (field, mask)
+        values = self._indexed_values_cache.get(key)
+        if values is None:
+            if mask == self._full_masks[field]:
+                values = (len(self._bitsets[field]) - 1,)
+            else:
+                values = mask_to_values(mask)
+            self._indexed_values_cache[key] = values
+        return values
+
+    def _field_bitset(self, field: int, value: int) -> int:
+        """Returns the bitset of the schedules containing a value of a field, the ones with the full field included."""
+        return self._int(field, value) | self._int(field, len(self._bitsets[field]) - 1)
+
+    def _int(self, field: int, value: int) -> int:
+        """Returns a bitset as an integer, converting it only after it changed."""
+        bitset_int = self._ints[field][value]
+        if bitset_int is None:
+            bitset_int = int.from_bytes(self._bitsets[field][value], 'little')
+            self._ints[field][value] = bitset_int
+        return bitset_int
+
+    def _clear_bit(self, field: int, value: int, cron_id: int) -> None:
+        byte, offset = divmod(cron_id, 8)
+        self._bitsets[field][value][byte] &= ~(1 << offset) & 0xFF
+        self._ints[field][value] = None
+
+    def _get_masks(self, cron_id: int) -> Masks:
+        masks = self._masks[cron_id] if 0 <= cron_id < len(self._masks) else None
+        if masks is None:
+            raise KeyError(cron_id)
+        return masks
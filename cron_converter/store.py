@@ -0,0 +1,160 @@
+import mmap
+import os
+import struct
+from datetime import date, datetime
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from .cron import Cron
+from .sub_modules.engine import Masks, cron_weekday, epoch_to_fields
+from .sub_modules.utils import (
+    PACKED_BITS,
+    PACKED_SIZE,
+    pack_masks,
+    to_parts,
+    unpack_masks,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+_HEADER = struct.Struct('<8sII')  # Magic, format version, record size
+_MAGIC = b'CRONSTOR'
+_VERSION = 1
+HEADER_SIZE = _HEADER.size
+# Per bit: the table translating every byte to 1 if that bit is set, else to 0
+_BIT_TABLES = [bytes(byte >> bit & 1 for byte in range(256)) for bit in range(8)]
+
+
+class ScheduleStore:
+    """Creates an instance of ScheduleStore, a read-only file of schedules mapped in memory.
+
+    The file is a header followed by fixed-width records: the five bitmasks of every schedule packed
+    in 17 bytes (see Cron.to_bytes). Records are read in place, without loading the file, and a Cron object
+    is built only when one is asked for. The schedules matching a time are found scanning the records
+    column by column: one byte per record for every cron field. The file can be mapped by several processes
+    at once, and a ScheduleStore is pickled as its path.
+
+    Args:
+        path (str): The path of a file written by ScheduleStore.create.
+    """
+    def __init__(self, path: Union[str, 'os.PathLike[str]']) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as file:
+            header = file.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or _HEADER.unpack(header) != (_MAGIC, _VERSION, PACKED_SIZE):
+                raise ValueError(f'Not a schedule store file: {self.path!r}')
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._mmap) - HEADER_SIZE
+        if size % PACKED_SIZE:
+            self.close()
+            raise ValueError(f'Truncated schedule store file: {self.path!r}')
+        self._count = size // PACKED_SIZE
+        self._records: Optional['np.ndarray'] = None
+
+    @classmethod
+    def create(cls, path: Union[str, 'os.PathLike[str]'], crons: Iterable[Union[Cron, str]]) -> 'ScheduleStore':
+        """Writes the schedules to a new store file, one at a time, and opens it.
+
+        :param path: The path of the file, overwritten if it exists.
+        :param crons: The Cron objects or cron strings. Their ids are their positions.
+        :raises ValueError: A cron string is not valid.
+        :raises LookupError: Empty Cron object.
+        """
+        with open(path, 'wb') as file:
+            cls._write(file, crons)
+        return cls(path)
+
+    @staticmethod
+    def _write(file: BinaryIO, crons: Iterable[Union[Cron, str]]) -> None:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, PACKED_SIZE))
+        for cron in crons:
+            if isinstance(cron, str):
+                cron = Cron.from_cached(cron)
+            file.write(pack_masks(cron.to_masks()))
+
+    def __len__(self) -> int:
+        """The number of schedules in the store."""
+        return self._count
+
+    def __getitem__(self, cron_id: int) -> Cron:
+        """Returns a new frozen Cron object of the schedule with the id passed."""
+        cron = Cron()
+        cron.from_masks(self.masks(cron_id))
+        return cron.freeze()
+
+    def __iter__(self) -> Iterator[Cron]:
+        for cron_id in range(self._count):
+            yield self[cron_id]
+
+    def __enter__(self) -> 'ScheduleStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return ScheduleStore, (self.path,)
+
+    def masks(self, cron_id: int) -> Masks:
+        """Returns the five bitmasks of the schedule with the id passed, without creating a Cron object.
+
+        :raises IndexError: No schedule with that id.
+        """
+        if not 0 <= cron_id < self._count:
+            raise IndexError(cron_id)
+        offset = HEADER_SIZE + cron_id * PACKED_SIZE
+        return unpack_masks(self._get_mmap()[offset:offset + PACKED_SIZE])
+
+    def match(self, timestamp: Union[datetime, date, int]) -> List[int]:
+        """Returns the ids of the schedules within which the time passed is, like Cron.validate does.
+
+        :param timestamp: A datetime object, a date object (checked by day only) or UTC epoch seconds.
+        :return: The ascending ids of the matching schedules.
+        """
+        if isinstance(timestamp, int):
+            year, month, day, hour, minute = epoch_to_fields(timestamp)
+            values: List[Optional[int]] = [minute, hour, day, month, cron_weekday(year, month, day)]
+        else:
+            values = to_parts(timestamp)
+        columns = [divmod(PACKED_BITS[field] + value, 8) for field, value in enumerate(values) if value is not None]
+        if np is not None:
+            return self._match_numpy(columns)
+        return self._match_python(columns)
+
+    def close(self) -> None:
+        """Unmaps the file. The Cron objects already returned are still valid."""
+        self._records = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _get_mmap(self) -> mmap.mmap:
+        if self._mmap is None:
+            raise ValueError('Schedule store is closed')
+        return self._mmap
+
+    def _match_numpy(self, columns: List[tuple]) -> List[int]:
+        if self._records is None:
+            self._records = np.frombuffer(self._get_mmap(), dtype=np.uint8, offset=HEADER_SIZE) \
+                .reshape(self._count, PACKED_SIZE)
+        matching = np.ones(self._count, dtype=np.uint8)
+        for byte, bit in columns:
+            matching &= self._records[:, byte] >> bit
+        return np.flatnonzero(matching).tolist()
+
+    def _match_python(self, columns: List[tuple]) -> List[int]:
+        records = self._get_mmap()
+        # A byte per record: 1 if the record contains every value, else 0
+        matching = -1
+        for byte, bit in columns:
+            column = records[HEADER_SIZE + byte::PACKED_SIZE]
+            matching &= int.from_bytes(column.translate(_BIT_TABLES[bit]), 'little')
+        flags = (matching & ((1 << 8 * self._count) - 1)).to_bytes(self._count, 'little')
+        found = []
+        cron_id = flags.find(1)
+        while cron_id >= 0:
+            found.append(cron_id)
+            cron_id = flags.find(1, cron_id + 1)
+        return found
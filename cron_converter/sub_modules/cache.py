@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+T = TypeVar('T')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[T]):
+    """Creates an instance of LRUCache.
+
+    LRUCache objects are thread safe mappings bounded to 'maxsize' items.
+    When full, the least recently used item is evicted.
+
+    Attributes:
+        maxsize (int): The max number of items kept in the cache. 0 disables the cache.
+    """
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 0:
+            raise ValueError(f'Invalid cache size {maxsize!r}')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[Hashable, T]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get_or_create(self, key: Hashable, create: Callable[[], T]) -> T:
+        """Returns the cached item of the key, creating and caching it on a miss.
+
+        :param key: The key of the item.
+        :param create: The function called without arguments to create the missing item.
+        :return: The cached or the created item.
+        """
+        with self._lock:
+            try:
+                item = self._items[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return item
+        item = create()  # Outside the lock, errors are not cached
+        with self._lock:
+            if self.maxsize:
+                self._items[key] = item
+                self._items.move_to_end(key)
+                self._evict()
+        return item
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the max number of items kept in the cache, evicting the least recently used ones.
+
+        :param maxsize: The new max size. 0 disables the cache.
+        """
+        if maxsize < 0:
+            raise ValueError(f'Invalid cache size {maxsize!r}')
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all the items and resets the statistics."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the cache statistics, like functools.lru_cache does."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
+
+    def _evict(self) -> None:
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
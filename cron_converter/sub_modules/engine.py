@@ -0,0 +1,250 @@
+"""Arithmetic search of the cron schedule execution times.
+
+The functions of this module work on the bitmasks of the five cron Parts
+(minute, hour, day, month, weekday) and on plain integer date fields.
+Every field jumps straight to its next (or previous) allowed value, carrying
+into the upper field only when no allowed value is left.
+"""
+from typing import Iterator, Optional, Sequence, Tuple
+
+# The Gregorian calendar, weekdays included, repeats itself every 400 years
+MAX_SEARCH_YEARS = 400
+MIN_YEAR = 1
+MAX_YEAR = 9999
+
+Masks = Tuple[int, int, int, int, int]  # minute, hour, day, month, weekday
+Fields = Tuple[int, int, int, int, int]  # year, month, day, hour, minute
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MAX_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # February of the leap years
+# Repeats a 7 bit weekday pattern over the 5 weeks (35 days) a month can span
+_WEEKS_REPEAT = 1 | 1 << 7 | 1 << 14 | 1 << 21 | 1 << 28
+
+
+def next_bit(mask: int, value: int) -> int:
+    """Returns the smallest bit set in mask greater or equal to value, -1 if there is not any."""
+    if value < 0:
+        value = 0
+    masked = mask >> value << value
+    return (masked & -masked).bit_length() - 1
+
+
+def prev_bit(mask: int, value: int) -> int:
+    """Returns the largest bit set in mask lower or equal to value, -1 if there is not any."""
+    if value < 0:
+        return -1
+    return (mask & ((2 << value) - 1)).bit_length() - 1
+
+
+def is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+    if month == 2 and is_leap(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """Returns the number of days since 1970-01-01 of a proleptic Gregorian date."""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Returns the (year, month, day) proleptic Gregorian date of a number of days since 1970-01-01."""
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_position = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_position + 2) // 5 + 1
+    month = month_position + (3 if month_position < 10 else -9)
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def cron_weekday(year: int, month: int, day: int) -> int:
+    """Returns the cron weekday number, Sunday (0) to Saturday (6), of a date."""
+    return (days_from_civil(year, month, day) + 4) % 7  # 1970-01-01 was a Thursday
+
+
+def fields_to_epoch(year: int, month: int, day: int, hour: int, minute: int) -> int:
+    """Returns the seconds since 1970-01-01T00:00 of naive date fields, read as UTC."""
+    return days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60
+
+
+def epoch_to_fields(seconds: int) -> Fields:
+    """Returns the naive date fields of the minute of an amount of seconds since 1970-01-01T00:00, read as UTC."""
+    days, seconds = divmod(seconds, 86400)
+    year, month, day = civil_from_days(days)
+    return year, month, day, seconds // 3600, seconds // 60 % 60
+
+
+def month_days_mask(masks: Masks, year: int, month: int) -> int:
+    """Returns the bitmask of the days of a month matching both the day and the weekday Parts."""
+    weekdays = masks[4]
+    first_weekday = cron_weekday(year, month, 1)
+    # Bit N of the pattern is set when the (N + 1)th day of the week starting on 'first_weekday' is allowed
+    pattern = (weekdays >> first_weekday | weekdays << (7 - first_weekday)) & 0x7F
+    month_days = (2 << days_in_month(year, month)) - 1
+    return masks[2] & ((pattern * _WEEKS_REPEAT) << 1) & month_days
+
+
+def can_match(masks: Sequence[int]) -> bool:
+    """Returns whether the schedule matches any date: none of its bitmasks is empty
+    and one of its days exists in one of its months. Weekdays need no check, as every date
+    (29 February included) falls on every weekday within the 400 years the calendar takes to repeat itself.
+    """
+    minutes, hours, days, months, weekdays = masks
+    if not (minutes and hours and days and months and weekdays):
+        return False
+    first_day = (days & -days).bit_length() - 1
+    return any(months >> month & 1 and first_day <= _MAX_DAYS_IN_MONTH[month] for month in range(1, 13))
+
+
+def find_next(masks: Masks, year: int, month: int, day: int, hour: int, minute: int,
+              limit_year: Optional[int] = None) -> Optional[Fields]:
+    """Returns the first date fields matching the schedule, starting from the provided ones included.
+
+    :param masks: The bitmasks of the cron Parts.
+    :param limit_year: Optional. The last year to search in, by default 400 years after the provided one.
+    :return: The matching fields, None if the schedule does not match any date up to the limit year.
+    """
+    minutes, hours, _, months, _ = masks
+    limit = min(year + MAX_SEARCH_YEARS if limit_year is None else limit_year, MAX_YEAR)
+    while year <= limit:
+        next_month = next_bit(months, month)
+        if next_month < 0:
+            year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+            continue
+        if next_month != month:
+            month, day, hour, minute = next_month, 1, 0, 0
+        next_day = next_bit(month_days_mask(masks, year, month), day)
+        if next_day < 0:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            day, hour, minute = 1, 0, 0
+            continue
+        if next_day != day:
+            day, hour, minute = next_day, 0, 0
+        next_hour = next_bit(hours, hour)
+        if next_hour < 0:
+            day, hour, minute = day + 1, 0, 0
+            continue
+        if next_hour != hour:
+            hour, minute = next_hour, 0
+        next_minute = next_bit(minutes, minute)
+        if next_minute < 0:
+            hour, minute = hour + 1, 0
+            continue
+        return year, month, day, hour, next_minute
+    return None
+
+
+def find_prev(masks: Masks, year: int, month: int, day: int, hour: int, minute: int,
+              limit_year: Optional[int] = None) -> Optional[Fields]:
+    """Returns the last date fields matching the schedule, going back from the provided ones included.
+
+    :param masks: The bitmasks of the cron Parts.
+    :param limit_year: Optional. The first year to search in, by default 400 years before the provided one.
+    :return: The matching fields, None if the schedule does not match any date down to the limit year.
+    """
+    minutes, hours, _, months, _ = masks
+    limit = max(year - MAX_SEARCH_YEARS if limit_year is None else limit_year, MIN_YEAR)
+    while year >= limit:
+        prev_month = prev_bit(months, month)
+        if prev_month < 0:
+            year, month, day, hour, minute = year - 1, 12, 31, 23, 59
+            continue
+        if prev_month != month:
+            month, day, hour, minute = prev_month, days_in_month(year, prev_month), 23, 59
+        prev_day = prev_bit(month_days_mask(masks, year, month), day)
+        if prev_day < 0:
+            year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+            day, hour, minute = days_in_month(year, month), 23, 59
+            continue
+        if prev_day != day:
+            day, hour, minute = prev_day, 23, 59
+        prev_hour = prev_bit(hours, hour)
+        if prev_hour < 0:
+            day, hour, minute = day - 1, 23, 59
+            continue
+        if prev_hour != hour:
+            hour, minute = prev_hour, 59
+        prev_minute = prev_bit(minutes, minute)
+        if prev_minute < 0:
+            hour, minute = hour - 1, 59
+            continue
+        return year, month, day, hour, prev_minute
+    return None
+
+
+def iter_next(masks: Masks, year: int, month: int, day: int, hour: int, minute: int,
+              limit_year: Optional[int] = None) -> Iterator[Fields]:
+    """Yields the date fields matching the schedule in ascending order, starting from the provided ones included.
+    The remaining minutes of a matching hour and the remaining hours of a matching day are yielded
+    without searching the upper fields again.
+
+    :param masks: The bitmasks of the cron Parts.
+    :param limit_year: Optional. The last year to search in, by default 400 years after the last match.
+    """
+    minutes, hours = masks[0], masks[1]
+    first_minute = next_bit(minutes, 0)
+    found = find_next(masks, year, month, day, hour, minute, limit_year)
+    while found is not None:
+        year, month, day, hour, minute = found
+        while True:
+            yield year, month, day, hour, minute
+            minute = next_bit(minutes, minute + 1)
+            if minute < 0:
+                hour = next_bit(hours, hour + 1)
+                if hour < 0:
+                    break
+                minute = first_minute
+        found = find_next(masks, year, month, day + 1, 0, 0, limit_year)
+
+
+def iter_prev(masks: Masks, year: int, month: int, day: int, hour: int, minute: int,
+              limit_year: Optional[int] = None) -> Iterator[Fields]:
+    """Yields the date fields matching the schedule in descending order, starting from the provided ones included.
+    The remaining minutes of a matching hour and the remaining hours of a matching day are yielded
+    without searching the upper fields again.
+
+    :param masks: The bitmasks of the cron Parts.
+    :param limit_year: Optional. The first year to search in, by default 400 years before the last match.
+    """
+    minutes, hours = masks[0], masks[1]
+    last_minute = minutes.bit_length() - 1
+    found = find_prev(masks, year, month, day, hour, minute, limit_year)
+    while found is not None:
+        year, month, day, hour, minute = found
+        while True:
+            yield year, month, day, hour, minute
+            minute = prev_bit(minutes, minute - 1)
+            if minute < 0:
+                hour = prev_bit(hours, hour - 1)
+                if hour < 0:
+                    break
+                minute = last_minute
+        found = find_prev(masks, year, month, day - 1, 23, 59, limit_year)
+
+
+def next_epoch_minute(masks: Masks, minute: int) -> Optional[int]:
+    """Returns the first minute since 1970-01-01T00:00 UTC matching the schedule, starting from the provided one
+    included, None if the schedule does not match any minute in the next 400 years.
+    """
+    found = find_next(masks, *epoch_to_fields(minute * 60))
+    return None if found is None else fields_to_epoch(*found) // 60
+
+
+def prev_epoch_minute(masks: Masks, minute: int) -> Optional[int]:
+    """Returns the last minute since 1970-01-01T00:00 UTC matching the schedule, starting from the provided one
+    included, None if the schedule does not match any minute in the previous 400 years.
+    """
+    found = find_prev(masks, *epoch_to_fields(minute * 60))
+    return None if found is None else fields_to_epoch(*found) // 60
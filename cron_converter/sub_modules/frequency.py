@@ -0,0 +1,147 @@
+"""Counting of the cron schedule execution times, without searching them.
+
+A schedule matches the product of its matching days and of the same times on every one of them,
+so the executions in a window are the matching days times the matching minutes of a day,
+corrected on the first and the last day of the window. The matching days are counted a month at a time
+with the bitmasks of month_days_mask. The intervals between executions come from the gaps between
+the minutes, the hours and the matching days: the days repeat every 400 years, the cycle of the calendar.
+
+Like the vectorized functions, the times are wall-clock times: minutes since 1970-01-01T00:00, with no timezone.
+"""
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from .cache import LRUCache
+from .engine import (
+    Masks,
+    civil_from_days,
+    cron_weekday,
+    days_from_civil,
+    days_in_month,
+    is_leap,
+    month_days_mask,
+)
+
+MINUTES_PER_DAY = 1440
+CYCLE_DAYS = 146097  # The days of 400 years
+_CYCLE_START = 2000
+
+# The smallest and largest gaps between the matching days by (day, month, weekday) bitmasks
+_day_gaps: LRUCache[Optional[Tuple[int, int]]] = LRUCache(maxsize=1024)
+
+
+def _count_bits(mask: int) -> int:
+    return bin(mask).count('1')
+
+
+def wall_minute(date_time: datetime) -> int:
+    """Returns the minutes since 1970-01-01T00:00 of the wall-clock time of a datetime, ignoring its timezone."""
+    return (days_from_civil(date_time.year, date_time.month, date_time.day) * MINUTES_PER_DAY
+            + date_time.hour * 60 + date_time.minute)
+
+
+def count_minutes(masks: Masks, first: int, last: int) -> int:
+    """Returns the number of minutes matching the schedule in [first, last), minutes since 1970-01-01T00:00."""
+    if first >= last:
+        return 0
+    first_day, first_time = divmod(first, MINUTES_PER_DAY)
+    last_day, last_time = divmod(last, MINUTES_PER_DAY)
+    # The whole days from the first one to the one before the last, less the minutes of the first day before
+    # the window, plus the minutes of the last day in the window
+    count = count_days(masks, first_day, last_day) * _minutes_before(masks, MINUTES_PER_DAY)
+    if first_time and count_days(masks, first_day, first_day + 1):
+        count -= _minutes_before(masks, first_time)
+    if last_time and count_days(masks, last_day, last_day + 1):
+        count += _minutes_before(masks, last_time)
+    return count
+
+
+def count_days(masks: Masks, first_day: int, last_day: int) -> int:
+    """Returns the number of days matching the schedule in [first_day, last_day), days since 1970-01-01."""
+    if first_day >= last_day:
+        return 0
+    cycles, days = divmod(last_day - first_day, CYCLE_DAYS)
+    count = 0
+    if cycles:  # Every 400 years long window has the same matching days
+        count = cycles * _cycle_days(masks[2], masks[3], masks[4]).count('1')
+    if not days:
+        return count
+    year, month, day = civil_from_days(first_day)
+    last_year, last_month, last_date = civil_from_days(first_day + days - 1)
+    months = masks[3]
+    while True:
+        month_days = month_days_mask(masks, year, month) >> day << day if months >> month & 1 else 0
+        if year == last_year and month == last_month:
+            return count + _count_bits(month_days & ((2 << last_date) - 1))
+        count += _count_bits(month_days)
+        year, month, day = (year + 1, 1, 1) if month == 12 else (year, month + 1, 1)
+
+
+def _minutes_before(masks: Masks, time: int) -> int:
+    """Returns the number of minutes of a matching day matching the schedule before a time of the day, in minutes."""
+    minutes, hours = masks[0], masks[1]
+    hour, minute = divmod(time, 60)
+    count = _count_bits(hours & ((1 << hour) - 1)) * _count_bits(minutes)
+    if hours >> hour & 1:
+        count += _count_bits(minutes & ((1 << minute) - 1))
+    return count
+
+
+def interval_minutes(masks: Masks) -> Optional[Tuple[int, int]]:
+    """Returns the smallest and the largest number of minutes between two consecutive times of the schedule,
+    None if it does not match any date.
+    """
+    day_gaps = _day_gaps.get_or_create((masks[2], masks[3], masks[4]),
+                                       lambda: _cycle_gaps(_cycle_days(masks[2], masks[3], masks[4])))
+    if day_gaps is None:
+        return None
+    minutes, hours = masks[0], masks[1]
+    minutes_span = minutes.bit_length() - (minutes & -minutes).bit_length()
+    # The times of a day: the minutes of an hour, repeated every matching hour
+    time_gaps = [gaps for gaps in [_gaps(minutes)] if gaps is not None]
+    hour_gaps = _gaps(hours)
+    if hour_gaps is not None:
+        time_gaps.append((hour_gaps[0] * 60 - minutes_span, hour_gaps[1] * 60 - minutes_span))
+    # The times of all the days: the times of a day, repeated every matching day
+    times_span = (hours.bit_length() - (hours & -hours).bit_length()) * 60 + minutes_span
+    time_gaps.append((day_gaps[0] * MINUTES_PER_DAY - times_span, day_gaps[1] * MINUTES_PER_DAY - times_span))
+    return min(gaps[0] for gaps in time_gaps), max(gaps[1] for gaps in time_gaps)
+
+
+def _gaps(mask: int) -> Optional[Tuple[int, int]]:
+    """Returns the smallest and the largest gap between two consecutive bits set, None with less than two bits."""
+    zeros = bin(mask)[2:].strip('0').split('1')[1:-1]  # The runs of zeros between the bits set
+    if not zeros:
+        return None
+    return min(map(len, zeros)) + 1, max(map(len, zeros)) + 1
+
+
+def _cycle_gaps(days: str) -> Optional[Tuple[int, int]]:
+    """Returns the smallest and the largest gap between two consecutive matching days of the calendar cycle,
+    from the last matching day of a cycle to the first one of the next cycle included.
+    """
+    first = days.find('1')
+    if first < 0:
+        return None
+    last = days.rfind('1')
+    wrap = len(days) - last + first
+    zeros = days[first:last + 1].split('1')[1:-1]
+    if not zeros:  # A single matching day every 400 years
+        return wrap, wrap
+    return min(min(map(len, zeros)) + 1, wrap), max(max(map(len, zeros)) + 1, wrap)
+
+
+def _cycle_days(days: int, months: int, weekdays: int) -> str:
+    """Returns the days of the 400 years calendar cycle as a string: '1' for the matching days, else '0'."""
+    masks = (0, 0, days, months, weekdays)
+    years: Dict[Tuple[bool, int], str] = {}  # There are only 14 kinds of years: leap or not, by first weekday
+    cycle = []
+    for year in range(_CYCLE_START, _CYCLE_START + 400):
+        kind = is_leap(year), cron_weekday(year, 1, 1)
+        if kind not in years:
+            years[kind] = ''.join(
+                format(month_days_mask(masks, year, month) >> 1 if months >> month & 1 else 0,
+                       f'0{days_in_month(year, month)}b')[::-1]
+                for month in range(1, 13))
+        cycle.append(years[kind])
+    return ''.join(cycle)
@@ -1,5 +1,31 @@
 from functools import total_ordering
-from typing import List, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .cache import LRUCache
+from .utils import mask_to_values, values_to_mask
+
+
+class CronParseError(ValueError):
+    """Raised when a cron string can not be parsed.
+
+    Attributes:
+        text (str): The string parsed: the cron string, or the string of a Part parsed alone.
+        position (int): The index in the string of the character where the error was found.
+    """
+    def __init__(self, message: str, text: str = '', position: int = 0) -> None:
+        super().__init__(message, text, position)
+        self.text = text
+        self.position = position
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+    def _within(self, text: str, offset: int) -> 'CronParseError':
+        """Moves the error to a string containing the string parsed, at the offset passed."""
+        self.text = text
+        self.position += offset
+        return self
 
 
 @total_ordering
@@ -7,15 +33,27 @@ class Part:
     """Creates an instance of Part.
 
     Part objects represent a collection of positive integers.
+    Values are stored as an integer bitmask (bit N set means value N is present),
+    so membership tests are O(1). The sorted list of values is derived from the mask on demand.
+    A frozen Part can not be modified anymore, so it is hashable and can be shared between Cron objects.
+    The strings of the Parts are memoized by unit, values and formatting options.
 
     Attributes:
         unit (dict): The unit of measurement of time (see units.py).
         options (dict): Optional dictionary of formatting options: output_weekday_names and output_month_names
+        format_cache (LRUCache): Class attribute. The cache of the formatted Parts.
     """
+    __slots__ = ('options', 'unit', '_mask', '_values', '_frozen', '_hash', '_string')
+    format_cache: 'LRUCache[str]' = LRUCache(maxsize=4096)
+
     def __init__(self, unit, options):
         self.options = options if bool(options) else dict()
         self.unit = unit
-        self.values: List[int] = []
+        self._mask: int = 0
+        self._values: Optional[Tuple[int, ...]] = ()
+        self._frozen = False
+        self._hash = 0
+        self._string: Optional[Tuple[tuple, str]] = None  # The formatting key and the string
 
     def __str__(self) -> str:
         """Print directly the Part Object"""
@@ -25,7 +63,10 @@ class Part:
         return f'{self.__class__.__name__} - (values:{self.values!r}, unit:{self.unit.get("name")!r})'
 
     def __len__(self):
-        return len(self.to_list())
+        return bin(self._mask).count('1')
+
+    def __contains__(self, value: int) -> bool:
+        return self.has(value)
 
     def __lt__(self, other) -> bool:
         """This Part object is lower than the other Part."""
@@ -37,16 +78,126 @@ class Part:
         """This Part object is equal to the other Part."""
         if not isinstance(other, Part):
             return NotImplemented
-        return (self.unit.get("name") == other.unit.get("name")
-                and len(self) == len(other)
-                and all(value == other_value for value, other_value in zip(self.values, other.values)))
+        return self.unit.get("name") == other.unit.get("name") and self._mask == other._mask
+
+    def __hash__(self) -> int:
+        """Only a frozen Part is hashable. The hash is consistent with '__eq__'."""
+        if not self._frozen:
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}' (not frozen)")
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """The slots to pickle and copy, the read-only options of a frozen Part as a dict."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['options'] = dict(self.options)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._frozen:
+            self.options = MappingProxyType(self.options)
+
+    def __or__(self, other: 'Part') -> 'Part':
+        """Returns a new Part with the values of both Parts."""
+        if not isinstance(other, Part):
+            return NotImplemented
+        return self._with_mask(self._mask | self._other_mask(other))
+
+    def __and__(self, other: 'Part') -> 'Part':
+        """Returns a new Part with the values in both Parts.
+
+        :raises ValueError: The Parts have different units, or no value in common.
+        """
+        if not isinstance(other, Part):
+            return NotImplemented
+        return self._with_mask(self._mask & self._other_mask(other))
+
+    def __sub__(self, other: 'Part') -> 'Part':
+        """Returns a new Part with the values of this Part not in the other one.
+
+        :raises ValueError: The Parts have different units, or every value is in the other Part.
+        """
+        if not isinstance(other, Part):
+            return NotImplemented
+        return self._with_mask(self._mask & ~self._other_mask(other))
+
+    def issubset(self, other: 'Part') -> bool:
+        """Returns True if every value of this Part is in the other Part.
+
+        :raises ValueError: The Parts have different units.
+        """
+        if not isinstance(other, Part):
+            raise TypeError(f"issubset() argument must be a Part, not '{type(other).__name__}'")
+        return self._mask & ~self._other_mask(other) == 0
+
+    def _other_mask(self, other: 'Part') -> int:
+        """Returns the bitmask of the other Part, checking that both Parts have the same unit."""
+        if self.unit.get('name') != other.unit.get('name'):
+            raise ValueError(f'Can not combine {self.unit.get("name")!r} and {other.unit.get("name")!r} Parts')
+        return other._mask
+
+    def _with_mask(self, mask: int) -> 'Part':
+        """Returns a new Part of the same unit and options with the bitmask passed, only checked not to be empty."""
+        if not mask:
+            raise ValueError(f'Empty {self.unit.get("name")!r} Part')
+        part = Part(self.unit, self.options)
+        part._mask = mask
+        part._values = None
+        return part
+
+    @property
+    def values(self) -> List[int]:
+        """The sorted list of the Part values."""
+        return list(self._sorted_values())
+
+    @values.setter
+    def values(self, values: List[int]) -> None:
+        self._check_not_frozen()
+        self._mask = values_to_mask(values)
+        self._values = None
+
+    @property
+    def mask(self) -> int:
+        """The Part values as an integer bitmask. Bit N is set when the value N is present."""
+        return self._mask
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the Part can not be modified anymore."""
+        return self._frozen
+
+    def freeze(self) -> 'Part':
+        """Makes the Part immutable and hashable.
+        Its options are copied, so later changes to the original dict are ignored.
+
+        :return: The Part itself.
+        """
+        if not self._frozen:
+            self.options = MappingProxyType(dict(self.options))
+            self._string = None  # It may have been formatted with other options
+            self._hash = hash((self.unit.get('name'), self._mask))
+            self._frozen = True
+        return self
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise AttributeError(f'Frozen {self.unit.get("name")!r} Part can not be modified')
+
+    def _sorted_values(self) -> Tuple[int, ...]:
+        """Returns the sorted values, computing them from the bitmask only once."""
+        if self._values is None:
+            self._values = mask_to_values(self._mask)
+        return self._values
 
     def from_list(self, part_list: List[Union[str, int]]) -> None:
         """Validates a range of positive integers.
 
         :param part_list: An array of positive integers.
         :raises ValueError: An error occurred in case of invalid value or out of range value
+        :raises AttributeError: The Part is frozen.
         """
+        self._check_not_frozen()
         values = []
         for part_value in part_list:
             try:
@@ -61,54 +212,109 @@ class Part:
             raise ValueError('Empty interval value')
 
         sunday_fixed_values = self._fix_sunday(values)
-        unique_values = list(dict.fromkeys(sunday_fixed_values))  # Remove eventual duplicates
-        unique_values.sort()
-        out_of_range_value = self.out_of_range(unique_values)
+        out_of_range_value = self.out_of_range(sorted(sunday_fixed_values))
         if out_of_range_value is not None:
             raise ValueError(f'Value {out_of_range_value!r} out of range for {self.unit.get("name")!r}')
 
-        self.values = unique_values
+        self.values = sunday_fixed_values  # Duplicates are merged by the bitmask
+
+    def from_mask(self, mask: int) -> None:
+        """Validates an integer bitmask of values. Bit N set means value N is present.
+
+        :param mask: The bitmask of the values.
+        :raises ValueError: Empty or out of range bitmask.
+        :raises AttributeError: The Part is frozen.
+        """
+        self._check_not_frozen()
+        if mask <= 0:
+            raise ValueError('Empty interval value')
+        if mask >> (self.unit.get('max') + 1) or mask & ((1 << self.unit.get('min')) - 1):
+            raise ValueError(f'Bitmask {mask:#x} out of range for {self.unit.get("name")!r}')
+        self._mask = mask
+        self._values = None
 
     def from_string(self, cron_part: str) -> None:
         """Parses a string as a range of positive integers.
+        The string is read in a single pass: every element is validated and added to the bitmask as it is read.
 
         :param cron_part: The string that represent a Part. It will be converted as a range.
-        :raises ValueError: Invalid value.
-        :raises ValueError: An error occurred in case of invalid value or out of range value.
+        :raises CronParseError: Invalid or out of range value, with its position in the string.
+        :raises AttributeError: The Part is frozen.
         """
-        intervals_values_list = []  # Final list of list. Every sub-list will be a unit range
-        # Split in the case of multiple unit ranges and replace months 'alt' with corresponding 'int' numbers
-        string_parts = self._replace_alternatives(cron_part).split(',')
-        for string_part in string_parts:
-            # Split in the case of step parameter
-            range_step_string_parts = string_part.split('/')
-            if len(range_step_string_parts) > 2:
-                raise ValueError(f"Invalid value {string_part!r} in cron part {cron_part!r}")
-            range_string = range_step_string_parts[0]
-            if not range_string:
-                raise ValueError(f'Invalid value {string_part!r} for {self.unit.get("name")!r}')
-            elif range_string == '*':
-                range_list = self.possible_values()
-            else:
-                range_list = self._parse_range(range_string)
-                range_list = self._fix_sunday(range_list)
-                value = self.out_of_range(range_list)
-                if value is not None:
-                    raise ValueError(f'Value {value!r} out of range for {self.unit.get("name")!r}')
-            step = self._get_step(range_step_string_parts)
-
-            if step is not None:
-                interval_values = self._apply_interval(range_list, step)  # filter by step
-                if not len(interval_values):
-                    raise ValueError(f'Empty intervals value {cron_part}')
-                intervals_values_list.append(interval_values)
-            else:  # either no step value found or step value not valid
-                intervals_values_list.append(range_list)
-
-        flattened_ranges_list = [item for sublist in intervals_values_list for item in sublist]
-        flattened_ranges_list = list(dict.fromkeys(flattened_ranges_list))  # Remove eventual duplicates
-        flattened_ranges_list.sort()
-        self.values = flattened_ranges_list
+        self._check_not_frozen()
+        mask = 0  # Every element is merged in the bitmask, duplicates included
+        start = 0
+        while True:
+            end = cron_part.find(',', start)
+            if end < 0:
+                end = len(cron_part)
+            try:
+                mask |= self._parse_element(cron_part[start:end], cron_part)
+            except CronParseError as error:
+                raise error._within(cron_part, start)
+            if end == len(cron_part):
+                break
+            start = end + 1
+        self._mask = mask
+        self._values = None
+
+    def _parse_element(self, element: str, cron_part: str) -> int:
+        """Parses an element of a comma separated string: '*', a value or a range of values, optionally followed
+        by '/' and a step. Values are numbers or, for months and weekdays, case-insensitive names.
+        Example -> weekday element "mon-fri/2" will be 0b101010
+
+        :param element: The element string.
+        :param cron_part: The whole string, for the error messages.
+        :return: The bitmask of the element values.
+        :raise CronParseError: Invalid element, with its position in the element.
+        """
+        name = self.unit.get('name')
+        unit_min = self.unit.get('min')
+        unit_max = self.unit.get('max')
+        slash = element.find('/')
+        range_string = element if slash < 0 else element[:slash]
+        if slash >= 0 and element.find('/', slash + 1) >= 0:
+            raise CronParseError(f'Invalid value {element!r} in cron part {cron_part!r}',
+                                 element, element.find('/', slash + 1))
+        if not range_string:
+            raise CronParseError(f'Invalid value {element!r} for {name!r}', element, 0)
+        if range_string == '*':
+            low, high = first, last = unit_min, unit_max
+        else:
+            low, high = self._parse_range(range_string)
+            first, last = self._fix_sunday([low, high])
+            if first < unit_min:
+                raise CronParseError(f'Value {first!r} out of range for {name!r}', element, 0)
+            if last > unit_max:
+                raise CronParseError(f'Value {last!r} out of range for {name!r}', element,
+                                     range_string.rfind('-') + 1)
+        step = 1
+        if slash >= 0:
+            try:
+                step = self._parse_step(element[slash + 1:])
+            except CronParseError as error:
+                raise error._within(element, slash + 1)
+
+        if high > unit_max:  # Sunday as 7: it is counted as 0 by the step
+            return (1 if first % step == 0 else 0) | self._interval_mask(low, unit_max, step)
+        return self._interval_mask(low, high, step)
+
+    @staticmethod
+    def _interval_mask(low: int, high: int, step: int) -> int:
+        """Returns the bitmask of the values from low to high, included, every step values.
+        Example -> low=2, high=6, step=3 will be 0b100100
+
+        :param low: The first value.
+        :param high: The last value, not always in the bitmask.
+        :param step: The step value.
+        :return: The bitmask, 0 if low is greater than high.
+        """
+        if low > high:
+            return 0
+        step = min(step, high - low + 1)  # A longer step has the same single value, with a smaller bitmask
+        count = (high - low) // step + 1
+        # The bits low, low + step, ... low + (count - 1) * step: the sum of a geometric series
+        return ((1 << count * step) - 1) // ((1 << step) - 1) << low
 
     def _fix_sunday(self, values: List[int]) -> List[int]:
         """Replaces all 7 with 0 as Sunday can be represented by both.
@@ -120,91 +326,57 @@ class Part:
             values = [0 if value == 7 else value for value in values]
         return values
 
-    def _parse_range(self, unit_range: str) -> List[int]:
-        """Parses a range string. Example: input="15-19" output=[15, 16, 17, 18, 19]
+    def _parse_value(self, value: str) -> Optional[int]:
+        """Parses a number or, for the units with alternative names, a case-insensitive name.
+        Example -> month 'dec' will be 12
 
-        :param unit_range: The range string.
-        :return: The resulting array.
-        :raise ValueError: Impossible to convert the Part unit as int.
-        :raise ValueError: Invalid min or max value for the Part unit.
-        :raise ValueError: Not valid Range, max range is less than min range
+        :param value: The value string.
+        :return: The value, None if the string is not valid.
         """
-        sub_parts = unit_range.split('-')
-        if len(sub_parts) == 1:
-            try:
-                value = int(sub_parts[0])
-            except ValueError as exc:
-                raise ValueError(f'Invalid value {unit_range!r} --> {exc}')
-            return [value]
-        elif len(sub_parts) == 2:
-            try:
-                min_value = int(sub_parts[0])
-                max_value = int(sub_parts[1])
-            except ValueError as exc:
-                raise ValueError(f'Invalid min or max value from: {unit_range!r} --> {exc}')
-            if max_value < min_value:
-                raise ValueError(f'Max range is less than min range in {unit_range!r} for {self.unit.get("name")!r}')
-            return [int_value for int_value in range(min_value, max_value + 1)]
-        else:
-            raise ValueError(f'Invalid value {unit_range}')
+        if value.isdigit() and value.isascii():
+            return int(value)
+        alternatives = self.unit.get('alt')
+        if alternatives is not None and value.upper() in alternatives:
+            return self.unit.get('min') + alternatives.index(value.upper())
+        return None
 
-    def _get_step(self, range_string_parts: List[str]) -> Union[None, int]:
-        """Get the step part of the part string.
+    def _parse_range(self, unit_range: str) -> Tuple[int, int]:
+        """Parses a range string. Example: input="15-19" output=(15, 19)
 
-        :param range_string_parts: the part string of the current range.
-        :return step: parsed step.
-        :raise IndexError: The second index of the list does not exist. The step is not present.
+        :param unit_range: The range string.
+        :return: The first and last values of the range, the same value twice without '-'.
+        :raise CronParseError: Impossible to convert a value of the range.
+        :raise CronParseError: Not valid Range, max range is less than min range
         """
-        try:
-            step_str = range_string_parts[1]
-        except IndexError:
-            return None
-
-        if step_str or step_str == '':
-            return self._parse_step(step_str)
-
-        return None
+        name = self.unit.get('name')
+        dash = unit_range.find('-')
+        if dash < 0:
+            value = self._parse_value(unit_range)
+            if value is None:
+                raise CronParseError(f'Invalid value {unit_range!r} for {name!r}', unit_range, 0)
+            return value, value
+        if unit_range.find('-', dash + 1) >= 0:
+            raise CronParseError(f'Invalid value {unit_range!r} for {name!r}', unit_range,
+                                 unit_range.find('-', dash + 1))
+        min_value = self._parse_value(unit_range[:dash])
+        max_value = self._parse_value(unit_range[dash + 1:])
+        if min_value is None or max_value is None:
+            raise CronParseError(f'Invalid min or max value from: {unit_range!r} for {name!r}', unit_range,
+                                 0 if min_value is None else dash + 1)
+        if max_value < min_value:
+            raise CronParseError(f'Max range is less than min range in {unit_range!r} for {name!r}', unit_range, 0)
+        return min_value, max_value
 
     def _parse_step(self, step: str) -> int:
         """Parses the step from a part string.
 
         :param step: The step string.
         :return: The step value.
-        :raise ValueError: Invalid interval step value.
-        """
-        try:
-            parsed_step = int(step)
-        except (ValueError, TypeError):
-            raise ValueError(f'Invalid interval step value {step!r} for {self.unit.get("name")!r}')
-        if not parsed_step or parsed_step < 1:
-            raise ValueError(f'Invalid interval step value {step!r} for {self.unit.get("name")!r}')
-        return parsed_step
-
-    @staticmethod
-    def _apply_interval(values: List[int], step: int) -> List[int]:
-        """Applies an interval step to a collection of values.
-
-        :param values: A collection of numbers.
-        :param step: The step value.
-        :returns: The resulting collection.
+        :raise CronParseError: Invalid interval step value.
         """
-        if step:
-            min_value = values[0]
-            values = [value for value in values if value % step == min_value % step or value == min_value]
-        return values
-
-    def _replace_alternatives(self, string: str) -> str:
-        """Replaces the alternative representations of numbers in a string.
-        Example -> month 'dec' will be '12'
-
-        :param string: The string to process.
-        :return: The processed string.
-        """
-        if 'alt' in self.unit:
-            string = string.upper()
-            for idx, alt in enumerate(self.unit.get('alt')):
-                string = string.replace(alt, str(self.unit.get("min") + idx))
-        return string
+        if not (step.isdigit() and step.isascii()) or int(step) < 1:
+            raise CronParseError(f'Invalid interval step value {step!r} for {self.unit.get("name")!r}', step, 0)
+        return int(step)
 
     def out_of_range(self, values: List[int]) -> Union[int, None]:
         """Finds an element from values that is outside the range of self.unit
@@ -234,7 +406,9 @@ class Part:
 
         :return: The smallest Part value.
         """
-        return self.values[0]
+        if not self._mask:
+            raise IndexError('Empty Part')
+        return (self._mask & -self._mask).bit_length() - 1
 
     def max(self) -> int:
         """Returns the largest value in the range.
@@ -242,20 +416,23 @@ class Part:
 
         :return: The largest Part value.
         """
-        return self.values[-1]
+        if not self._mask:
+            raise IndexError('Empty Part')
+        return self._mask.bit_length() - 1
 
     def is_full(self) -> bool:
         """Returns true if range has all the values of the unit.
         """
-        return len(self.values) == self.unit.get('max') - self.unit.get('min') + 1
+        return len(self) == self.unit.get('max') - self.unit.get('min') + 1
 
     def get_step(self) -> Union[int, None]:
         """Returns the difference between first and second elements in the range.
 
         :return: step between numbers in the interval whether array interval > 2.
         """
-        if self.values and len(self.values) > 2:
-            step = self.values[1] - self.values[0]
+        values = self._sorted_values()
+        if values and len(values) > 2:
+            step = values[1] - values[0]
             if step > 1:
                 return step
         return None
@@ -265,10 +442,11 @@ class Part:
 
         :param step: The difference between numbers in the interval.
         """
-        for idx, value in enumerate(self.values):
-            if self.values[0] == value:
+        values = self._sorted_values()
+        for idx, value in enumerate(values):
+            if values[0] == value:
                 continue
-            prev_value = self.values[idx - 1]
+            prev_value = values[idx - 1]
             current_value = value
             if current_value - prev_value != step:
                 return False
@@ -279,7 +457,7 @@ class Part:
 
         :param step: The difference between numbers in the interval.
         """
-        have_all_values = len(self.values) == round((self.max() - self.min()) / step) + 1
+        have_all_values = len(self) == round((self.max() - self.min()) / step) + 1
         if self.min() == self.unit.get('min') and self.max() + step > self.unit.get('max') and have_all_values:
             return True
         return False
@@ -290,18 +468,22 @@ class Part:
         :param value: The value to look for.
         :return: Whether the value is present in the range or not.
         """
-        try:
-            self.values.index(value)
-            return True
-        except ValueError:
-            return False
+        return value >= 0 and self._mask >> value & 1 == 1
 
     def to_list(self) -> List[int]:
         """Returns the range as an array of positive integers.
 
         :return: The range as an array.
         """
-        return self.values
+        return list(self._sorted_values())
+
+    def lookup_table(self) -> bytes:
+        """Returns the range as a lookup table indexed by value, from 0 to the unit max value.
+        Example -> hours Part '1,3': bytes([0, 1, 0, 1, 0, ..., 0])
+
+        :return: A bytes object with 1 at the index of every value in the range, 0 elsewhere.
+        """
+        return bytes(self._mask >> value & 1 for value in range(self.unit.get('max') + 1))
 
     def to_ranges(self) -> List[Union[int, List[int]]]:
         """Returns the range as an array of ranges defined as arrays of positive integers.
@@ -310,17 +492,18 @@ class Part:
         """
         multi_dim_values: List[Union[int, List[int]]] = []
         start_number: Union[int, None] = None
-        for idx, value in enumerate(self.values):
+        values = self._sorted_values()
+        for idx, value in enumerate(values):
             try:
-                next_value = self.values[idx + 1]
+                next_value = values[idx + 1]
             except IndexError:
-                next_value = -1  # No next item in the self.values list
+                next_value = -1  # No next item in the values list
 
             if value != next_value - 1:  # next_value is not the subsequent number
                 if start_number is not None:
                     multi_dim_values.append([start_number, value])
                     start_number = None
-                else:  # The last number of the list "self.values" is not in a range
+                else:  # The last number of the list "values" is not in a range
                     multi_dim_values.append(value)
             elif start_number is None:
                 start_number = value
@@ -332,6 +515,18 @@ class Part:
 
         :return: The range as a string.
         """
+        memo = self._string
+        if memo is not None and self._frozen:
+            return memo[1]
+        name = self.unit.get('name')
+        key = (name, self._mask, 'output_hashes' in self.options,
+               bool(name == 'weekday' and self.options.get('output_weekday_names')
+                    or name == 'month' and self.options.get('output_month_names')))
+        if memo is None or memo[0] != key:
+            memo = self._string = key, self.format_cache.get_or_create(key, self._format)
+        return memo[1]
+
+    def _format(self) -> str:
         cron_range_strings = []
         if self.is_full():
             if 'output_hashes' in self.options:
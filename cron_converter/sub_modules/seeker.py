@@ -1,11 +1,32 @@
 import calendar
 import copy
+from array import array
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Iterator, List, Literal, Optional
+from typing import TYPE_CHECKING, Iterator, List, Literal, Optional, Union
 
 from dateutil import tz
 
-from .utils import iso_to_cron_weekday
+from ..timezones import get_timezone
+from .engine import (
+    Fields,
+    Masks,
+    fields_to_epoch,
+    find_next,
+    find_prev,
+    iter_next,
+    iter_prev,
+)
+from .utils import ceil_minute, iso_to_cron_weekday
+from .zones import (
+    Key,
+    OnRepeated,
+    OnSkipped,
+    Zone,
+    ZonedTime,
+    check_policies,
+    get_zone,
+    iter_zoned,
+)
 
 if TYPE_CHECKING:
     from cron import Cron
@@ -18,10 +39,23 @@ class Seeker(Iterator[datetime]):
         cron (object): Cron object
         start_date (datetime): The start date for the schedule iterator, with or without timezone.
         timezone_str (str): The timezone to make a timezone aware datetime as response.
+        engine (str): The search engine. 'jump' (default) jumps straight to the next allowed value of every field,
+                      'step' is the legacy engine that walks minute by minute, hour by hour and day by day.
+        on_skipped (str): What to do with the times skipped by a DST transition, with a timezone aware date.
+                          'keep' (default) returns the nonexistent time as is, 'skip' drops it,
+                          'shift' runs it at the end of the gap. Times shifted to the same instant are returned once.
+        on_repeated (str): What to do with the times repeated by a DST transition, with a timezone aware date.
+                           'first' (default) returns only the first occurrence, 'last' only the second one (fold=1),
+                           'both' returns both.
     """
-    def __init__(self, cron: 'Cron', start_date: Optional[datetime] = None, timezone_str: Optional[str] = None) -> None:
+    def __init__(self, cron: 'Cron', start_date: Optional[datetime] = None, timezone_str: Optional[str] = None,
+                 engine: Literal['jump', 'step'] = 'jump', on_skipped: OnSkipped = 'keep',
+                 on_repeated: OnRepeated = 'first') -> None:
         if not cron.parts:
             raise LookupError('No schedule found')
+        check_policies(on_skipped, on_repeated)
+        zoned = (on_skipped, on_repeated) != ('keep', 'first')
+        self._check_engine(engine, zoned)
 
         if start_date is not None and timezone_str is not None:
             raise ValueError('should have location_num or location_path, but not both')
@@ -34,11 +68,8 @@ class Seeker(Iterator[datetime]):
             except Exception as exc:
                 raise ValueError(f'Input schedule start time is not a valid datetime object. Error -> {exc}')
         elif timezone_str:
-            if tz.gettz(timezone_str):
-                self.tz_info = tz.gettz(timezone_str)
-                self.date = datetime.now(self.tz_info)
-            else:
-                raise ValueError(f'Provided not a valid Timezone --> {timezone_str}')
+            self.tz_info = get_timezone(timezone_str)
+            self.date = datetime.now(self.tz_info)
         else:
             self.date = datetime.now(tz.tzutc())
 
@@ -48,12 +79,26 @@ class Seeker(Iterator[datetime]):
             self.date = self.date + timedelta(minutes=+1)
 
         self.cron = cron
+        self.engine = engine
+        self.on_skipped = on_skipped
+        self.on_repeated = on_repeated
         self.pristine = True
+        # With DST policies, times are computed in UTC and the iterator state is the key of the last time
+        self._zone: Optional[Zone] = get_zone(self.date.tzinfo) if zoned and self.date.tzinfo is not None else None
+        self._key: Optional[Key] = None
+
+    @staticmethod
+    def _check_engine(engine: str, zoned: bool) -> None:
+        if engine not in ('jump', 'step'):
+            raise ValueError(f'Invalid seeker engine {engine!r}')
+        if zoned and engine != 'jump':
+            raise ValueError('DST policies require the jump engine')
 
     def reset(self) -> None:
         """Resets the iterator."""
         self.pristine = True
         self.date = self.start_time
+        self._key = None
 
     def __next__(self) -> datetime:
         """Returns the time the schedule would run next.
@@ -69,6 +114,8 @@ class Seeker(Iterator[datetime]):
          Returns:
             (datetime): The time the schedule would run next.
         """
+        if self._zone is not None:
+            return self._zoned_find(self._zone, reverse=False)
         if self.pristine:
             self.pristine = False
         else:
@@ -84,13 +131,160 @@ class Seeker(Iterator[datetime]):
         Returns:
             (datetime): The time the schedule would have last run at.
         """
+        if self._zone is not None:
+            return self._zoned_find(self._zone, reverse=True)
         self.pristine = False
         # Ensure prev and next cannot be same time
         self.date = self.date + timedelta(minutes=-1)
         return self.find_date(self.cron.parts, True)
 
     def find_date(self, cron_parts: List['Part'], reverse: bool = False) -> datetime:
-        """Returns the time the schedule would run next. # TODO refactor description.
+        """Moves the seeker date to the closest time matching the schedule, the current date included.
+
+        Args:
+            cron_parts (List): List of all cron 'Part'.
+            reverse(boolean): Whether to find the previous value instead of next.
+        Returns:
+            (datetime): A new datetime object. The date the schedule would have executed at.
+        """
+        if self.engine == 'step':
+            return self._step_date(cron_parts, reverse)
+
+        date = self.date
+        fields = (date.year, date.month, date.day, date.hour, date.minute)
+        masks = self._masks(cron_parts)
+        found = find_prev(masks, *fields) if reverse else find_next(masks, *fields)
+        if found is None:
+            raise Exception('Unable to find execution time for schedule')
+        if found != fields:
+            year, month, day, hour, minute = found
+            # fold=0 like the step engine, the start fold of a time repeated by a DST transition is not kept
+            self.date = date.replace(year=year, month=month, day=day, hour=hour, minute=minute,
+                                     second=59 if reverse else 0, microsecond=0, fold=0)
+        return self.date.replace(second=0, microsecond=0)
+
+    def take(self, n: int, reverse: bool = False, as_epoch: bool = False) -> Union[List[datetime], 'array[int]']:
+        """Returns the next n times the schedule would run, like n calls of next() (or prev()) in a single pass.
+        The iterator moves to the last returned time.
+
+        Args:
+            n (int): The number of times to return.
+            reverse (boolean): Whether to return the previous times, like prev() does, instead of the next ones.
+            as_epoch (boolean): Whether to return an array of epoch seconds instead of a list of datetime objects.
+                                Naive datetime objects are read as UTC.
+        Returns:
+            (list | array): The times the schedule would run, in the order next() or prev() would return them.
+        """
+        if n <= 0:
+            return array('q') if as_epoch else []
+        if self._zone is not None:
+            found_times = iter_zoned(self._masks(self.cron.parts), self._zone, self._zoned_key(), reverse,
+                                     self.on_skipped, self.on_repeated)
+            zoned_times = [zoned_time for zoned_time, _ in zip(found_times, range(n))]
+            if len(zoned_times) < n:
+                raise Exception('Unable to find execution time for schedule')
+            self._move_to(self._zone, zoned_times[-1])
+            return self._zoned_output(self._zone, zoned_times, as_epoch)
+        date = self.date
+        if reverse:
+            date = date + timedelta(minutes=-1)
+        elif not self.pristine:
+            date = date + timedelta(minutes=+1)
+        fields = (date.year, date.month, date.day, date.hour, date.minute)
+        found = iter_prev(self._masks(self.cron.parts), *fields) if reverse else \
+            iter_next(self._masks(self.cron.parts), *fields)
+        found_fields = [fields for fields, _ in zip(found, range(n))]
+        if len(found_fields) < n:
+            raise Exception('Unable to find execution time for schedule')
+
+        self.pristine = False
+        year, month, day, hour, minute = found_fields[-1]
+        self.date = date.replace(year=year, month=month, day=day, hour=hour, minute=minute, second=0, microsecond=0,
+                                 fold=0)
+        return self._to_output(found_fields, date, as_epoch)
+
+    def between(self, start: datetime, end: datetime, as_epoch: bool = False) -> Union[List[datetime], 'array[int]']:
+        """Returns all the times the schedule would run in the interval [start, end), in a single pass.
+        The iterator state is not used nor changed.
+
+        Args:
+            start (datetime): The start of the interval, included.
+            end (datetime): The end of the interval, excluded. An aware end is converted to the start timezone.
+            as_epoch (boolean): Whether to return an array of epoch seconds instead of a list of datetime objects.
+                                Naive datetime objects are read as UTC.
+        Returns:
+            (list | array): The times the schedule would run, in ascending order.
+        """
+        if start.tzinfo is not None and end.tzinfo is not None:
+            end = end.astimezone(start.tzinfo)
+        start = ceil_minute(start)
+        end = ceil_minute(end)
+        if self._zone is not None and start.tzinfo is not None:
+            zone = get_zone(start.tzinfo)
+            end_epoch = int(end.timestamp())
+            zoned_times = []
+            for zoned_time in iter_zoned(self._masks(self.cron.parts), zone, (int(start.timestamp()), ()),
+                                         on_skipped=self.on_skipped, on_repeated=self.on_repeated):
+                if zoned_time.epoch >= end_epoch:
+                    break
+                zoned_times.append(zoned_time)
+            return self._zoned_output(zone, zoned_times, as_epoch)
+        end_fields = (end.year, end.month, end.day, end.hour, end.minute)
+        found_fields = []
+        if start < end:
+            found = iter_next(self._masks(self.cron.parts), start.year, start.month, start.day, start.hour,
+                              start.minute, limit_year=end.year)
+            for fields in found:
+                if fields >= end_fields:
+                    break
+                found_fields.append(fields)
+        return self._to_output(found_fields, start, as_epoch)
+
+    def _zoned_key(self) -> Key:
+        """Returns the key of the last returned time, or of the start date if pristine."""
+        if self._key is not None:
+            return self._key
+        return int(ceil_minute(self.start_time).timestamp()), ()
+
+    def _zoned_find(self, zone: Zone, reverse: bool) -> datetime:
+        """Returns the next (or previous) time of the schedule after the last returned one, computed in UTC."""
+        found = iter_zoned(self._masks(self.cron.parts), zone, self._zoned_key(), reverse,
+                           self.on_skipped, self.on_repeated)
+        zoned_time = next(found, None)
+        if zoned_time is None:
+            raise Exception('Unable to find execution time for schedule')
+        self._move_to(zone, zoned_time)
+        return self.date
+
+    def _move_to(self, zone: Zone, zoned_time: ZonedTime) -> None:
+        self.pristine = False
+        self._key = zoned_time.key
+        self.date = zone.to_datetime(zoned_time)
+
+    @staticmethod
+    def _zoned_output(zone: Zone, zoned_times: List[ZonedTime], as_epoch: bool) -> Union[List[datetime], 'array[int]']:
+        if as_epoch:
+            return array('q', [zoned_time.epoch for zoned_time in zoned_times])
+        return [zone.to_datetime(zoned_time) for zoned_time in zoned_times]
+
+    @staticmethod
+    def _masks(cron_parts: List['Part']) -> Masks:
+        """Returns the bitmasks of the cron Parts."""
+        return cron_parts[0].mask, cron_parts[1].mask, cron_parts[2].mask, cron_parts[3].mask, cron_parts[4].mask
+
+    @staticmethod
+    def _to_output(found_fields: List[Fields], date: datetime, as_epoch: bool) -> Union[List[datetime], 'array[int]']:
+        """Converts the found date fields to datetime objects with the date timezone, or to epoch seconds."""
+        tz_info = date.tzinfo
+        if not as_epoch:
+            return [datetime(*fields, tzinfo=tz_info) for fields in found_fields]
+        if tz_info is None:
+            return array('q', [fields_to_epoch(*fields) for fields in found_fields])
+        zone = get_zone(tz_info)
+        return array('q', [zone.resolve(fields)[0].epoch for fields in found_fields])
+
+    def _step_date(self, cron_parts: List['Part'], reverse: bool = False) -> datetime:
+        """Legacy engine of 'find_date', it walks the date a minute, an hour, a day or a month at a time.
 
         Args:
             cron_parts (List): List of all cron 'Part'.
@@ -124,7 +318,7 @@ class Seeker(Iterator[datetime]):
             cron_month_part (Part): The month 'Part' object.
             operation (Literal['add', 'subtract']): The function to call on date: 'add' or 'subtract'.
         """
-        while self.date.month not in cron_month_part.to_list():
+        while not cron_month_part.has(self.date.month):
             self.date = self._calc_months(self.date, 1, operation)
 
     def _shift_day(self, cron_day_part: 'Part', cron_weekday_part: 'Part', operation: Literal['add', 'subtract']) \
@@ -138,8 +332,8 @@ class Seeker(Iterator[datetime]):
             (boolean): Whether the month of the date was changed.
         """
         current_month = self.date.month
-        while self.date.day not in cron_day_part.to_list() or \
-                iso_to_cron_weekday(self.date.isoweekday()) not in cron_weekday_part.to_list():
+        while not cron_day_part.has(self.date.day) or \
+                not cron_weekday_part.has(iso_to_cron_weekday(self.date.isoweekday())):
             if operation == 'add':
                 self.date = self.date + timedelta(days=+1)
                 self.date = self.date.replace(hour=0, minute=0, second=0)
@@ -160,7 +354,7 @@ class Seeker(Iterator[datetime]):
             (boolean): Whether the day of the date was changed
         """
         current_day = self.date.day
-        while self.date.hour not in cron_hour_part.to_list():
+        while not cron_hour_part.has(self.date.hour):
             if operation == 'add':
                 self.date = self.date + timedelta(hours=+1)
                 self.date = self.date.replace(minute=00, second=0)
@@ -182,7 +376,7 @@ class Seeker(Iterator[datetime]):
             (boolean): Whether the hour of the date was changed.
         """
         current_hour = self.date.hour
-        while self.date.minute not in cron_minute_part.to_list():
+        while not cron_minute_part.has(self.date.minute):
             if operation == 'add':
                 self.date = self.date + timedelta(minutes=+1)
                 self.date = self.date.replace(second=0, microsecond=0)
@@ -1,4 +1,6 @@
-units = [
+from typing import Any, Dict, List
+
+units: List[Dict[str, Any]] = [
     {
         "name": "minute",
         "min": 0,
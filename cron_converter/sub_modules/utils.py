@@ -1,5 +1,5 @@
 import datetime
-from typing import List, Union
+from typing import Iterable, Iterator, List, Tuple, Union
 
 
 def to_parts(d: Union[datetime.datetime, datetime.date]) -> List[Union[int, None]]:
@@ -15,9 +15,66 @@ def to_parts(d: Union[datetime.datetime, datetime.date]) -> List[Union[int, None
     return [minute, hour, day, month, dayofweek]
 
 
+def ceil_minute(d: datetime.datetime) -> datetime.datetime:
+    """Rounds a datetime up to the minute."""
+    if d.second > 0 or d.microsecond > 0:
+        d = d.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+    return d
+
+
 def iso_to_cron_weekday(iso_weekday: int) -> int:
     """Converts ISO weekday numbers to cron weekday numbers.
         ISO weekday numbers are Monday (1) to Sunday (7)
         Cron weekday numbers are Sunday (0) to Saturday (6).
     """
     return iso_weekday % 7
+
+
+def values_to_mask(values: Iterable[int]) -> int:
+    """Converts a collection of positive integers to an integer bitmask.
+        Example -> [0, 2, 3] will be 0b1101
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+def mask_to_values(mask: int) -> Tuple[int, ...]:
+    """Converts an integer bitmask to the sorted tuple of the positive integers it contains.
+        Example -> 0b1101 will be (0, 2, 3)
+    """
+    return tuple(value for value in range(mask.bit_length()) if mask >> value & 1)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yields the positions of the bits set in an integer bitmask, in ascending order.
+        It scans the binary string, so it is fast with the large bitmasks too.
+        Example -> 0b1101 will yield 0, 2 and 3
+    """
+    bits = bin(mask)[:1:-1]  # Least significant bit first, without '0b'
+    position = bits.find('1')
+    while position >= 0:
+        yield position
+        position = bits.find('1', position + 1)
+
+
+PACKED_SIZE = 17  # The bytes of the packed bitmasks of a schedule: 60 + 24 + 31 + 12 + 7 = 134 bits
+PACKED_BITS = (0, 60, 83, 114, 127)  # The bit of the value 0 of every field, days and months start from 1
+
+
+def pack_masks(masks: Tuple[int, int, int, int, int]) -> bytes:
+    """Packs the five bitmasks of a schedule in 17 little-endian bytes.
+        The bits of the minutes come first, then hours, days (from 1), months (from 1) and weekdays.
+    """
+    minute, hour, day, month, weekday = masks
+    return (minute | hour << 60 | day >> 1 << 84 | month >> 1 << 115 | weekday << 127).to_bytes(PACKED_SIZE, 'little')
+
+
+def unpack_masks(data: Union[bytes, bytearray, memoryview]) -> Tuple[int, int, int, int, int]:
+    """Unpacks the five bitmasks of a schedule packed by pack_masks. The bitmasks are not validated."""
+    if len(data) != PACKED_SIZE:
+        raise ValueError(f'Invalid packed schedule of {len(data)} bytes')
+    bits = int.from_bytes(data, 'little')
+    return (bits & 0xFFFFFFFFFFFFFFF, bits >> 60 & 0xFFFFFF, (bits >> 84 & 0x7FFFFFFF) << 1,
+            (bits >> 115 & 0xFFF) << 1, bits >> 127)
@@ -0,0 +1,232 @@
+"""Resolution of wall-clock date fields to UTC, with precomputed timezone transition tables.
+
+A Zone wraps a tzinfo object and computes, once per year, the table of its UTC offset transitions.
+Wall-clock times are then resolved to epoch seconds with a bisection of the table, without tzinfo calls:
+a time skipped by a transition (a DST gap) resolves to no instant, a time repeated by a transition
+(a DST fold) resolves to two instants.
+
+The 'on_skipped' policies of a skipped time:
+    'keep': the nonexistent wall-clock time is returned as is, at the instant of the transition (legacy).
+    'skip': the time is dropped.
+    'shift': the time runs at the instant of the transition, the first wall-clock time after the gap.
+The 'on_repeated' policies of a repeated time:
+    'first': only the first occurrence, fold=0 (legacy).
+    'last': only the second occurrence, fold=1.
+    'both': both occurrences.
+"""
+import heapq
+from bisect import bisect_right
+from datetime import datetime, tzinfo
+from typing import Dict, Hashable, Iterator, List, Literal, NamedTuple, Tuple
+
+from .cache import LRUCache
+from .engine import (
+    Fields,
+    Masks,
+    days_from_civil,
+    epoch_to_fields,
+    fields_to_epoch,
+    iter_next,
+    iter_prev,
+)
+
+OnSkipped = Literal['keep', 'skip', 'shift']
+OnRepeated = Literal['first', 'last', 'both']
+ON_SKIPPED = ('keep', 'skip', 'shift')
+ON_REPEATED = ('first', 'last', 'both')
+
+Key = Tuple[int, Tuple[int, ...]]  # The ordering key of a time: epoch seconds and wall-clock fields
+
+
+def check_policies(on_skipped: str, on_repeated: str) -> None:
+    """Raises ValueError if the skipped or the repeated times policy is not valid."""
+    if on_skipped not in ON_SKIPPED:
+        raise ValueError(f'Invalid skipped times policy {on_skipped!r}')
+    if on_repeated not in ON_REPEATED:
+        raise ValueError(f'Invalid repeated times policy {on_repeated!r}')
+
+
+class ZonedTime(NamedTuple):
+    epoch: int
+    fields: Fields
+    fold: int
+
+    @property
+    def key(self) -> Key:
+        return self.epoch, self.fields
+
+
+class _YearTable(NamedTuple):
+    start: int  # The UTC instant of the start of the year
+    end: int
+    epochs: List[int]  # The UTC instants of the transitions
+    offsets: List[int]  # The UTC offset in seconds after every transition
+    start_offset: int  # The UTC offset at the start of the year
+
+
+class Zone:
+    """Creates an instance of Zone, the transition tables of a tzinfo object.
+
+    Args:
+        tz_info (tzinfo): The timezone.
+    """
+    def __init__(self, tz_info: tzinfo) -> None:
+        self.tz_info = tz_info
+        self._years: Dict[int, _YearTable] = {}
+
+    def offset(self, epoch: int) -> int:
+        """Returns the UTC offset in seconds at an instant."""
+        year = 1970 + epoch // 31556952  # The average length of a Gregorian year, a guess off by a year at most
+        table = self._table(year)
+        if epoch < table.start:
+            table = self._table(year - 1)
+        elif epoch >= table.end:
+            table = self._table(year + 1)
+        index = bisect_right(table.epochs, epoch)
+        return table.offsets[index - 1] if index else table.start_offset
+
+    def offset_bounds(self, epoch: int) -> Tuple[int, int]:
+        """Returns the min and max UTC offsets in the two days before and after an instant."""
+        low, high = epoch - 2 * 86400, epoch + 2 * 86400
+        offsets = [self.offset(low)]
+        year = epoch_to_fields(epoch)[0]
+        for table in (self._table(year - 1), self._table(year), self._table(year + 1)):
+            offsets.extend(table.offsets[bisect_right(table.epochs, low):bisect_right(table.epochs, high)])
+        return min(offsets), max(offsets)
+
+    def resolve(self, fields: Fields, on_skipped: OnSkipped = 'keep', on_repeated: OnRepeated = 'first') \
+            -> List[ZonedTime]:
+        """Returns the instants of wall-clock date fields, in ascending order, applying the policies."""
+        wall = fields_to_epoch(*fields)
+        epochs = self._instants(fields[0], wall)
+        if len(epochs) == 1:
+            return [ZonedTime(epochs[0], fields, 0)]
+        if epochs:
+            if on_repeated == 'first':
+                return [ZonedTime(epochs[0], fields, 0)]
+            if on_repeated == 'last':
+                return [ZonedTime(epochs[-1], fields, 1)]
+            return [ZonedTime(epochs[0], fields, 0), ZonedTime(epochs[-1], fields, 1)]
+        # Skipped time: the gap starts with the last transition before the wall-clock time read with the old offset
+        transition = self._prev_transition(wall - self.offset(wall - 86400))
+        if on_skipped == 'skip':
+            return []
+        if on_skipped == 'shift':
+            return [ZonedTime(transition, epoch_to_fields(transition + self.offset(transition)), 0)]
+        return [ZonedTime(transition, fields, 0)]
+
+    def _instants(self, year: int, wall: int) -> List[int]:
+        """Returns the ascending instants whose wall-clock time is 'wall' seconds, read as UTC."""
+        table = self._table(year)
+        index = bisect_right(table.epochs, wall - 86400)
+        if (index == len(table.epochs) or table.epochs[index] >= wall + 86400) \
+                and table.start + 2 * 86400 < wall < table.end - 2 * 86400:
+            # No transitions around: the offset is the one a day before
+            return [wall - (table.offsets[index - 1] if index else table.start_offset)]
+        offsets = {self.offset(wall - 86400)}
+        for year_table in (self._table(year - 1), table, self._table(year + 1)):
+            for epoch, offset in zip(year_table.epochs, year_table.offsets):
+                if -86400 < epoch - wall < 86400:
+                    offsets.add(offset)
+        return sorted(wall - offset for offset in offsets if self.offset(wall - offset) == offset)
+
+    def to_datetime(self, zoned_time: ZonedTime) -> datetime:
+        return datetime(*zoned_time.fields, tzinfo=self.tz_info, fold=zoned_time.fold)
+
+    def _prev_transition(self, epoch: int) -> int:
+        year = epoch_to_fields(epoch)[0]
+        for table in (self._table(year), self._table(year - 1)):
+            index = bisect_right(table.epochs, epoch)
+            if index:
+                return table.epochs[index - 1]
+        return epoch
+
+    def _table(self, year: int) -> _YearTable:
+        table = self._years.get(year)
+        if table is None:
+            table = self._years[year] = self._compute_table(year)
+        return table
+
+    def _utc_offset(self, epoch: int) -> int:
+        date = datetime(1970, 1, 1, tzinfo=self.tz_info)
+        try:
+            date = datetime.fromtimestamp(epoch, self.tz_info)
+        except (OverflowError, OSError, ValueError):
+            pass
+        offset = date.utcoffset()
+        return int(offset.total_seconds()) if offset is not None else 0
+
+    def _compute_table(self, year: int) -> _YearTable:
+        """Samples the UTC offset every day of the year, bisecting to the second the days with a transition."""
+        start = days_from_civil(year, 1, 1) * 86400
+        days = days_from_civil(year + 1, 1, 1) - days_from_civil(year, 1, 1)
+        start_offset = offset = self._utc_offset(start)
+        epochs, offsets = [], []
+        for day in range(1, days + 1):
+            day_offset = self._utc_offset(start + day * 86400)
+            if day_offset == offset:
+                continue
+            low, high = start + (day - 1) * 86400, start + day * 86400
+            while high - low > 1:
+                middle = (low + high) // 2
+                if self._utc_offset(middle) == offset:
+                    low = middle
+                else:
+                    high = middle
+            epochs.append(high)
+            offsets.append(day_offset)
+            offset = day_offset
+        return _YearTable(start, start + days * 86400, epochs, offsets, start_offset)
+
+
+def _zone_key(tz_info: tzinfo) -> Hashable:
+    try:
+        hash(tz_info)
+    except TypeError:  # dateutil tzfile objects are not hashable
+        return type(tz_info), repr(tz_info)
+    return tz_info
+
+
+_zones: LRUCache[Zone] = LRUCache(maxsize=256)
+
+
+def get_zone(tz_info: tzinfo) -> Zone:
+    """Returns the cached Zone of a tzinfo object."""
+    return _zones.get_or_create(_zone_key(tz_info), lambda: Zone(tz_info))
+
+
+def iter_zoned(masks: Masks, zone: Zone, key: Key, reverse: bool = False, on_skipped: OnSkipped = 'keep',
+               on_repeated: OnRepeated = 'first') -> Iterator[ZonedTime]:
+    """Yields the times of the schedule after the key (or before it, if reverse) in real time order.
+
+    The wall-clock candidates of the engine are resolved to UTC and reordered with a heap:
+    a candidate is yielded only when no later candidate can resolve to an earlier instant.
+    Times resolving to the same key are yielded once.
+
+    :param key: The (epoch, fields) key to start from, excluded. (epoch, ()) starts from the epoch included,
+                or excluded if reverse.
+    """
+    epoch = key[0]
+    min_offset, max_offset = zone.offset_bounds(epoch)
+    sign = -1 if reverse else 1
+    start = epoch_to_fields(epoch + (max_offset if reverse else min_offset))
+    heap: List[Tuple[int, Tuple[int, ...], ZonedTime]] = []
+    last = key
+    for fields in (iter_prev if reverse else iter_next)(masks, *start):
+        wall = fields_to_epoch(*fields)
+        min_offset, max_offset = zone.offset_bounds(wall)
+        # Every candidate after this one resolves after the bound
+        bound = sign * (wall - (min_offset if reverse else max_offset))
+        while heap and heap[0][0] < bound:
+            zoned_time = heapq.heappop(heap)[2]
+            if (zoned_time.key > last) if not reverse else (zoned_time.key < last):
+                last = zoned_time.key
+                yield zoned_time
+        for zoned_time in zone.resolve(fields, on_skipped, on_repeated):
+            heapq.heappush(heap, (sign * zoned_time.epoch, tuple(sign * field for field in zoned_time.fields),
+                                  zoned_time))
+    while heap:
+        zoned_time = heapq.heappop(heap)[2]
+        if (zoned_time.key > last) if not reverse else (zoned_time.key < last):
+            last = zoned_time.key
+            yield zoned_time
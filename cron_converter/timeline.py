@@ -0,0 +1,130 @@
+import heapq
+from datetime import datetime, timedelta, tzinfo
+from itertools import count
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Union
+
+from dateutil import tz
+
+from .cron import Cron
+from .sub_modules.engine import Masks, fields_to_epoch, iter_next, iter_prev
+from .sub_modules.utils import ceil_minute
+from .sub_modules.zones import (
+    OnRepeated,
+    OnSkipped,
+    check_policies,
+    get_zone,
+    iter_zoned,
+)
+from .timezones import get_timezone
+
+
+class _Group:
+    """The ids sharing the same schedule and timezone, whose execution times are computed only once."""
+    def __init__(self, masks: Masks, tz_info: Optional[tzinfo], on_skipped: OnSkipped, on_repeated: OnRepeated) \
+            -> None:
+        self.masks = masks
+        self.tz_info = tz_info
+        self.on_skipped = on_skipped
+        self.on_repeated = on_repeated
+        self.cron_ids: List[Hashable] = []
+
+    def times(self, start_date: datetime, reverse: bool) -> Iterator[Tuple[int, datetime]]:
+        """Yields the execution times from the start date, like Seeker.next() or Seeker.prev() would,
+        together with their epoch seconds.
+        """
+        if self.tz_info is not None:
+            start_date = start_date.astimezone(self.tz_info)
+        start_date = ceil_minute(start_date)
+        if start_date.tzinfo is not None:
+            # Computed in UTC, so that the times around DST transitions are ordered by their instant
+            zone = get_zone(start_date.tzinfo)
+            key = (int(start_date.timestamp()), ())
+            for zoned_time in iter_zoned(self.masks, zone, key, reverse, self.on_skipped, self.on_repeated):
+                yield zoned_time.epoch, zone.to_datetime(zoned_time)
+            return
+        if reverse:
+            start_date = start_date + timedelta(minutes=-1)
+        fields = (start_date.year, start_date.month, start_date.day, start_date.hour, start_date.minute)
+        for found in (iter_prev if reverse else iter_next)(self.masks, *fields):
+            yield fields_to_epoch(*found), datetime(*found)
+
+
+class Timeline:
+    """Creates an instance of Timeline.
+
+    Timeline objects merge the execution times of many schedules in a single ordered timeline of
+    (datetime, cron_id) tuples. The times are computed lazily and merged with a heap.
+    Schedules identical in every field and timezone are computed only once.
+
+    Args:
+        start_date (datetime): Optional. The start date of the timeline. If not provided, date will be now in UTC.
+                               It has to be timezone aware when a schedule has a timezone.
+        reverse (bool): Whether to go back in time, like Seeker.prev() does, instead of forward.
+    """
+    def __init__(self, start_date: Optional[datetime] = None, reverse: bool = False) -> None:
+        self.start_date = start_date if start_date is not None else datetime.now(tz.tzutc())
+        self.reverse = reverse
+        self._groups: Dict[Tuple[Masks, Optional[str], str, str], _Group] = {}
+        self._ids = count()
+
+    def __len__(self) -> int:
+        """The number of schedules in the timeline."""
+        return sum(len(group.cron_ids) for group in self._groups.values())
+
+    def add(self, cron: Union[Cron, str], cron_id: Optional[Hashable] = None, timezone_str: Optional[str] = None,
+            on_skipped: OnSkipped = 'keep', on_repeated: OnRepeated = 'first') -> Hashable:
+        """Adds a schedule to the timeline.
+
+        :param cron: A Cron object or a cron string.
+        :param cron_id: Optional. The id returned with the schedule times. By default, an increasing integer.
+        :param timezone_str: Optional. A timezone str('Europe/Rome', 'America/New_York', ...).
+                             The times of the schedule are computed in that timezone.
+        :param on_skipped: Optional. The policy of the times skipped by a DST transition, like Seeker's.
+        :param on_repeated: Optional. The policy of the times repeated by a DST transition, like Seeker's.
+        :return: The id of the schedule.
+        :raises ValueError: Not a valid timezone or policy, or a timezone with a naive start date.
+        :raises LookupError: Empty Cron object.
+        """
+        if isinstance(cron, str):
+            cron = Cron.from_cached(cron)
+        masks = cron.to_masks()
+        check_policies(on_skipped, on_repeated)
+        tz_info = None
+        if timezone_str is not None:
+            tz_info = get_timezone(timezone_str)
+            if self.start_date.tzinfo is None:
+                raise ValueError('A timezone aware start date is required to add a schedule with a timezone')
+        group_key = (masks, timezone_str, on_skipped, on_repeated)
+        group = self._groups.get(group_key)
+        if group is None:
+            group = self._groups[group_key] = _Group(masks, tz_info, on_skipped, on_repeated)
+        if cron_id is None:
+            cron_id = next(self._ids)
+        group.cron_ids.append(cron_id)
+        return cron_id
+
+    def __iter__(self) -> Iterator[Tuple[datetime, Hashable]]:
+        """Yields the (datetime, cron_id) tuples of all the schedules, in time order. The timeline is infinite.
+        Schedules running at the same time are yielded in the order their schedule was first added.
+        """
+        sign = -1 if self.reverse else 1
+        heap = []
+        for order, group in enumerate(self._groups.values()):
+            times = group.times(self.start_date, self.reverse)
+            for epoch, date in times:
+                heap.append((sign * epoch, order, date, group, times))
+                break
+        heapq.heapify(heap)
+        while heap:
+            _, order, date, group, times = heap[0]
+            for cron_id in group.cron_ids:
+                yield date, cron_id
+            for epoch, date in times:
+                heapq.heapreplace(heap, (sign * epoch, order, date, group, times))
+                break
+            else:
+                heapq.heappop(heap)
+
+    def take(self, n: int) -> List[Tuple[datetime, Hashable]]:
+        """Returns the first n (datetime, cron_id) tuples of the timeline."""
+        return [item for item, _ in zip(self, range(n))]
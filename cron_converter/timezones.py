@@ -0,0 +1,81 @@
+"""Process-wide registry of the timezones used by the schedules.
+
+Timezone names are resolved to tzinfo objects once and kept in a bounded LRU cache shared by
+Seeker, Cron.schedule and Timeline. The backend is dateutil by default, or the standard library
+zoneinfo module (Python 3.9+), selected with set_backend.
+"""
+from datetime import tzinfo
+from typing import Iterable, Literal, Optional
+
+from dateutil import tz
+
+from .sub_modules.cache import LRUCache
+from .sub_modules.engine import days_from_civil
+from .sub_modules.zones import get_zone
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    zoneinfo = None  # type: ignore[assignment]
+
+Backend = Literal['dateutil', 'zoneinfo']
+
+cache: LRUCache[Optional[tzinfo]] = LRUCache(maxsize=512)
+_backend: Backend = 'dateutil'
+
+
+def get_backend() -> Backend:
+    """Returns the backend resolving the timezone names: 'dateutil' or 'zoneinfo'."""
+    return _backend
+
+
+def set_backend(backend: Backend) -> None:
+    """Changes the backend resolving the timezone names, clearing the cache.
+
+    :param backend: 'dateutil' (default) or 'zoneinfo', from the standard library.
+    :raises ValueError: Unknown backend.
+    :raises ImportError: zoneinfo is not available (Python < 3.9).
+    """
+    global _backend
+    if backend not in ('dateutil', 'zoneinfo'):
+        raise ValueError(f'Invalid timezone backend {backend!r}')
+    if backend == 'zoneinfo' and zoneinfo is None:
+        raise ImportError('The zoneinfo module requires Python 3.9 or later')
+    _backend = backend
+    cache.clear()
+
+
+def get_timezone(timezone_str: str) -> tzinfo:
+    """Returns the cached tzinfo object of a timezone name.
+
+    :param timezone_str: A timezone str('Europe/Rome', 'America/New_York', ...).
+    :return: The tzinfo object of the current backend.
+    :raises ValueError: Not a valid timezone.
+    """
+    tz_info = cache.get_or_create((_backend, timezone_str), lambda: _load(_backend, timezone_str))
+    if tz_info is None:
+        raise ValueError(f'Provided not a valid Timezone --> {timezone_str}')
+    return tz_info
+
+
+def preload(timezone_strs: Iterable[str], years: Iterable[int] = ()) -> None:
+    """Resolves and caches timezones in advance, e.g. at startup.
+
+    :param timezone_strs: The timezone names.
+    :param years: Optional. The years whose DST transition tables are computed in advance too.
+    :raises ValueError: Not a valid timezone.
+    """
+    years = list(years)
+    for timezone_str in timezone_strs:
+        zone = get_zone(get_timezone(timezone_str))
+        for year in years:
+            zone.offset(days_from_civil(year, 7, 1) * 86400)
+
+
+def _load(backend: Backend, timezone_str: str) -> Optional[tzinfo]:
+    if backend == 'zoneinfo':
+        try:
+            return zoneinfo.ZoneInfo(timezone_str)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            return None
+    return tz.gettz(timezone_str)
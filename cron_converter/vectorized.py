@@ -0,0 +1,179 @@
+"""Vectorized expansion and validation of cron schedules.
+
+NumPy is an optional dependency (pip install cron-converter[numpy]).
+With NumPy the execution times are returned as 'datetime64[m]' arrays, built as the
+product of the matching days of the window and the hour/minute values of the schedule,
+and timestamps are validated with array lookups in the Part tables.
+Without NumPy the functions fall back to pure Python and return lists.
+
+The times are wall-clock times: the timezone of an aware window is not applied to the result.
+"""
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
+
+from .sub_modules.engine import civil_from_days, cron_weekday
+from .sub_modules.part import Part
+from .sub_modules.seeker import Seeker
+from .sub_modules.utils import ceil_minute
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .cron import Cron
+
+FireTimes = Union['np.ndarray', List[datetime]]
+Timestamp = Union[datetime, date, int]
+BoolMask = Union['np.ndarray', List[bool]]
+
+
+class _WindowCalendar:
+    """The days of a [start, end) window with their month, day of the month and weekday as NumPy arrays.
+    It is computed once and shared by all the schedules expanded over the same window.
+    """
+    def __init__(self, start: datetime, end: datetime) -> None:
+        self.start = np.datetime64(start.replace(tzinfo=None), 'm')
+        self.end = np.datetime64(end.replace(tzinfo=None), 'm')
+        first_day = self.start.astype('datetime64[D]')
+        last_day = (self.end - 1).astype('datetime64[D]')
+        self.days = np.arange(first_day, last_day + 1, dtype='datetime64[D]')
+        months = self.days.astype('datetime64[M]')
+        self.month = months.astype('int64') % 12 + 1
+        self.day = (self.days - months).astype('int64') + 1
+        self.weekday = (self.days.astype('int64') + 4) % 7  # 1970-01-01 was a Thursday
+
+    def expand(self, cron: 'Cron') -> 'np.ndarray':
+        minute_part, hour_part, day_part, month_part, weekday_part = cron.parts
+        matching = (_table(month_part)[self.month] & _table(day_part)[self.day]
+                    & _table(weekday_part)[self.weekday])
+        day_minutes = self.days[matching.astype(bool)].astype('datetime64[m]')
+        hours = np.array(hour_part.to_list(), dtype='int64')
+        minutes = np.array(minute_part.to_list(), dtype='int64')
+        day_offsets = (hours[:, None] * 60 + minutes[None, :]).ravel().astype('timedelta64[m]')
+        times = (day_minutes[:, None] + day_offsets[None, :]).ravel()
+        return times[(times >= self.start) & (times < self.end)]
+
+
+def _table(part: Part) -> 'np.ndarray':
+    return np.frombuffer(part.lookup_table(), dtype=np.uint8)
+
+
+def _check_window(start: datetime, end: datetime) -> datetime:
+    """Returns the end of the window in the timezone of the start."""
+    if start.tzinfo is not None and end.tzinfo is not None:
+        end = end.astimezone(start.tzinfo)
+    return end
+
+
+def fire_times(cron: 'Cron', start: datetime, end: datetime) -> FireTimes:
+    """Returns all the times the schedule would run in the window [start, end).
+
+    :param cron: The Cron object.
+    :param start: The start of the window, included.
+    :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+    :return: A 'datetime64[m]' NumPy array, or a list of datetime objects if NumPy is not installed.
+    :raises LookupError: Empty Cron object.
+    """
+    return fire_times_many([cron], start, end)[0]
+
+
+def fire_times_many(crons: Iterable['Cron'], start: datetime, end: datetime) -> List[FireTimes]:
+    """Returns all the times every schedule would run in the window [start, end).
+    The calendar of the window is computed only once for all the schedules.
+
+    :param crons: The Cron objects.
+    :param start: The start of the window, included.
+    :param end: The end of the window, excluded. An aware end is converted to the start timezone.
+    :return: A list with a 'datetime64[m]' NumPy array, or a list of datetime objects if NumPy is not installed,
+             for every Cron object.
+    :raises LookupError: Empty Cron object.
+    """
+    end = _check_window(start, end)
+    crons = list(crons)
+    for cron in crons:
+        if not cron.parts:
+            raise LookupError('No schedule found')
+    if np is None:
+        return [Seeker(cron, start).between(start, end) for cron in crons]
+    start, end = ceil_minute(start), ceil_minute(end)
+    if start >= end:
+        return [np.array([], dtype='datetime64[m]') for _ in crons]
+    calendar = _WindowCalendar(start, end)
+    return [calendar.expand(cron) for cron in crons]
+
+
+def validate_many(cron: 'Cron', timestamps: Union[Sequence[Timestamp], 'np.ndarray']) -> BoolMask:
+    """Returns which timestamps are within the Cron rule, like Cron.validate does for a single one.
+
+    :param cron: The Cron object.
+    :param timestamps: A sequence of datetime objects, date objects or UTC epoch seconds,
+                       or a NumPy array of datetime64 values or of epoch seconds.
+                       Dates and datetime64 arrays with a unit of a day or longer are checked by day only.
+    :return: A boolean NumPy array, or a list of booleans if NumPy is not installed.
+    :raises LookupError: Empty Cron object.
+    :raises TypeError: Unsupported timestamp type.
+    """
+    if not cron.parts:
+        raise LookupError('No schedule found')
+    if np is None:
+        return _validate_python(cron, timestamps)
+    array = timestamps if isinstance(timestamps, np.ndarray) else _to_numpy(timestamps)
+    if array is None:
+        return np.array(_validate_python(cron, timestamps), dtype=bool)
+    return _validate_numpy(cron, array)
+
+
+def _to_numpy(timestamps: Sequence[Timestamp]) -> Optional['np.ndarray']:
+    """Converts a sequence made only of epoch seconds, or only of naive datetime objects, to a NumPy array."""
+    if not len(timestamps):
+        return None
+    if all(type(timestamp) is int for timestamp in timestamps):
+        return np.array(timestamps, dtype='int64')
+    if all(type(timestamp) is datetime and timestamp.tzinfo is None for timestamp in timestamps):
+        return np.array(timestamps, dtype='datetime64[m]')
+    return None
+
+
+def _validate_numpy(cron: 'Cron', array: 'np.ndarray') -> 'np.ndarray':
+    by_day = False
+    if array.dtype.kind == 'M':
+        by_day = np.datetime_data(array.dtype)[0] in ('Y', 'M', 'W', 'D')
+        minutes = array.astype('datetime64[m]').astype('int64')
+    elif array.dtype.kind in 'iu':
+        minutes = array.astype('int64') // 60
+    else:
+        raise TypeError(f'Unsupported timestamps array type {array.dtype}')
+    minute_part, hour_part, day_part, month_part, weekday_part = cron.parts
+    days = (minutes // 1440).astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    valid = _table(month_part)[months.astype('int64') % 12 + 1]
+    valid = valid & _table(day_part)[(days - months).astype('int64') + 1]
+    valid = valid & _table(weekday_part)[(days.astype('int64') + 4) % 7]
+    if not by_day:
+        valid = valid & _table(hour_part)[minutes // 60 % 24] & _table(minute_part)[minutes % 60]
+    return valid.astype(bool)
+
+
+def _validate_python(cron: 'Cron', timestamps: Iterable[Timestamp]) -> List[bool]:
+    minutes, hours, days, months, weekdays = (part.lookup_table() for part in cron.parts)
+    valid = []
+    for timestamp in timestamps:
+        if isinstance(timestamp, int):
+            day_number, minute = divmod(timestamp // 60, 1440)
+            year, month, day = civil_from_days(day_number)
+            hour, minute = divmod(minute, 60)
+            weekday = (day_number + 4) % 7
+        elif isinstance(timestamp, date):
+            year, month, day = timestamp.year, timestamp.month, timestamp.day
+            weekday = cron_weekday(year, month, day)
+            if isinstance(timestamp, datetime):
+                hour, minute = timestamp.hour, timestamp.minute
+            else:
+                hour, minute = -1, -1
+        else:
+            raise TypeError(f'Unsupported timestamp {timestamp!r}')
+        valid.append(bool(months[month] and days[day] and weekdays[weekday]
+                          and (hour < 0 or hours[hour] and minutes[minute])))
+    return valid
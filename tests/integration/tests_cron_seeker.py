@@ -6,7 +6,7 @@ from datetime import datetime
 from dateutil import tz
 from fixtures.valid_schedule_date import valid_schedules, valid_schedules_timezone
 
-from cron_converter.cron import Cron
+from cron_converter.cron import Cron, Seeker
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 logger = logging.getLogger("TestLog")
@@ -52,6 +52,39 @@ class SeekerTest(unittest.TestCase):
                 self.assertEqual(schedule.next().isoformat(), valid_schedule['next_next'],
                                  'Failed seeking the next next schedule date')
 
+    def test_engines_match(self):
+        schedules = [valid_schedule['schedule'] for valid_schedule in valid_schedules] + [
+            '0 0 29 2 *', '59 23 31 * 5', '*/7 1-4 */3 JAN-JUN/2 MON,THU', '30 2 * 3,10 0']
+        start_dates = [datetime.fromisoformat(valid_schedule['now']) for valid_schedule in valid_schedules]
+        start_dates.append(datetime(2021, 3, 28, 1, 59, tzinfo=tz.gettz('Europe/Rome')))
+        for cron_string in schedules:
+            for start_date in start_dates:
+                with self.subTest(schedule=cron_string, start_date=start_date):
+                    cron = Cron(cron_string)
+                    jump = cron.schedule(start_date)
+                    step = Seeker(cron, start_date, engine='step')
+                    for _ in range(3):
+                        self.assertEqual(jump.next().isoformat(), step.next().isoformat())
+                    for _ in range(6):
+                        self.assertEqual(jump.prev().isoformat(), step.prev().isoformat())
+
+    def test_epoch_like_seeker(self):
+        for valid_schedule in valid_schedules:
+            with self.subTest(schedule=valid_schedule):
+                cron = Cron(valid_schedule['schedule'])
+                now = datetime.fromisoformat(valid_schedule['now']).replace(tzinfo=tz.UTC)
+                timestamp = now.timestamp()
+                self.assertEqual(cron.next_epoch(timestamp),
+                                 datetime.fromisoformat(valid_schedule['next']).replace(tzinfo=tz.UTC).timestamp())
+                self.assertEqual(cron.prev_epoch(timestamp),
+                                 datetime.fromisoformat(valid_schedule['prev']).replace(tzinfo=tz.UTC).timestamp())
+
+    def test_sparse_schedule(self):
+        # 29 February on Monday: 2016 and then 2044
+        schedule = Cron('0 12 29 FEB MON').schedule(datetime(2016, 3, 1))
+        self.assertEqual(schedule.next().isoformat(), '2044-02-29T12:00:00')
+        self.assertEqual(schedule.prev().isoformat(), '2016-02-29T12:00:00')
+
     def test_timezone(self):
         for valid_schedule in valid_schedules_timezone:
             with self.subTest(range=valid_schedule):
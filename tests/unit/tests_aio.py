@@ -0,0 +1,144 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from cron_converter.aio import AsyncScheduler
+
+
+class FakeClock:
+    """A clock moving forward only when the scheduler sleeps."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+class AsyncSchedulerTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock(datetime(2024, 3, 19, 9, 58, 30))
+        self.scheduler = AsyncScheduler(clock=self.clock, sleep=self.clock.sleep)
+        self.runs = []
+
+    def record(self, name, stop_at=None):
+        async def callback(time):
+            self.runs.append((name, time))
+            if stop_at is not None and time >= stop_at:
+                self.scheduler.stop()
+        return callback
+
+    async def test_run(self):
+        self.scheduler.add('*/5 * * * *', self.record('report'), 'report')
+        self.scheduler.add('0 * * * *', self.record('hourly', stop_at=datetime(2024, 3, 19, 11, 0)), 'hourly')
+        await asyncio.wait_for(self.scheduler.run(), 5)
+        self.assertEqual(self.runs[:4], [
+            ('report', datetime(2024, 3, 19, 10, 0)), ('hourly', datetime(2024, 3, 19, 10, 0)),
+            ('report', datetime(2024, 3, 19, 10, 5)), ('report', datetime(2024, 3, 19, 10, 10)),
+        ])
+        self.assertEqual(len(self.runs), 13 + 2)
+        self.assertEqual(self.scheduler['report'].next_time, datetime(2024, 3, 19, 11, 5))
+
+    async def test_misfire(self):
+        async def jump(time):
+            self.clock.now += timedelta(hours=1)  # The clock jumps forward while the job runs
+
+        skip = self.scheduler.add('*/15 * * * *', self.record('skip'))
+        catch_up = self.scheduler.add('*/15 * * * *', self.record('catch_up'), misfire='catch_up', max_instances=10)
+        self.scheduler.add('0 10 * * *', jump)
+        self.scheduler.add('15 11 * * *', self.record('stop', stop_at=datetime(2024, 3, 19, 11, 15)))
+        await asyncio.wait_for(self.scheduler.run(), 5)
+        self.assertEqual([time for name, time in self.runs if name == 'skip'],
+                         [datetime(2024, 3, 19, 10, 0), datetime(2024, 3, 19, 11, 15)])
+        self.assertEqual([time.hour * 60 + time.minute for name, time in self.runs if name == 'catch_up'],
+                         [600, 615, 630, 645, 660, 675])
+        self.assertEqual((skip.dropped, catch_up.dropped), (1, 0))
+
+    async def test_max_instances(self):
+        release = asyncio.Event()
+
+        def slow(name):
+            async def callback(time):
+                self.runs.append((name, time))
+                await release.wait()
+            return callback
+
+        async def unblock(time):
+            release.set()
+
+        skip = self.scheduler.add('* * * * *', slow('skip'), max_instances=2)
+        catch_up = self.scheduler.add('* * * * *', slow('catch_up'), misfire='catch_up')
+        self.scheduler.add('5 10 * * *', unblock)
+        self.scheduler.add('20 10 * * *', self.record('stop', stop_at=datetime(2024, 3, 19, 10, 20)))
+        await asyncio.wait_for(self.scheduler.run(), 5)
+        self.assertEqual((skip.running, catch_up.running), (0, 0))
+        # The runs of 10:01 to 10:05 found 2 runs in progress
+        self.assertEqual([time.hour * 60 + time.minute for name, time in self.runs if name == 'skip'],
+                         [599, 600] + list(range(606, 621)))
+        self.assertEqual(skip.dropped, 5)
+        # The runs of 10:00 to 10:05 waited for the first one, then ran one after another
+        self.assertEqual([time.hour * 60 + time.minute for name, time in self.runs if name == 'catch_up'],
+                         list(range(599, 621)))
+        self.assertEqual(catch_up.dropped, 0)
+
+    async def test_add_remove(self):
+        async def add(time):
+            self.scheduler.add('* * * * *', self.record('added'), 'added', max_instances=10, misfire='catch_up')
+
+        async def remove(time):
+            self.scheduler.remove('added')
+
+        self.scheduler.add('0 10 * * *', add)
+        self.scheduler.add('3 10 * * *', remove)
+        self.scheduler.add('5 10 * * *', self.record('stop', stop_at=datetime(2024, 3, 19, 10, 5)))
+        await asyncio.wait_for(self.scheduler.run(), 5)
+        self.assertEqual([time.minute for name, time in self.runs if name == 'added'], [0, 1, 2, 3])
+        self.assertNotIn('added', self.scheduler)
+        self.assertEqual(len(self.scheduler), 3)
+        with self.assertRaises(ValueError):
+            self.scheduler.add('* * * * *', add, 0)
+        with self.assertRaises(ValueError):
+            self.scheduler.add('* * * * *', add, misfire='never')
+        with self.assertRaises(ValueError):
+            self.scheduler.add('* * * * *', add, max_instances=0)
+        with self.assertRaises(KeyError):
+            self.scheduler.remove('added')
+
+    async def test_cancel(self):
+        started = asyncio.Event()
+
+        async def forever(time):
+            started.set()
+            await asyncio.Event().wait()
+
+        self.scheduler.add('* * * * *', forever, max_instances=1)
+        task = asyncio.ensure_future(self.scheduler.run())
+        await asyncio.wait_for(started.wait(), 5)
+        running = set(self.scheduler._tasks)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        self.assertTrue(all(run.cancelled() for run in running))
+
+    async def test_callback_error(self):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context['exception']))
+
+        async def fail(time):
+            raise RuntimeError('failed')
+
+        self.scheduler.add('* * * * *', fail)
+        self.scheduler.add('2 10 * * *', self.record('stop', stop_at=datetime(2024, 3, 19, 10, 2)))
+        await asyncio.wait_for(self.scheduler.run(), 5)
+        self.assertEqual(len(errors), 4)
+        self.assertIsInstance(errors[0], RuntimeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from dateutil import tz
+
+from cron_converter import Cron, CronIndex, LoadAnalyzer, analysis
+
+SCHEDULES = ['*/15 9-17 * * 1-5', '0 0 29 2 *', '5,35 */2 * * *', '0 12 * JAN-JUN MON', '10-20 3 15 * *',
+             '* * * * *', '59 23 31 12 6', '0 0 1 1 0', '*/15 9-17 * * 1-5', '0 12 * * 1']
+START = datetime(2024, 2, 26, 7, 30, 20)
+
+
+class LoadAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = LoadAnalyzer([Cron(SCHEDULES[0])] + SCHEDULES[1:])
+        self.index = CronIndex(SCHEDULES)
+
+    def test_add(self):
+        self.assertEqual(len(self.analyzer), 10)
+        self.assertEqual(self.analyzer.add('0 12 * * *'), 10)
+        self.assertEqual(self.analyzer.contributors(datetime(2024, 3, 4, 12, 0)), [0, 3, 5, 8, 9, 10])
+        with self.assertRaises(ValueError):
+            self.analyzer.add('0 12 * *')
+
+    def test_histogram(self):
+        end = START + timedelta(days=5)
+        times = [datetime(2024, 2, 26, 7, 31) + timedelta(minutes=minute) for minute in range(5 * 1440)]
+        expected = [len(self.index.match(time)) for time in times]
+        self.assertEqual(self.analyzer.histogram(START, end).tolist(), expected)
+        with mock.patch.object(analysis, 'np', None):
+            self.assertEqual(LoadAnalyzer(SCHEDULES).histogram(START, end), expected)
+
+    def test_histogram_empty(self):
+        self.assertEqual(len(self.analyzer.histogram(START, START)), 0)
+        self.assertEqual(LoadAnalyzer().histogram(START, START + timedelta(hours=1)).tolist(), [0] * 60)
+        with mock.patch.object(analysis, 'np', None):
+            self.assertEqual(self.analyzer.histogram(START, START - timedelta(days=1)), [])
+            self.assertEqual(LoadAnalyzer().histogram(START, START + timedelta(hours=1)), [0] * 60)
+
+    def test_histogram_aware(self):
+        start = START.replace(tzinfo=tz.gettz('Europe/Rome'))
+        end = datetime(2024, 2, 26, 11, 30, tzinfo=tz.UTC)
+        self.assertEqual(self.analyzer.histogram(start, end).tolist(),
+                         self.analyzer.histogram(START, datetime(2024, 2, 26, 12, 30)).tolist())
+
+    def test_peaks(self):
+        end = START + timedelta(days=7)
+        peaks = self.analyzer.peaks(START, end, k=3)
+        self.assertEqual(peaks, [
+            (datetime(2024, 2, 26, 12, 0), 5, [0, 3, 5, 8, 9]),
+            (datetime(2024, 2, 26, 9, 0), 3, [0, 5, 8]),  # The earliest first among equal loads
+            (datetime(2024, 2, 26, 9, 15), 3, [0, 5, 8]),
+        ])
+        for peak in peaks:
+            self.assertEqual(peak.cron_ids, self.index.match(peak.time))
+        with mock.patch.object(analysis, 'np', None):
+            self.assertEqual(LoadAnalyzer(SCHEDULES).peaks(START, end, k=3), peaks)
+            with self.assertRaises(ValueError):
+                LoadAnalyzer(SCHEDULES).peaks(START, end, k=-1)
+        self.assertEqual(self.analyzer.peaks(START, end, k=0), [])
+        with self.assertRaises(ValueError):
+            self.analyzer.peaks(START, end, k=-1)
+
+    def test_peaks_idle(self):
+        analyzer = LoadAnalyzer(['0 0 29 2 *'])
+        self.assertEqual(analyzer.peaks(START, START + timedelta(days=1)), [])
+        peaks = analyzer.peaks(START, START + timedelta(days=7), k=2)
+        self.assertEqual(peaks, [analysis.Peak(datetime(2024, 2, 29, 0, 0), 1, [0])])
+
+
+if __name__ == '__main__':
+    unittest.main()
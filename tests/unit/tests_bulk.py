@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from cron_converter import Cron, bulk
+
+SCHEDULES = ['*/15 9-17 * * 1-5', '0 0 29 2 *', '5,35 */2 * * *', '0 12 * JAN-JUN MON', '10-20 3 15 * *', '@ * * * *']
+
+
+@mock.patch.object(bulk, 'MIN_PARALLEL', 0)
+class BulkTest(unittest.TestCase):
+
+    def test_parse_many(self):
+        cron_strings = SCHEDULES[:-1] * 10
+        options = {'output_weekday_names': True, 'output_month_names': True}
+        for workers in (None, 1, 3):
+            with self.subTest(workers=workers):
+                crons = bulk.parse_many(cron_strings, options, workers=workers)
+                self.assertEqual([cron.to_string() for cron in crons],
+                                 [Cron(cron_string, options).to_string() for cron_string in cron_strings])
+                self.assertFalse(crons[0].frozen)
+
+    def test_parse_many_error(self):
+        for workers in (None, 2):
+            with self.subTest(workers=workers):
+                with self.assertRaises(ValueError):
+                    bulk.parse_many(SCHEDULES, workers=workers)
+
+    def test_expand_many(self):
+        crons = [Cron(cron_string) for cron_string in SCHEDULES[:-1] * 3]
+        start, end = datetime(2024, 2, 26), datetime(2024, 3, 4)
+        serial = bulk.expand_many(crons, start, end)
+        parallel = bulk.expand_many(crons, start, end, workers=2)
+        self.assertEqual([list(times) for times in parallel], [list(times) for times in serial])
+        self.assertEqual(len(serial[1]), 1)
+
+    def test_format_many(self):
+        names = {'output_weekday_names': True, 'output_month_names': True}
+        crons = [Cron(cron_string, options) for cron_string in SCHEDULES[:-1] for options in (None, names)] * 2
+        self.assertEqual(bulk.format_many(crons), [cron.to_string() for cron in crons])
+        self.assertEqual(bulk.format_many(crons)[6:8], ['0 12 * 1-6 1', '0 12 * JAN-JUN MON'])
+
+    def test_pack_many(self):
+        crons = [Cron(cron_string) for cron_string in SCHEDULES[:-1]]
+        data = bulk.pack_many(crons)
+        self.assertEqual(len(data), 5 * 17)
+        self.assertEqual(bulk.unpack_many(data), crons)
+        self.assertEqual(bulk.unpack_many(bytearray(data)), crons)
+        self.assertEqual(bulk.unpack_many(b''), [])
+        with self.assertRaises(ValueError):
+            bulk.unpack_many(data[:-1])
+
+    def test_small_input(self):
+        with mock.patch.object(bulk, 'MIN_PARALLEL', 100), mock.patch.object(bulk, 'ProcessPoolExecutor') as pool:
+            self.assertEqual(len(bulk.parse_many(SCHEDULES[:-1], workers=4)), 5)
+            pool.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from cron_converter.sub_modules.cache import CacheInfo, LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_get_or_create(self):
+        cache = LRUCache(maxsize=2)
+        self.assertEqual(cache.get_or_create('a', lambda: 1), 1)
+        self.assertEqual(cache.get_or_create('a', lambda: 2), 1)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=2, currsize=1))
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.get_or_create('a', lambda: 1)
+        cache.get_or_create('b', lambda: 2)
+        cache.get_or_create('a', lambda: 1)  # 'b' is now the least recently used
+        cache.get_or_create('c', lambda: 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+
+    def test_errors_not_cached(self):
+        cache = LRUCache()
+
+        def fail():
+            raise ValueError('Invalid')
+        with self.assertRaises(ValueError):
+            cache.get_or_create('a', fail)
+        self.assertNotIn('a', cache)
+
+    def test_disabled(self):
+        cache = LRUCache(maxsize=0)
+        cache.get_or_create('a', lambda: 1)
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=-1)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.get_or_create('a', lambda: 1)
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=0, maxsize=128, currsize=0))
@@ -0,0 +1,58 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from dateutil import tz
+
+from cron_converter import Cron
+from cron_converter.compiled import CompiledCron
+
+
+class CompiledCronTest(unittest.TestCase):
+
+    def test_source(self):
+        source = Cron('*/15 9-17 * * 1-5').compile().source
+        self.assertIn('x % 15 == 0', source)
+        self.assertIn('9 <= x <= 17', source)
+        self.assertIn('1 <= x <= 5', source)
+        self.assertNotIn('d.day', source)
+        self.assertNotIn('d.month', source)
+        self.assertIn('3 <= x <= 27 and x % 4 == 3', Cron('0 0 3-27/4 * *').compile().source)
+        self.assertIn('>> x & 1', Cron('0 0 1,5,9,20-22 * *').compile().source)
+        self.assertEqual(Cron('* * * * *').compile().source.count('return'), 2)
+
+    def test_like_validate(self):
+        cron_strings = ['*/15 9-17 * * 1-5', '0 0 1,15,20-22,25 * *', '5 4 * * SUN', '* * * * *',
+                        '1,3,5,7,9 2-4 */10 JAN,MAR-MAY 0,6', '7-59/13 */5 3-27/4 2-11/3 *']
+        for cron_string in cron_strings:
+            cron = Cron(cron_string)
+            compiled = cron.compile()
+            for minute in range(0, 60 * 24 * 366, 101):
+                date_time = datetime(2024, 1, 1) + timedelta(minutes=minute)
+                with self.subTest(cron_string=cron_string, date_time=date_time):
+                    self.assertEqual(compiled(date_time), cron.validate(date_time))
+                    self.assertEqual(compiled.matches(date_time), cron.validate(date_time))
+                    self.assertEqual(compiled(date_time.date()), cron.validate(date_time.date()))
+
+    def test_date(self):
+        compiled = Cron('0 12 * * 1-5').compile()
+        self.assertTrue(compiled(date(2024, 3, 19)))
+        self.assertFalse(compiled(date(2024, 3, 23)))
+
+    def test_next_after(self):
+        compiled = Cron('*/15 9-17 * * 1-5').compile()
+        self.assertEqual(compiled.next_after(datetime(2024, 3, 19, 9, 15)), datetime(2024, 3, 19, 9, 30))
+        self.assertEqual(compiled.next_after(datetime(2024, 3, 19, 9, 14, 59)), datetime(2024, 3, 19, 9, 15))
+        self.assertEqual(compiled.next_after(datetime(2024, 3, 22, 17, 45)), datetime(2024, 3, 25, 9, 0))
+        rome = tz.gettz('Europe/Rome')
+        self.assertEqual(compiled.next_after(datetime(2024, 3, 19, 9, 15, tzinfo=rome)).isoformat(),
+                         '2024-03-19T09:30:00+01:00')
+        with self.assertRaises(Exception):
+            Cron('0 0 30 2 *').compile().next_after(datetime(2024, 1, 1))
+
+    def test_cached(self):
+        compiled = Cron('*/15 9-17 * * 1-5').compile()
+        self.assertIsInstance(compiled, CompiledCron)
+        self.assertIs(Cron('0-59/15 9-17 * * MON-FRI').compile(), compiled)
+        self.assertEqual(repr(compiled), "CompiledCron('*/15 9-17 * * 1-5')")
+        with self.assertRaises(LookupError):
+            Cron().compile()
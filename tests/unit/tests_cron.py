@@ -1,6 +1,12 @@
+import copy
+import pickle
 import unittest
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
+from dateutil import tz
+
+from cron_converter import CronParseError
 from cron_converter.cron import Cron
 
 
@@ -91,3 +97,221 @@ class CronTest(unittest.TestCase):
         self.assertTrue((datetime(2024, 3, 19, 1, 55)) in Cron('* 1 19 3 2'))
         self.assertFalse((datetime(2024, 4, 19, 1, 55)) in Cron('* 1 19 3 2'))
         self.assertTrue((datetime(2024, 3, 19, 15, 55) in Cron('*/5 9-17/2 * 1-3 1-5')))
+
+    def test_validate_many(self):
+        cron = Cron('*/5 9-17/2 * 1-3 1-5')
+        timestamps = [datetime(2024, 3, 19, 15, 55), datetime(2024, 3, 19, 15, 56), date(2024, 3, 19),
+                      date(2024, 3, 24), 1710863700]  # 2024-03-19T15:55:00Z
+        self.assertEqual(list(cron.validate_many(timestamps)), [True, False, True, False, True])
+        self.assertEqual(list(cron.validate_many([1710863700, 1710863759, 1710863760])), [True, True, False])
+        self.assertEqual(len(cron.validate_many([])), 0)
+        with self.assertRaises(TypeError):
+            cron.validate_many(['2024-03-19'])
+
+    def test_from_cached(self):
+        Cron.parse_cache.clear()
+        cron1 = Cron.from_cached('*/5 9-17/2 * 1-3 1-5')
+        cron2 = Cron.from_cached(' */5  9-17/2 * 1-3 1-5 ')
+        cron3 = Cron.from_cached('*/5 9-17/2 * 1-3 1-5', {'output_weekday_names': True})
+        self.assertEqual(Cron.parse_cache.info().hits, 1)
+        self.assertEqual(Cron.parse_cache.info().misses, 2)
+        self.assertIs(cron1.parts[0], cron2.parts[0])
+        self.assertIsNot(cron1.parts, cron2.parts)
+        self.assertTrue(cron1.parts[0].frozen)
+        self.assertEqual(cron1.to_string(), '*/5 9-17/2 * 1-3 1-5')
+        self.assertEqual(cron3.to_string(), '*/5 9-17/2 * 1-3 MON-FRI')
+        with self.assertRaises(ValueError):
+            Cron.from_cached('* * * *')
+        with self.assertRaises(TypeError):
+            Cron.from_cached(None)
+
+    def test_freeze(self):
+        cron = Cron('*/5 9-17/2 * 1-3 1-5')
+        self.assertIs(cron.freeze(), cron)
+        self.assertTrue(cron.frozen)
+        self.assertTrue(all(part.frozen for part in cron.parts))
+        with self.assertRaises(AttributeError):
+            cron.from_string('* * * * *')
+        with self.assertRaises(AttributeError):
+            cron.from_list([[0], [0], [1], [1], [0]])
+        with self.assertRaises(AttributeError):
+            cron.unknown_attribute = True
+        with self.assertRaises(LookupError):
+            Cron().freeze()
+
+    def test_pickle_frozen(self):
+        cached = Cron.from_cached('*/5 9-17/2 * 1-3 1-5', {'output_weekday_names': True})
+        self.assertEqual(pickle.loads(pickle.dumps(cached)).parts, cached.parts)
+        cron = cached.freeze()
+        for other in (pickle.loads(pickle.dumps(cron)), copy.deepcopy(cron)):
+            self.assertEqual(other, cron)
+            self.assertEqual(hash(other), hash(cron))
+            self.assertEqual(other.to_string(), '*/5 9-17/2 * 1-3 MON-FRI')
+            self.assertTrue(other.frozen and all(part.frozen for part in other.parts))
+            with self.assertRaises(TypeError):
+                other.options['output_weekday_names'] = False
+        other = pickle.loads(pickle.dumps(Cron('0 12 * * *')))
+        self.assertFalse(other.frozen)
+        other.from_string('0 0 * * *')
+        self.assertEqual(other.to_string(), '0 0 * * *')
+
+    def test_parse_twice(self):
+        cron = Cron('30 9 * * *')
+        cron.from_string('0 0 1 * *')
+        self.assertEqual((len(cron.parts), cron.to_string()), (5, '0 0 1 * *'))
+        cron.from_list([[5], [6], [7], [8], [1]])
+        self.assertEqual((len(cron.parts), cron.to_string()), (5, '5 6 7 8 1'))
+        cron.from_masks(Cron('*/15 * * * *').to_masks())
+        self.assertEqual((len(cron.parts), cron.to_string()), (5, '*/15 * * * *'))
+
+    def test_parse_error(self):
+        with self.assertRaises(CronParseError) as error:
+            Cron('  0  9 * 1,mon *')
+        self.assertEqual(str(error.exception), "Invalid value 'mon' for 'month'")
+        self.assertEqual((error.exception.text, error.exception.position), ('  0  9 * 1,mon *', 11))
+        with self.assertRaises(CronParseError) as error:
+            Cron('0 9 * * * *')
+        self.assertEqual(error.exception.position, 10)
+        with self.assertRaises(CronParseError) as error:
+            Cron('0 9 * ')
+        self.assertEqual(error.exception.position, 6)
+
+    def test_operators(self):
+        team = Cron('*/15 9-17 * * 1-5')
+        window = Cron('0-30 12-23 * * *')
+        self.assertEqual((team & window).to_string(), '0-30/15 12-17 * * 1-5')
+        self.assertEqual((team | Cron('*/15 9-17 * * 6')).to_string(), '*/15 9-17 * * 1-6')
+        self.assertEqual((team - Cron('* 12 * * *')).to_string(), '*/15 9-11,13-17 * * 1-5')
+        self.assertEqual((team - Cron('* * * * 0')).to_string(), '*/15 9-17 * * 1-5')  # Nothing in common
+        self.assertTrue((team & window).issubset(team))
+        self.assertFalse(team.issubset(window))
+        with self.assertRaises(ValueError):
+            team | window
+        with self.assertRaises(ValueError):
+            team - window
+        with self.assertRaises(ValueError):
+            team - Cron('* * * * *')
+        with self.assertRaises(ValueError):
+            team & Cron('* * * * 0')
+
+    def test_overlaps(self):
+        self.assertTrue(Cron('0 0 29 2 *').overlaps(Cron('* * * * 1')))
+        self.assertTrue(Cron('0 0 31 * *').overlaps(Cron('0 0 * 1-3 *')))
+        self.assertFalse(Cron('0 0 31 * *').overlaps(Cron('0 0 * 2,4 *')))
+        self.assertFalse(Cron('*/2 * * * *').overlaps(Cron('1-59/2 * * * *')))
+
+    def test_count_between(self):
+        cron = Cron('*/15 9-17 * * 1-5')
+        start, end = datetime(2024, 3, 19, 10, 20, 30), datetime(2024, 4, 19)
+        self.assertEqual(cron.count_between(start, end), len(cron.schedule(start).between(start, end)))
+        self.assertEqual(cron.count_between(datetime(2024, 1, 1), datetime(2025, 1, 1)), 262 * 9 * 4)
+        rome = tz.gettz('Europe/Rome')
+        self.assertEqual(cron.count_between(datetime(2024, 3, 19, 9, tzinfo=rome),
+                                            datetime(2024, 3, 19, 9, tzinfo=tz.UTC)), 4)
+        self.assertEqual(cron.count_between(end, start), 0)
+
+    def test_intervals(self):
+        cron = Cron('0 9,17 * * 1-5')
+        self.assertEqual((cron.min_interval(), cron.max_interval()), (timedelta(hours=8), timedelta(hours=64)))
+        self.assertEqual(Cron('* * * * *').max_interval(), timedelta(minutes=1))
+        with self.assertRaises(Exception):
+            Cron('0 0 31 4 *').min_interval()
+
+    def test_next_after_prev_before(self):
+        cron = Cron('30 9 * * *')
+        self.assertEqual(cron.next_after(datetime(2024, 3, 19, 9, 29, 59)), datetime(2024, 3, 19, 9, 30))
+        # Strictly after and before
+        self.assertEqual(cron.next_after(datetime(2024, 3, 19, 9, 30)), datetime(2024, 3, 20, 9, 30))
+        self.assertEqual(cron.prev_before(datetime(2024, 3, 19, 9, 30)), datetime(2024, 3, 18, 9, 30))
+        self.assertEqual(cron.next_after(datetime(2024, 3, 19, 9, 30, 20)), datetime(2024, 3, 20, 9, 30))
+        self.assertEqual(cron.prev_before(datetime(2024, 3, 19, 9, 30, 20)), datetime(2024, 3, 19, 9, 30))
+        rome = tz.gettz('Europe/Rome')
+        # 2024-10-27T02:30+01:00 is the second 02:30, after the end of DST
+        repeated = datetime(2024, 10, 27, 2, 30, tzinfo=rome, fold=1)
+        result = Cron('*/20 2 * * *').next_after(repeated, on_repeated='both')
+        self.assertEqual((result.isoformat(), result.fold), ('2024-10-27T02:40:00+01:00', 1))
+        result = Cron('*/20 2 * * *').prev_before(repeated, on_repeated='both')
+        self.assertEqual((result.isoformat(), result.fold), ('2024-10-27T02:20:00+01:00', 1))
+        # The first 02:30 (+02:00) is strictly before the second one
+        result = Cron('30 2 * * *').prev_before(repeated, on_repeated='both')
+        self.assertEqual((result.isoformat(), result.fold), ('2024-10-27T02:30:00+02:00', 0))
+        # The times after the repeated hour are not ambiguous
+        result = Cron('30 3 * * *').next_after(repeated)
+        self.assertEqual((result.isoformat(), result.fold), ('2024-10-27T03:30:00+01:00', 0))
+        # With the 'first' policy, the first 02:40 (+02:00) is before the second 02:30
+        result = Cron('*/20 2 * * *').next_after(repeated)
+        self.assertEqual((result.isoformat(), result.fold), ('2024-10-28T02:00:00+01:00', 0))
+        with self.assertRaises(LookupError):
+            Cron().next_after(datetime(2024, 3, 19))
+
+    def test_threads(self):
+        cron = Cron('*/7 9-17 * * 1-5')
+        starts = [datetime(2024, 3, 19) + timedelta(minutes=13 * i) for i in range(2000)]
+        expected = [(cron.next_after(start), cron.prev_before(start)) for start in starts]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda start: (cron.next_after(start), cron.prev_before(start)), starts))
+        self.assertEqual(results, expected)
+
+    def test_hash(self):
+        with self.assertRaises(TypeError):
+            hash(Cron('* * * * *'))
+        schedules = {Cron('*/5 9-17 * * 1-5').freeze(), Cron('0-59/5 9-17 * * MON-FRI').freeze(),
+                     Cron('0 * * * *').freeze()}
+        self.assertEqual(len(schedules), 2)
+        self.assertIn(Cron('0 * * * *').freeze(), schedules)
+        self.assertEqual(Cron('0 * * * *').freeze(), Cron('0 * * * *'))
+        self.assertTrue(Cron('0 1-15 * * 1-5').freeze() > Cron('0 1-14 * * 1-5').freeze())
+
+    def test_from_masks_to_masks(self):
+        cron = Cron('*/15 9-17 * * 1-5')
+        masks = cron.to_masks()
+        self.assertEqual(masks[0], 1 | 1 << 15 | 1 << 30 | 1 << 45)
+        other = Cron()
+        other.from_masks(masks)
+        self.assertEqual(other.to_string(), '*/15 9-17 * * 1-5')
+        with self.assertRaises(ValueError):
+            Cron().from_masks(masks[:4])
+        with self.assertRaises(ValueError):
+            Cron().from_masks((1, 1, 1, 1, 0))
+        with self.assertRaises(ValueError):
+            Cron().from_masks((1, 1, 1, 1, 1 << 7))
+        with self.assertRaises(ValueError):
+            Cron().from_masks((1, 1, 1 << 0, 1 << 1, 1))
+        with self.assertRaises(LookupError):
+            Cron().to_masks()
+
+    def test_from_bytes_to_bytes(self):
+        for cron_string in ['* * * * *', '0 0 1 1 0', '59 23 31 12 6', '*/7 3-5 2,31 2,12 6']:
+            with self.subTest(schedule=cron_string):
+                data = Cron(cron_string).to_bytes()
+                self.assertEqual(len(data), 17)
+                other = Cron()
+                other.from_bytes(data)
+                self.assertEqual(other.to_string(), cron_string)
+        self.assertEqual(Cron('0 0 1 1 0').to_bytes(),
+                         (1 | 1 << 60 | 1 << 84 | 1 << 115 | 1 << 127).to_bytes(17, 'little'))
+        with self.assertRaises(ValueError):
+            Cron().from_bytes(b'\x01' * 16)
+        with self.assertRaises(ValueError):
+            Cron().from_bytes(b'\xff' * 17)
+        with self.assertRaises(ValueError):
+            Cron().from_bytes(bytes(17))
+        with self.assertRaises(LookupError):
+            Cron().to_bytes()
+
+    def test_next_prev_epoch(self):
+        cron = Cron('15 10 * * 1-5')
+        # 2024-03-19T09:00:00Z, a Tuesday
+        self.assertEqual(cron.next_epoch(1710838800), 1710843300)
+        self.assertEqual(cron.prev_epoch(1710838800), 1710756900)
+        # The start is included, rounded up to the minute
+        self.assertEqual(cron.next_epoch(1710843300), 1710843300)
+        self.assertEqual(cron.next_epoch(1710843299.5), 1710843300)
+        self.assertEqual(cron.prev_epoch(1710843300), 1710756900)
+        self.assertEqual(cron.prev_epoch(1710843300.5), 1710843300)
+        self.assertEqual(cron.next_epoch(1710838800 // 60, minutes=True), 1710843300 // 60)
+        self.assertEqual(cron.prev_epoch(1710838800 // 60, minutes=True), 1710756900 // 60)
+        with self.assertRaises(LookupError):
+            Cron().next_epoch(0)
+        with self.assertRaises(Exception):
+            Cron('0 0 30 2 *').prev_epoch(0)
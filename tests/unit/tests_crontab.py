@@ -0,0 +1,98 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from cron_converter import Cron
+from cron_converter.crontab import parse_crontab
+
+CRONTAB = """\
+# Backups
+SHELL=/bin/bash
+MAILTO="ops@example.com"
+
+*/5 9-17 * * 1-5 /usr/bin/report --daily > /dev/null 2>&1
+@daily /usr/bin/backup
+@reboot /usr/bin/start
+61 * * * * /usr/bin/broken
+@sometimes /usr/bin/unknown
+0 0 * *
+PATH = /usr/bin
+0 12 1 JAN * echo "happy new year"
+"""
+
+
+class CrontabTest(unittest.TestCase):
+
+    def test_entries(self):
+        entries = list(parse_crontab(CRONTAB.splitlines()))
+        self.assertEqual([entry.line_number for entry in entries], [5, 6, 7, 8, 9, 10, 12])
+        report, backup, start, broken, unknown, short, new_year = entries
+        self.assertEqual(report.cron, Cron('*/5 9-17 * * 1-5'))
+        self.assertEqual(report.command, '/usr/bin/report --daily > /dev/null 2>&1')
+        self.assertTrue(report.cron.frozen)
+        self.assertTrue(report.valid)
+        self.assertEqual(backup.cron, Cron('0 0 * * *'))
+        self.assertEqual(backup.macro, '@daily')
+        self.assertIsNone(start.cron)
+        self.assertEqual(start.macro, '@reboot')
+        self.assertTrue(start.valid)
+        self.assertEqual(new_year.command, 'echo "happy new year"')
+
+    def test_errors(self):
+        broken, unknown, short = list(parse_crontab(CRONTAB.splitlines()))[3:6]
+        self.assertEqual(str(broken.error), "Value 61 out of range for 'minute'")
+        self.assertFalse(broken.valid)
+        self.assertEqual(broken.command, '/usr/bin/broken')
+        self.assertEqual(str(unknown.error), "Unknown crontab macro '@sometimes'")
+        self.assertEqual(str(short.error), 'Invalid crontab line, expected a schedule and a command')
+        self.assertIsNone(short.cron)
+
+    def test_environment(self):
+        entries = list(parse_crontab(CRONTAB.splitlines()))
+        self.assertEqual(dict(entries[0].environment), {'SHELL': '/bin/bash', 'MAILTO': 'ops@example.com'})
+        self.assertIs(entries[0].environment, entries[5].environment)
+        self.assertEqual(entries[-1].environment['PATH'], '/usr/bin')
+        self.assertNotIn('PATH', entries[0].environment)
+        with self.assertRaises(TypeError):
+            entries[0].environment['PATH'] = '/bin'
+
+    def test_pickle(self):
+        entries = list(parse_crontab(CRONTAB.splitlines()))
+        copies = pickle.loads(pickle.dumps(entries))
+        self.assertEqual([(entry.cron, entry.command, dict(entry.environment), str(entry.error)) for entry in copies],
+                         [(entry.cron, entry.command, dict(entry.environment), str(entry.error)) for entry in entries])
+        self.assertTrue(copies[0].cron.frozen)
+
+    def test_system(self):
+        lines = ['17 * * * * root cd / && run-parts /etc/cron.hourly',
+                 '@weekly nobody /usr/bin/clean',
+                 '0 0 * * * root']
+        hourly, weekly, missing = parse_crontab(lines, system=True)
+        self.assertEqual((hourly.user, hourly.command), ('root', 'cd / && run-parts /etc/cron.hourly'))
+        self.assertEqual((weekly.user, weekly.command, weekly.cron), ('nobody', '/usr/bin/clean', Cron('0 0 * * 0')))
+        self.assertEqual(str(missing.error), 'Invalid crontab line, expected a schedule and a user and a command')
+
+    def test_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.crontab', delete=False) as file:
+            file.write(CRONTAB)
+        try:
+            self.assertEqual([entry[:3] for entry in parse_crontab(file.name)],
+                             [entry[:3] for entry in parse_crontab(CRONTAB.splitlines())])
+            with open(file.name) as crontab_file:
+                self.assertEqual(len(list(parse_crontab(crontab_file))), 7)
+        finally:
+            os.remove(file.name)
+
+    def test_workers(self):
+        lines = CRONTAB.splitlines() * 50
+        serial = list(parse_crontab(lines))
+        parallel = list(parse_crontab(lines, workers=2, chunk_size=16))
+        self.assertEqual(len(parallel), 350)
+        self.assertEqual([entry._replace(error=str(entry.error)) for entry in parallel],
+                         [entry._replace(error=str(entry.error)) for entry in serial])
+        self.assertTrue(all(entry.cron.frozen for entry in parallel if entry.cron is not None))
+
+
+if __name__ == '__main__':
+    unittest.main()
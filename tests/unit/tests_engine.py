@@ -0,0 +1,90 @@
+import unittest
+from datetime import date, timedelta
+
+from cron_converter.cron import Cron
+from cron_converter.sub_modules import engine
+
+
+def to_masks(cron_string):
+    return tuple(part.mask for part in Cron(cron_string).parts)
+
+
+class EngineTest(unittest.TestCase):
+
+    def test_next_bit(self):
+        self.assertEqual(engine.next_bit(0b10100, 0), 2)
+        self.assertEqual(engine.next_bit(0b10100, 3), 4)
+        self.assertEqual(engine.next_bit(0b10100, 5), -1)
+        self.assertEqual(engine.next_bit(0, 0), -1)
+
+    def test_prev_bit(self):
+        self.assertEqual(engine.prev_bit(0b10100, 10), 4)
+        self.assertEqual(engine.prev_bit(0b10100, 3), 2)
+        self.assertEqual(engine.prev_bit(0b10100, 1), -1)
+        self.assertEqual(engine.prev_bit(0b10100, -1), -1)
+
+    def test_civil_days(self):
+        epoch = date(1970, 1, 1)
+        for days in range(-800, 800000, 997):
+            day = epoch + timedelta(days=days)
+            self.assertEqual(engine.days_from_civil(day.year, day.month, day.day), days)
+            self.assertEqual(engine.civil_from_days(days), (day.year, day.month, day.day))
+            self.assertEqual(engine.cron_weekday(day.year, day.month, day.day), day.isoweekday() % 7)
+
+    def test_month_days_mask(self):
+        # Fridays of March 2024: 1, 8, 15, 22 and 29
+        masks = to_masks('* * * * FRI')
+        self.assertEqual(engine.month_days_mask(masks, 2024, 3), 1 << 1 | 1 << 8 | 1 << 15 | 1 << 22 | 1 << 29)
+        masks = to_masks('* * 31 * *')
+        self.assertEqual(engine.month_days_mask(masks, 2024, 4), 0)
+
+    def test_find_next(self):
+        masks = to_masks('0 0 29 2 *')
+        self.assertEqual(engine.find_next(masks, 2021, 3, 1, 0, 0), (2024, 2, 29, 0, 0))
+        masks = to_masks('59 23 31 * 5')
+        self.assertEqual(engine.find_next(masks, 2021, 1, 1, 0, 0), (2021, 12, 31, 23, 59))
+        masks = to_masks('*/15 * * * *')
+        self.assertEqual(engine.find_next(masks, 2021, 12, 31, 23, 46), (2022, 1, 1, 0, 0))
+
+    def test_find_prev(self):
+        masks = to_masks('0 0 29 2 *')
+        self.assertEqual(engine.find_prev(masks, 2024, 2, 28, 23, 59), (2020, 2, 29, 0, 0))
+        masks = to_masks('*/15 * * * *')
+        self.assertEqual(engine.find_prev(masks, 2022, 1, 1, 0, 14), (2022, 1, 1, 0, 0))
+        self.assertEqual(engine.find_prev(masks, 2021, 1, 1, 0, 0), (2021, 1, 1, 0, 0))
+
+    def test_find_impossible(self):
+        masks = to_masks('* * 30 2 *')
+        self.assertIsNone(engine.find_next(masks, 2021, 1, 1, 0, 0))
+        self.assertIsNone(engine.find_prev(masks, 2021, 1, 1, 0, 0))
+
+    def test_can_match(self):
+        self.assertTrue(engine.can_match(to_masks('0 0 29 2 1')))
+        self.assertTrue(engine.can_match(to_masks('0 0 30,31 2,4 *')))
+        self.assertFalse(engine.can_match(to_masks('* * 30 2 *')))
+        self.assertFalse(engine.can_match(to_masks('* * 31 2,4,6,9,11 *')))
+        self.assertFalse(engine.can_match((1, 1, 0b10, 0b10, 0)))
+
+    def test_find_limit_year(self):
+        masks = to_masks('0 0 29 2 *')
+        self.assertIsNone(engine.find_next(masks, 2021, 1, 1, 0, 0, limit_year=2023))
+        self.assertEqual(engine.find_next(masks, 2021, 1, 1, 0, 0, limit_year=2024), (2024, 2, 29, 0, 0))
+        self.assertIsNone(engine.find_prev(masks, 2021, 1, 1, 0, 0, limit_year=2021))
+
+    def test_iter_next(self):
+        masks = to_masks('58,59 22,23 31 * *')
+        found = engine.iter_next(masks, 2021, 12, 31, 22, 59)
+        self.assertEqual([next(found) for _ in range(4)],
+                         [(2021, 12, 31, 22, 59), (2021, 12, 31, 23, 58), (2021, 12, 31, 23, 59),
+                          (2022, 1, 31, 22, 58)])
+
+    def test_iter_prev(self):
+        masks = to_masks('0,1 0,1 1 * *')
+        found = engine.iter_prev(masks, 2022, 1, 1, 1, 0)
+        self.assertEqual([next(found) for _ in range(4)],
+                         [(2022, 1, 1, 1, 0), (2022, 1, 1, 0, 1), (2022, 1, 1, 0, 0), (2021, 12, 1, 1, 1)])
+
+    def test_iter_limit_year(self):
+        masks = to_masks('0 0 1 1 *')
+        self.assertEqual(len(list(engine.iter_next(masks, 2021, 1, 1, 0, 0, limit_year=2030))), 10)
+        self.assertEqual(len(list(engine.iter_prev(masks, 2021, 1, 1, 0, 0, limit_year=2012))), 10)
@@ -0,0 +1,42 @@
+import unittest
+from datetime import datetime
+
+from cron_converter.cron import Cron
+from cron_converter.sub_modules import frequency
+from cron_converter.sub_modules.engine import days_from_civil
+
+
+def to_masks(cron_string):
+    return tuple(part.mask for part in Cron(cron_string).parts)
+
+
+def to_minute(date_time):
+    return days_from_civil(date_time.year, date_time.month, date_time.day) * 1440 \
+        + date_time.hour * 60 + date_time.minute
+
+
+class FrequencyTest(unittest.TestCase):
+
+    def test_count_days(self):
+        first = days_from_civil(2024, 1, 1)
+        self.assertEqual(frequency.count_days(to_masks('0 0 * * 1-5'), first, first + 366), 262)
+        self.assertEqual(frequency.count_days(to_masks('0 0 29 2 *'), first, first + frequency.CYCLE_DAYS * 2), 194)
+        self.assertEqual(frequency.count_days(to_masks('0 0 31 4 *'), first, first + 366), 0)
+        self.assertEqual(frequency.count_days(to_masks('0 0 * * *'), first, first), 0)
+
+    def test_count_minutes(self):
+        masks = to_masks('*/15 9-17 * * 1-5')
+        # From Tuesday 10:20 to Wednesday 09:31: 10:30 to 17:45, then 09:00 to 09:30
+        first, last = to_minute(datetime(2024, 3, 19, 10, 20)), to_minute(datetime(2024, 3, 20, 9, 31))
+        self.assertEqual(frequency.count_minutes(masks, first, last), 30 + 3)
+        self.assertEqual(frequency.count_minutes(masks, last, first), 0)
+
+    def test_interval_minutes(self):
+        self.assertEqual(frequency.interval_minutes(to_masks('*/15 9-17 * * 1-5')), (15, 3 * 1440 - 8 * 60 - 45))
+        self.assertEqual(frequency.interval_minutes(to_masks('0 0 29 2 *')), ((4 * 365 + 1) * 1440, (8 * 365 + 1) * 1440))
+        self.assertEqual(frequency.interval_minutes(to_masks('0 0 1 1 *')), (365 * 1440, 366 * 1440))
+        self.assertIsNone(frequency.interval_minutes(to_masks('0 0 30 2 *')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from datetime import date, datetime
+
+from cron_converter import Cron, CronIndex
+
+
+class CronIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cron_strings = ['* * * * *', '*/15 9-17 * * 1-5', '0 0 * * *', '30 9 19 3 *', '0 12 * * 0']
+        self.index = CronIndex(self.cron_strings)
+
+    def test_match(self):
+        # 2024-03-19 is a Tuesday
+        self.assertEqual(self.index.match(datetime(2024, 3, 19, 9, 30)), [0, 1, 3])
+        self.assertEqual(self.index.match(datetime(2024, 3, 19, 0, 0)), [0, 2])
+        self.assertEqual(self.index.match(datetime(2024, 3, 24, 12, 0)), [0, 4])
+
+    def test_match_date(self):
+        self.assertEqual(self.index.match(date(2024, 3, 19)), [0, 1, 2, 3])
+
+    def test_match_like_validate(self):
+        crons = [Cron(cron_string) for cron_string in self.cron_strings]
+        for minute in range(0, 60 * 24 * 8, 7):
+            date_time = datetime(2024, 3, 18 + minute // 1440, minute // 60 % 24, minute % 60)
+            with self.subTest(date_time=date_time):
+                expected = [cron_id for cron_id, cron in enumerate(crons) if cron.validate(date_time)]
+                self.assertEqual(self.index.match(date_time), expected)
+
+    def test_add_remove(self):
+        cron_id = self.index.add(Cron('30 9 * * *'))
+        self.assertEqual(cron_id, 5)
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.match(datetime(2024, 3, 19, 9, 30)), [0, 1, 3, 5])
+        self.index.remove(1)
+        self.assertNotIn(1, self.index)
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.ids(), [0, 2, 3, 4, 5])
+        self.assertEqual(self.index.match(datetime(2024, 3, 19, 9, 30)), [0, 3, 5])
+        with self.assertRaises(KeyError):
+            self.index.remove(1)
+
+    def test_getitem(self):
+        self.assertEqual(self.index[1].to_string(), '*/15 9-17 * * 1-5')
+        with self.assertRaises(KeyError):
+            self.index[10]
+
+    def test_empty(self):
+        index = CronIndex()
+        self.assertEqual(index.match(datetime(2024, 3, 19, 9, 30)), [])
+        with self.assertRaises(LookupError):
+            index.add(Cron())
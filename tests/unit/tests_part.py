@@ -1,6 +1,8 @@
+import copy
+import pickle
 import unittest
 
-from cron_converter.sub_modules.part import Part
+from cron_converter.sub_modules.part import CronParseError, Part
 from cron_converter.sub_modules.units import units
 
 
@@ -32,6 +34,17 @@ class PartTest(unittest.TestCase):
         part = Part(units[0], {})
         part.values = [2, 5, 8, 11]
         self.assertTrue(part.has(5), "The interval does not contain the specified value")
+        self.assertFalse(part.has(6), "The interval should not contain the specified value")
+        self.assertTrue(8 in part, "The interval does not contain the specified value")
+        self.assertFalse(-1 in part, "The interval should not contain negative values")
+
+    def test_mask(self):
+        part = Part(units[0], {})
+        part.from_string('1,3,2-3')
+        self.assertEqual(part.mask, 0b1110)
+        self.assertEqual(part.to_list(), [1, 2, 3])
+        self.assertEqual(len(part), 3)
+        self.assertEqual((part.min(), part.max()), (1, 3))
 
     def test_to_ranges(self):
         part = Part(units[0], {})
@@ -68,20 +81,131 @@ class PartTest(unittest.TestCase):
     def test_parse_range(self):
         part = Part(units[4], {})
         result = part._parse_range('0')
-        self.assertEqual(result, [0], 'Fail parsing a non range string')
+        self.assertEqual(result, (0, 0), 'Fail parsing a non range string')
         # test SUN to FRI
-        result = part._parse_range('0-5')
-        self.assertEqual(result, [0, 1, 2, 3, 4, 5], 'Fail parsing range')
+        result = part._parse_range('sun-FRI')
+        self.assertEqual(result, (0, 5), 'Fail parsing range')
 
     def test_parse_step(self):
         part = Part(units[4], {})
         self.assertEqual(part._parse_step('5'), 5, 'Fail parsing step')
 
-    def test_apply_interval(self):
+    def test_parse_element(self):
         part = Part(units[4], {})
-        result = part._apply_interval([2, 3, 4, 5, 6], 3)
-        self.assertEqual(result, [2, 5])
+        self.assertEqual(part._parse_element('2-6/3', '2-6/3'), 0b100100)
+        # Sunday as 7 is counted as 0 by the step
+        self.assertEqual(part._parse_element('0-7/2', '0-7/2'), 0b1010101)
+        self.assertEqual(part._parse_element('1-7/2', '1-7/2'), 0b101010)
+        self.assertEqual(part._parse_element('7', '7'), 0b1)
+        part = Part(units[0], {})
+        self.assertEqual(part._parse_element('*/1000000000', '*/1000000000'), 0b1)
 
-    def test_replace_alternatives(self):
+    def test_from_string_names(self):
         part = Part(units[3], {})
-        self.assertEqual(part._replace_alternatives('sep-dec/2,jan-apr/2'), '9-12/2,1-4/2', 'Months as int do not match')
+        part.from_string('sep-dec/2,jan-apr/2')
+        self.assertEqual(part.to_list(), [1, 3, 9, 11], 'Months as int do not match')
+        with self.assertRaises(ValueError):
+            part.from_string('janfeb')
+
+    def test_parse_error(self):
+        part = Part(units[1], {})
+        with self.assertRaises(CronParseError) as error:
+            part.from_string('1,2-30/4')
+        self.assertEqual(str(error.exception), "Value 30 out of range for 'hour'")
+        self.assertEqual((error.exception.text, error.exception.position), ('1,2-30/4', 4))
+        with self.assertRaises(CronParseError) as error:
+            part.from_string('1,2/x')
+        self.assertEqual(str(error.exception), "Invalid interval step value 'x' for 'hour'")
+        self.assertEqual(error.exception.position, 4)
+        copy = pickle.loads(pickle.dumps(error.exception))
+        self.assertEqual((str(copy), copy.text, copy.position), (str(error.exception), '1,2/x', 4))
+
+    def test_lookup_table(self):
+        part = Part(units[1], {})
+        part.values = [1, 3]
+        self.assertEqual(part.lookup_table(), bytes([0, 1, 0, 1] + [0] * 20))
+
+    def test_to_string_memo(self):
+        options = {'output_weekday_names': False}
+        part = Part(units[4], options)
+        part.from_string('1-5')
+        self.assertEqual(part.to_string(), '1-5')
+        options['output_weekday_names'] = True
+        self.assertEqual(part.to_string(), 'MON-FRI')
+        part.values = [0, 6]
+        self.assertEqual(part.to_string(), 'SUN,SAT')
+        options['output_hashes'] = False  # The legacy option is set by its presence
+        part.from_string('*')
+        self.assertEqual(part.to_string(), 'H')
+        other = Part(units[4], {'output_weekday_names': True})
+        other.from_string('1-5')
+        self.assertEqual(other.to_string(), 'MON-FRI')
+        self.assertIn(('weekday', other.mask, False, True), Part.format_cache)
+        # Options changed after formatting, then frozen
+        options = {'output_weekday_names': False}
+        part = Part(units[4], options)
+        part.from_string('1-5')
+        self.assertEqual(part.to_string(), '1-5')
+        options['output_weekday_names'] = True
+        self.assertEqual(part.freeze().to_string(), 'MON-FRI')
+
+    def test_operators(self):
+        part = Part(units[4], {})
+        part.from_string('1-5')
+        other = Part(units[4], {})
+        other.from_string('5-7')
+        self.assertEqual((part | other).to_list(), [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual((part & other).to_list(), [5])
+        self.assertEqual((part - other).to_list(), [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            part - part
+        disjoint = Part(units[4], {})
+        disjoint.from_string('6')
+        with self.assertRaises(ValueError):
+            part & disjoint
+        self.assertTrue((part & other).issubset(part))
+        self.assertFalse(part.issubset(other))
+        self.assertEqual(part.to_list(), [1, 2, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            part | Part(units[3], {})
+        with self.assertRaises(TypeError):
+            part | {1, 2}
+
+    def test_freeze(self):
+        options = {'output_weekday_names': True}
+        part = Part(units[4], options)
+        part.from_string('1-5')
+        self.assertIs(part.freeze(), part)
+        self.assertTrue(part.frozen)
+        with self.assertRaises(AttributeError):
+            part.values = [1]
+        with self.assertRaises(AttributeError):
+            part.from_string('1')
+        with self.assertRaises(AttributeError):
+            part.from_list([1])
+        options['output_weekday_names'] = False
+        self.assertEqual(part.to_string(), 'MON-FRI')
+
+    def test_hash(self):
+        part = Part(units[0], {})
+        part.from_string('*/15')
+        with self.assertRaises(TypeError):
+            hash(part)
+        other = Part(units[0], {'output_hashes': True})
+        other.from_string('0,15,30,45')
+        self.assertEqual(hash(part.freeze()), hash(other.freeze()))
+        hour = Part(units[1], {})
+        hour.from_string('0,15')
+        self.assertEqual(len({part, other, hour.freeze()}), 2)
+
+    def test_pickle_frozen(self):
+        part = Part(units[4], {'output_weekday_names': True})
+        part.from_string('1-5')
+        part.freeze()
+        for other in (pickle.loads(pickle.dumps(part)), copy.deepcopy(part)):
+            self.assertEqual(other, part)
+            self.assertEqual(hash(other), hash(part))
+            self.assertEqual(other.to_string(), 'MON-FRI')
+            self.assertTrue(other.frozen)
+            with self.assertRaises(TypeError):
+                other.options['output_weekday_names'] = False
@@ -1,8 +1,12 @@
 import unittest
 from datetime import date, datetime
 
+from dateutil import tz
+
 from cron_converter.cron import Cron, Seeker
 
+ROME = tz.gettz('Europe/Rome')
+
 
 class SeekerTest(unittest.TestCase):
 
@@ -22,3 +26,102 @@ class SeekerTest(unittest.TestCase):
         seeker.reset()
         self.assertEqual(datetime(2023, 1, 3, 15, 17), seeker.start_time)
         self.assertEqual(datetime(2023, 1, 3, 15, 17), seeker.next())
+
+    def test_take(self):
+        cron = Cron('*/20 23 * * *')
+        seeker = Seeker(cron, datetime(2023, 1, 3, 23, 17, 10))
+        expected = [datetime(2023, 1, 3, 23, 20), datetime(2023, 1, 3, 23, 40), datetime(2023, 1, 4, 23, 0)]
+        self.assertEqual(seeker.take(3), expected)
+        self.assertEqual(seeker.next(), datetime(2023, 1, 4, 23, 20))
+        self.assertEqual(seeker.take(2, reverse=True), [datetime(2023, 1, 4, 23, 0), datetime(2023, 1, 3, 23, 40)])
+        self.assertEqual(seeker.take(0), [])
+
+    def test_engines_repeated_start(self):
+        # 2021-11-07T01:03-05:00 is the second 01:03, after the end of DST
+        start = datetime(2021, 11, 7, 1, 3, fold=1, tzinfo=tz.gettz('America/New_York'))
+        cron = Cron('*/5 * * * *')
+        jump, step = Seeker(cron, start).next(), Seeker(cron, start, engine='step').next()
+        self.assertEqual((jump.isoformat(), jump.fold), ('2021-11-07T01:05:00-04:00', 0))
+        self.assertEqual((step.isoformat(), step.fold), (jump.isoformat(), jump.fold))
+        seeker = Seeker(cron, start)
+        seeker.take(1)
+        self.assertEqual(seeker.date.fold, 0)
+
+    def test_take_as_epoch(self):
+        cron = Cron('0 0 * * *')
+        seeker = Seeker(cron, datetime(1970, 1, 1))
+        self.assertEqual(list(seeker.take(3, as_epoch=True)), [0, 86400, 172800])
+
+    def test_between(self):
+        cron = Cron('0 */6 * * *')
+        seeker = Seeker(cron, datetime(2023, 1, 1))
+        self.assertEqual(seeker.between(datetime(2023, 1, 3, 5, 59, 30), datetime(2023, 1, 4, 6)),
+                         [datetime(2023, 1, 3, 6), datetime(2023, 1, 3, 12), datetime(2023, 1, 3, 18),
+                          datetime(2023, 1, 4, 0)])
+        self.assertEqual(seeker.between(datetime(2023, 1, 3, 6, 0, 1), datetime(2023, 1, 3, 12, 0, 1)),
+                         [datetime(2023, 1, 3, 12)])
+        self.assertEqual(seeker.next(), datetime(2023, 1, 1))
+
+    def test_between_impossible(self):
+        cron = Cron('* * 30 2 *')
+        seeker = Seeker(cron, datetime(2023, 1, 1))
+        self.assertEqual(seeker.between(datetime(2023, 1, 1), datetime(2025, 1, 1)), [])
+
+    def test_on_skipped(self):
+        cron = Cron('30 2 * * *')
+        start = datetime(2024, 3, 30, tzinfo=ROME)
+        expected = {
+            'keep': [datetime(2024, 3, 30, 2, 30), datetime(2024, 3, 31, 2, 30), datetime(2024, 4, 1, 2, 30)],
+            'skip': [datetime(2024, 3, 30, 2, 30), datetime(2024, 4, 1, 2, 30), datetime(2024, 4, 2, 2, 30)],
+            'shift': [datetime(2024, 3, 30, 2, 30), datetime(2024, 3, 31, 3, 0), datetime(2024, 4, 1, 2, 30)],
+        }
+        for on_skipped, dates in expected.items():
+            with self.subTest(on_skipped=on_skipped):
+                seeker = Seeker(cron, start, on_skipped=on_skipped, on_repeated='last')
+                self.assertEqual([date.replace(tzinfo=None) for date in seeker.take(3)], dates)
+
+    def test_on_skipped_shift_once(self):
+        cron = Cron('0,30 2,3 * * *')
+        seeker = Seeker(cron, datetime(2024, 3, 31, tzinfo=ROME), on_skipped='shift')
+        self.assertEqual([date.isoformat() for date in seeker.take(3)],
+                         ['2024-03-31T03:00:00+02:00', '2024-03-31T03:30:00+02:00', '2024-04-01T02:00:00+02:00'])
+
+    def test_on_repeated(self):
+        cron = Cron('30 2 * * *')
+        start = datetime(2024, 10, 27, tzinfo=ROME)
+        expected = {
+            'first': ['2024-10-27T02:30:00+02:00', '2024-10-28T02:30:00+01:00'],
+            'last': ['2024-10-27T02:30:00+01:00', '2024-10-28T02:30:00+01:00'],
+            'both': ['2024-10-27T02:30:00+02:00', '2024-10-27T02:30:00+01:00'],
+        }
+        for on_repeated, dates in expected.items():
+            with self.subTest(on_repeated=on_repeated):
+                seeker = Seeker(cron, start, on_skipped='skip', on_repeated=on_repeated)
+                self.assertEqual([seeker.next().isoformat(), seeker.next().isoformat()], dates)
+
+    def test_policies_next_prev(self):
+        cron = Cron('*/30 2 * * *')
+        seeker = Seeker(cron, datetime(2024, 10, 27, 2, 15, tzinfo=ROME), on_repeated='both')
+        self.assertEqual(seeker.next().isoformat(), '2024-10-27T02:30:00+02:00')
+        self.assertEqual(seeker.next().isoformat(), '2024-10-27T02:00:00+01:00')
+        self.assertEqual(seeker.prev().isoformat(), '2024-10-27T02:30:00+02:00')
+        self.assertEqual(seeker.prev().isoformat(), '2024-10-27T02:00:00+02:00')
+        seeker.reset()
+        self.assertEqual(seeker.prev().isoformat(), '2024-10-27T02:00:00+02:00')
+
+    def test_policies_between(self):
+        cron = Cron('0 * * * *')
+        seeker = Seeker(cron, datetime(2024, 10, 27, tzinfo=ROME), on_repeated='both')
+        start, end = datetime(2024, 10, 27, 1, 0, tzinfo=ROME), datetime(2024, 10, 27, 4, 0, tzinfo=ROME)
+        self.assertEqual(len(seeker.between(start, end)), 4)
+        epochs = list(seeker.between(start, end, as_epoch=True))
+        self.assertEqual(epochs, list(range(epochs[0], epochs[0] + 4 * 3600, 3600)))
+
+    def test_invalid_policies(self):
+        cron = Cron('* * * * *')
+        with self.assertRaises(ValueError):
+            Seeker(cron, datetime(2024, 1, 1), on_skipped='later')
+        with self.assertRaises(ValueError):
+            Seeker(cron, datetime(2024, 1, 1), on_repeated='twice')
+        with self.assertRaises(ValueError):
+            Seeker(cron, datetime(2024, 1, 1), engine='step', on_repeated='both')
@@ -0,0 +1,76 @@
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+from cron_converter import Cron, CronIndex, ScheduleStore, store
+
+SCHEDULES = ['*/15 9-17 * * 1-5', '0 0 29 2 *', '5,35 */2 * * *', '0 12 * JAN-JUN MON', '10-20 3 15 * *',
+             '* * * * *', '59 23 31 12 6', '0 0 1 1 0']
+
+
+class ScheduleStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'schedules.bin')
+        self.store = ScheduleStore.create(self.path, [Cron(SCHEDULES[0])] + SCHEDULES[1:])
+        self.addCleanup(self.store.close)
+
+    def test_records(self):
+        self.assertEqual(len(self.store), 8)
+        self.assertEqual(os.path.getsize(self.path), store.HEADER_SIZE + 8 * 17)
+        self.assertEqual(list(self.store), [Cron(cron_string) for cron_string in SCHEDULES])
+        self.assertTrue(self.store[3].frozen)
+        self.assertEqual(self.store.masks(1), Cron('0 0 29 2 *').to_masks())
+        with self.assertRaises(IndexError):
+            self.store.masks(8)
+
+    def test_match(self):
+        index = CronIndex(SCHEDULES)
+        times = [datetime(2024, 3, 19, 9, 30), datetime(2024, 2, 29, 0, 0), datetime(2024, 12, 31, 23, 59),
+                 datetime(2023, 1, 1, 0, 0), datetime(2024, 3, 18, 12, 0), date(2024, 3, 15), date(2024, 2, 29)]
+        for time in times:
+            with self.subTest(time=time):
+                self.assertEqual(self.store.match(time), index.match(time))
+                with mock.patch.object(store, 'np', None):
+                    self.assertEqual(self.store.match(time), index.match(time))
+        # 2024-02-29T00:00:00Z
+        self.assertEqual(self.store.match(1709164800), [1, 5])
+
+    def test_pickle(self):
+        other = pickle.loads(pickle.dumps(self.store))
+        self.addCleanup(other.close)
+        self.assertEqual(list(other), list(self.store))
+
+    def test_closed(self):
+        self.store.match(datetime(2024, 3, 19, 9, 30))
+        self.store.close()
+        with self.assertRaises(ValueError):
+            self.store.match(datetime(2024, 3, 19, 9, 30))
+        with self.assertRaises(ValueError):
+            self.store[0]
+
+    def test_invalid_file(self):
+        with open(self.path, 'ab') as file:
+            file.write(b'\x00')
+        with self.assertRaises(ValueError):
+            ScheduleStore(self.path)
+        with open(self.path, 'wb') as file:
+            file.write(b'not a store file')
+        with self.assertRaises(ValueError):
+            ScheduleStore(self.path)
+
+    def test_empty(self):
+        with ScheduleStore.create(self.path + '.empty', []) as empty:
+            self.assertEqual(len(empty), 0)
+            self.assertEqual(empty.match(datetime(2024, 3, 19, 9, 30)), [])
+            with mock.patch.object(store, 'np', None):
+                self.assertEqual(empty.match(datetime(2024, 3, 19, 9, 30)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
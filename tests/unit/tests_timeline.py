@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime
+
+from dateutil import tz
+
+from cron_converter import Cron, Timeline
+
+
+class TimelineTest(unittest.TestCase):
+
+    def test_merge(self):
+        timeline = Timeline(datetime(2024, 3, 19, 9, 0))
+        timeline.add('*/20 * * * *', 'report')
+        timeline.add(Cron('30 9 * * *'), 'backup')
+        self.assertEqual(timeline.take(3), [
+            (datetime(2024, 3, 19, 9, 0), 'report'),
+            (datetime(2024, 3, 19, 9, 20), 'report'),
+            (datetime(2024, 3, 19, 9, 30), 'backup'),
+        ])
+
+    def test_same_time(self):
+        timeline = Timeline(datetime(2024, 3, 19, 9, 10))
+        self.assertEqual(timeline.add('0 * * * *'), 0)
+        self.assertEqual(timeline.add('*/30 * * * *'), 1)
+        self.assertEqual(timeline.add('0 * * * *'), 2)
+        self.assertEqual(len(timeline), 3)
+        self.assertEqual([cron_id for _, cron_id in timeline.take(7)], [1, 0, 2, 1, 1, 0, 2])
+
+    def test_reverse(self):
+        timeline = Timeline(datetime(2024, 3, 19, 9, 0), reverse=True)
+        timeline.add('*/20 * * * *', 'report')
+        timeline.add('30 8 * * *', 'backup')
+        self.assertEqual(timeline.take(3), [
+            (datetime(2024, 3, 19, 8, 40), 'report'),
+            (datetime(2024, 3, 19, 8, 30), 'backup'),
+            (datetime(2024, 3, 19, 8, 20), 'report'),
+        ])
+
+    def test_like_seeker(self):
+        start = datetime(2024, 3, 19, 9, 7, 30)
+        cron_strings = ['*/7 * * * *', '5,35 */2 * * *', '*/15 9-17 * * 1-5']
+        timeline = Timeline(start)
+        for cron_string in cron_strings:
+            timeline.add(cron_string, cron_string)
+        times = timeline.take(200)
+        for cron_string in cron_strings:
+            with self.subTest(cron_string=cron_string):
+                expected = Cron(cron_string).schedule(start).take(sum(cron_id == cron_string for _, cron_id in times))
+                self.assertEqual([date for date, cron_id in times if cron_id == cron_string], expected)
+
+    def test_timezones(self):
+        timeline = Timeline(datetime(2024, 3, 19, 0, 30, tzinfo=tz.UTC))
+        timeline.add('0 9 * * *', 'rome', 'Europe/Rome')
+        timeline.add('0 9 * * *', 'tokyo', 'Asia/Tokyo')
+        times = timeline.take(2)
+        self.assertEqual([cron_id for _, cron_id in times], ['rome', 'tokyo'])
+        self.assertEqual(times[0][0].isoformat(), '2024-03-19T09:00:00+01:00')
+        self.assertEqual(times[1][0].isoformat(), '2024-03-20T09:00:00+09:00')
+
+    def test_timezone_errors(self):
+        with self.assertRaises(ValueError):
+            Timeline(datetime(2024, 3, 19, 0, 0)).add('0 9 * * *', timezone_str='Europe/Rome')
+        with self.assertRaises(ValueError):
+            Timeline(datetime(2024, 3, 19, 0, 0, tzinfo=tz.UTC)).add('0 9 * * *', timezone_str='Not/Valid')
+
+    def test_empty(self):
+        self.assertEqual(Timeline(datetime(2024, 3, 19, 0, 0)).take(3), [])
+        with self.assertRaises(LookupError):
+            Timeline().add(Cron())
+
+    def test_dst_order(self):
+        timeline = Timeline(datetime(2024, 10, 27, 0, 0, tzinfo=tz.UTC))
+        timeline.add('*/30 2 * * *', 'rome', 'Europe/Rome', on_repeated='both')
+        timeline.add('45 0 * * *', 'utc', 'UTC')
+        times = timeline.take(5)
+        self.assertEqual([cron_id for _, cron_id in times], ['rome', 'rome', 'utc', 'rome', 'rome'])
+        epochs = [date.timestamp() for date, _ in times]
+        self.assertEqual(epochs, sorted(epochs))
+        with self.assertRaises(ValueError):
+            timeline.add('* * * * *', on_skipped='later')
@@ -0,0 +1,65 @@
+import unittest
+from datetime import datetime
+
+from dateutil import tz
+
+from cron_converter import Cron, timezones
+from cron_converter.sub_modules.zones import get_zone
+
+try:
+    import zoneinfo
+except ImportError:
+    zoneinfo = None
+
+
+class TimezonesTest(unittest.TestCase):
+
+    def tearDown(self):
+        timezones.set_backend('dateutil')
+
+    def test_get_timezone(self):
+        tz_info = timezones.get_timezone('Europe/Rome')
+        self.assertEqual(tz_info, tz.gettz('Europe/Rome'))
+        self.assertIs(timezones.get_timezone('Europe/Rome'), tz_info)
+        with self.assertRaises(ValueError):
+            timezones.get_timezone('Not/Valid')
+
+    def test_cache_hits(self):
+        timezones.cache.clear()
+        for _ in range(3):
+            timezones.get_timezone('Asia/Tokyo')
+        self.assertEqual(timezones.cache.info()[:2], (2, 1))
+
+    def test_preload(self):
+        timezones.cache.clear()
+        timezones.preload(['Europe/Rome', 'America/New_York'], years=[2030])
+        self.assertEqual(len(timezones.cache), 2)
+        self.assertIn(2030, get_zone(timezones.get_timezone('America/New_York'))._years)
+        with self.assertRaises(ValueError):
+            timezones.preload(['Not/Valid'])
+
+    @unittest.skipIf(zoneinfo is None, 'zoneinfo requires Python 3.9+')
+    def test_zoneinfo_backend(self):
+        timezones.set_backend('zoneinfo')
+        self.assertEqual(timezones.get_backend(), 'zoneinfo')
+        self.assertIsInstance(timezones.get_timezone('Europe/Rome'), zoneinfo.ZoneInfo)
+        with self.assertRaises(ValueError):
+            timezones.get_timezone('Not/Valid')
+        schedule = Cron('0 9 * * *').schedule(timezone_str='Asia/Tokyo')
+        self.assertIsInstance(schedule.next().tzinfo, zoneinfo.ZoneInfo)
+        self.assertEqual(schedule.next().utcoffset().total_seconds(), 9 * 3600)
+
+    @unittest.skipIf(zoneinfo is None, 'zoneinfo requires Python 3.9+')
+    def test_zoneinfo_like_dateutil(self):
+        start = datetime(2024, 3, 30)
+        for timezone_str in ('Europe/Rome', 'America/New_York', 'Australia/Lord_Howe'):
+            with self.subTest(timezone_str=timezone_str):
+                expected = Cron('30 */2 * * *').schedule(start.replace(tzinfo=tz.gettz(timezone_str)),
+                                                         on_repeated='both').take(50, as_epoch=True)
+                zoneinfo_start = start.replace(tzinfo=zoneinfo.ZoneInfo(timezone_str))
+                found = Cron('30 */2 * * *').schedule(zoneinfo_start, on_repeated='both').take(50, as_epoch=True)
+                self.assertEqual(found, expected)
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            timezones.set_backend('pytz')
@@ -18,3 +18,16 @@ class UtilsTest(unittest.TestCase):
         for iso_weekday in iso_weekdays:
             cron_weekdays.append(utils.iso_to_cron_weekday(iso_weekday))
         self.assertListEqual(cron_weekdays, [1, 2, 3, 4, 5, 6, 0], "The result has to be a range from 0 to 6")
+
+    def test_values_to_mask(self):
+        self.assertEqual(utils.values_to_mask([0, 2, 3, 3]), 0b1101)
+        self.assertEqual(utils.values_to_mask([]), 0)
+
+    def test_mask_to_values(self):
+        self.assertEqual(utils.mask_to_values(0b1101), (0, 2, 3))
+        self.assertEqual(utils.mask_to_values(0), ())
+
+    def test_iter_bits(self):
+        self.assertEqual(list(utils.iter_bits(0b1101)), [0, 2, 3])
+        self.assertEqual(list(utils.iter_bits(0)), [])
+        self.assertEqual(list(utils.iter_bits(1 << 1000 | 1)), [0, 1000])
@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from cron_converter import vectorized
+from cron_converter.cron import Cron
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class VectorizedTest(unittest.TestCase):
+
+    def test_fire_times(self):
+        cron = Cron('30 9,18 * * 1-5')
+        # 2024-03-15 is a Friday
+        result = vectorized.fire_times(cron, datetime(2024, 3, 15, 9, 0, 30), datetime(2024, 3, 18, 18, 30))
+        self.assertEqual(result.dtype, np.dtype('datetime64[m]'))
+        self.assertEqual(result.tolist(), [datetime(2024, 3, 15, 9, 30), datetime(2024, 3, 15, 18, 30),
+                                           datetime(2024, 3, 18, 9, 30)])
+
+    def test_fire_times_matches_seeker(self):
+        start, end = datetime(2023, 12, 30, 23, 59, 1), datetime(2024, 3, 2, 0, 1)
+        for cron_string in ['*/7 1-4 */3 JAN-JUN/2 MON,THU', '0 0 29 2 *', '58,59 22,23 31 * *', '* * * * *']:
+            with self.subTest(schedule=cron_string):
+                cron = Cron(cron_string)
+                self.assertEqual(vectorized.fire_times(cron, start, end).tolist(),
+                                 cron.schedule(start).between(start, end))
+
+    def test_fire_times_many(self):
+        crons = [Cron('0 0 * * *'), Cron('0 12 1 * *')]
+        first, second = vectorized.fire_times_many(crons, datetime(2024, 1, 1), datetime(2024, 2, 1))
+        self.assertEqual(len(first), 31)
+        self.assertEqual(second.tolist(), [datetime(2024, 1, 1, 12)])
+
+    def test_empty_window(self):
+        result = vectorized.fire_times(Cron('* * * * *'), datetime(2024, 1, 1), datetime(2024, 1, 1))
+        self.assertEqual(len(result), 0)
+
+
+class VectorizedFallbackTest(unittest.TestCase):
+
+    def test_fire_times(self):
+        cron = Cron('0 */12 * * *')
+        with mock.patch.object(vectorized, 'np', None):
+            result = vectorized.fire_times(cron, datetime(2024, 1, 1), datetime(2024, 1, 2))
+        self.assertEqual(result, [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 12)])
+
+    def test_empty_cron(self):
+        with self.assertRaises(LookupError):
+            vectorized.fire_times(Cron(), datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ValidateManyTest(unittest.TestCase):
+
+    def test_datetime64(self):
+        cron = Cron('*/5 9-17/2 * 1-3 1-5')
+        timestamps = np.array(['2024-03-19T15:55', '2024-03-19T15:56', '2024-04-19T15:55'], dtype='datetime64[m]')
+        self.assertEqual(vectorized.validate_many(cron, timestamps).tolist(), [True, False, False])
+        timestamps = np.array(['2024-03-19', '2024-03-24'], dtype='datetime64[D]')
+        self.assertEqual(vectorized.validate_many(cron, timestamps).tolist(), [True, False])
+
+    def test_epoch_seconds(self):
+        cron = Cron('0 0 1 1 *')
+        timestamps = np.array([0, 59, 60, 31536000], dtype='int64')
+        self.assertEqual(vectorized.validate_many(cron, timestamps).tolist(), [True, True, False, True])
+
+    def test_invalid_array(self):
+        with self.assertRaises(TypeError):
+            vectorized.validate_many(Cron('* * * * *'), np.array([1.5]))
+
+
+class ValidateManyFallbackTest(unittest.TestCase):
+
+    def test_validate_many(self):
+        cron = Cron('0 0 1 1 *')
+        with mock.patch.object(vectorized, 'np', None):
+            self.assertEqual(vectorized.validate_many(cron, [0, 60, datetime(2024, 1, 1), datetime(2024, 1, 2)]),
+                             [True, False, True, False])
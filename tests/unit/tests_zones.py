@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from dateutil import tz
+
+from cron_converter.cron import Cron
+from cron_converter.sub_modules import zones
+
+ROME = tz.gettz('Europe/Rome')
+
+
+def epoch(*fields):
+    return int(datetime(*fields, tzinfo=timezone.utc).timestamp())
+
+
+class ZoneTest(unittest.TestCase):
+
+    def setUp(self):
+        self.zone = zones.get_zone(ROME)
+
+    def test_get_zone_cached(self):
+        self.assertIs(zones.get_zone(tz.gettz('Europe/Rome')), self.zone)
+
+    def test_offset(self):
+        self.assertEqual(self.zone.offset(epoch(2024, 1, 1)), 3600)
+        self.assertEqual(self.zone.offset(epoch(2024, 3, 31, 0, 59)), 3600)
+        self.assertEqual(self.zone.offset(epoch(2024, 3, 31, 1, 0)), 7200)
+        self.assertEqual(self.zone.offset(epoch(2024, 10, 27, 1, 0)), 3600)
+        self.assertEqual(self.zone.offset(epoch(2024, 12, 31, 23, 59)), 3600)
+
+    def test_offset_like_tzinfo(self):
+        start = epoch(2023, 12, 25)
+        for seconds in range(start, start + 400 * 86400, 3 * 3607):
+            with self.subTest(seconds=seconds):
+                offset = datetime.fromtimestamp(seconds, ROME).utcoffset()
+                self.assertEqual(self.zone.offset(seconds), int(offset.total_seconds()))
+
+    def test_resolve(self):
+        self.assertEqual(self.zone.resolve((2024, 6, 1, 12, 0)), [zones.ZonedTime(epoch(2024, 6, 1, 10, 0),
+                                                                                   (2024, 6, 1, 12, 0), 0)])
+
+    def test_resolve_skipped(self):
+        fields = (2024, 3, 31, 2, 30)
+        transition = epoch(2024, 3, 31, 1, 0)
+        self.assertEqual(self.zone.resolve(fields, 'keep'), [zones.ZonedTime(transition, fields, 0)])
+        self.assertEqual(self.zone.resolve(fields, 'skip'), [])
+        self.assertEqual(self.zone.resolve(fields, 'shift'), [zones.ZonedTime(transition, (2024, 3, 31, 3, 0), 0)])
+
+    def test_resolve_repeated(self):
+        fields = (2024, 10, 27, 2, 30)
+        first = zones.ZonedTime(epoch(2024, 10, 27, 0, 30), fields, 0)
+        last = zones.ZonedTime(epoch(2024, 10, 27, 1, 30), fields, 1)
+        self.assertEqual(self.zone.resolve(fields, on_repeated='first'), [first])
+        self.assertEqual(self.zone.resolve(fields, on_repeated='last'), [last])
+        self.assertEqual(self.zone.resolve(fields, on_repeated='both'), [first, last])
+
+    def test_iter_zoned(self):
+        masks = Cron('*/30 1-3 * * *').to_masks()
+        key = (epoch(2024, 10, 26, 23, 0), ())
+        times = zones.iter_zoned(masks, self.zone, key, on_repeated='both')
+        expected = [datetime(2024, 10, 27, 1, 0), datetime(2024, 10, 27, 1, 30), datetime(2024, 10, 27, 2, 0),
+                    datetime(2024, 10, 27, 2, 30), datetime(2024, 10, 27, 2, 0, fold=1),
+                    datetime(2024, 10, 27, 2, 30, fold=1), datetime(2024, 10, 27, 3, 0)]
+        found = [self.zone.to_datetime(zoned_time) for zoned_time, _ in zip(times, expected)]
+        self.assertEqual([(date.replace(tzinfo=None), date.fold) for date in found],
+                         [(date, date.fold) for date in expected])
+        epochs = [int(date.timestamp()) for date in found]
+        self.assertEqual(epochs, sorted(epochs))
+
+    def test_iter_zoned_reverse(self):
+        masks = Cron('*/30 1-3 * * *').to_masks()
+        key = (epoch(2024, 10, 27, 2, 0), ())
+        times = zones.iter_zoned(masks, self.zone, key, reverse=True, on_repeated='last')
+        found = [self.zone.to_datetime(zoned_time) for zoned_time, _ in zip(times, range(4))]
+        self.assertEqual([(date.replace(tzinfo=None), date.fold) for date in found],
+                         [(datetime(2024, 10, 27, 2, 30), 1), (datetime(2024, 10, 27, 2, 0), 1),
+                          (datetime(2024, 10, 27, 1, 30), 0), (datetime(2024, 10, 27, 1, 0), 0)])
+
+    def test_fixed_offset(self):
+        zone = zones.get_zone(tz.tzoffset(None, -5 * 3600))
+        self.assertEqual(zone.resolve((2024, 3, 31, 2, 30), 'skip'),
+                         [zones.ZonedTime(epoch(2024, 3, 31, 2, 30) + 5 * 3600, (2024, 3, 31, 2, 30), 0)])
+
+    def test_half_hour_transition(self):
+        zone = zones.get_zone(tz.gettz('Australia/Lord_Howe'))
+        # Clocks go back from 02:00 to 01:30 on 2024-04-07
+        self.assertEqual(len(zone.resolve((2024, 4, 7, 1, 45), on_repeated='both')), 2)
+        self.assertEqual(len(zone.resolve((2024, 4, 7, 2, 0), on_repeated='both')), 1)
+        delta = zone.resolve((2024, 4, 7, 1, 45), on_repeated='both')
+        self.assertEqual(delta[1].epoch - delta[0].epoch, int(timedelta(minutes=30).total_seconds()))